@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""Benchmark the extension hot loop, schema definition and packaging.
+
+Runs offline against the ``zelos_sdk`` stub in ``stub_sdk.py``, writes results
+to JSON and optionally fails when a metric regresses against a baseline.
+"""
+
+import argparse
+import importlib
+import json
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from array import array
+from pathlib import Path
+from typing import Any
+
+import stub_sdk
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_BASELINE = PROJECT_ROOT / "benchmarks" / "baseline.json"
+DEFAULT_OUTPUT = PROJECT_ROOT / ".artifacts" / "benchmarks.json"
+
+# Scheduled intervals (seconds) to run the monitor loop at
+INTERVALS = (0.01, 0.002, 0.001)
+
+# Metrics compared against the baseline and whether larger is better. Tail latency
+# and jitter are reported but too noisy on shared CI runners to gate on.
+HIGHER_IS_BETTER = {
+    "samples_per_sec": True,
+    "rate_ratio": True,
+    "latency_p50_us": False,
+    "mean_us": False,
+    "seconds": False,
+}
+
+
+def load_monitor_class() -> type:
+    """Import ``SensorMonitor`` with the SDK stub installed.
+
+    :return: The SensorMonitor class
+    """
+    stub_sdk.install()
+    sys.path.insert(0, str(PROJECT_ROOT))
+    return importlib.import_module("{{cookiecutter.project_slug}}.extension").SensorMonitor
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of pre-sorted values.
+
+    :param sorted_values: Values in ascending order
+    :param fraction: Percentile as a fraction (0.0 to 1.0)
+    :return: Percentile value
+    """
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+
+def bench_loop(monitor_class: type, config: dict[str, Any], duration: float) -> dict[str, float]:
+    """Run ``SensorMonitor.run`` for ``duration`` seconds and time every step.
+
+    :param monitor_class: SensorMonitor class
+    :param config: Monitor configuration
+    :param duration: Seconds to run
+    :return: Throughput, latency percentile and jitter metrics
+    """
+    monitor = monitor_class(config)
+    starts = array("d")
+    latencies = array("d")
+    step = monitor.step
+    clock = time.perf_counter
+
+    def timed_step() -> None:
+        start = clock()
+        step()
+        starts.append(start)
+        latencies.append(clock() - start)
+
+    monitor.step = timed_step
+    monitor.start()
+    timer = threading.Timer(duration, monitor.stop)
+    timer.start()
+    began = clock()
+    monitor.run()
+    elapsed = clock() - began
+    timer.cancel()
+
+    period = config.get("interval", 0.1) * config.get("batch_size", 1)
+    samples = len(latencies) * config.get("batch_size", 1)
+    periods = [b - a for a, b in zip(starts, starts[1:], strict=False)]
+    sorted_latencies = sorted(latencies)
+    return {
+        "samples_per_sec": samples / elapsed,
+        "rate_ratio": (len(latencies) * period) / elapsed,
+        "latency_p50_us": percentile(sorted_latencies, 0.50) * 1e6,
+        "latency_p99_us": percentile(sorted_latencies, 0.99) * 1e6,
+        "jitter_us": statistics.pstdev(periods) * 1e6 if len(periods) > 1 else 0.0,
+        "missed_deadlines": monitor.scheduler.missed,
+    }
+
+
+def bench_max_throughput(monitor_class: type, config: dict[str, Any], duration: float) -> dict:
+    """Call ``SensorMonitor.step`` back-to-back to find the throughput ceiling.
+
+    :param monitor_class: SensorMonitor class
+    :param config: Monitor configuration
+    :param duration: Seconds to run
+    :return: Throughput and per-step cost metrics
+    """
+    monitor = monitor_class(config)
+    steps = 0
+    clock = time.perf_counter
+    began = clock()
+    deadline = began + duration
+    while clock() < deadline:
+        monitor.step()
+        steps += 1
+    elapsed = clock() - began
+    return {
+        "samples_per_sec": steps * config.get("batch_size", 1) / elapsed,
+        "mean_us": elapsed / steps * 1e6,
+    }
+
+
+def bench_define_schema(monitor_class: type, repeat: int = 1000) -> dict[str, float]:
+    """Time ``SensorMonitor._define_schema`` on fresh trace sources.
+
+    :param monitor_class: SensorMonitor class
+    :param repeat: Number of schema definitions
+    :return: Mean cost in microseconds
+    """
+    monitor = monitor_class({})
+    total = 0.0
+    for _ in range(repeat):
+        monitor.source = stub_sdk.trace_source("bench")
+        start = time.perf_counter()
+        monitor._define_schema()
+        total += time.perf_counter() - start
+    return {"mean_us": total / repeat * 1e6}
+
+
+def bench_package() -> dict[str, float]:
+    """Time ``scripts/package_extension.py`` on a scratch copy of the project.
+
+    :return: Wall time in seconds and archive size in bytes
+    """
+    ignore = shutil.ignore_patterns(".*", "__pycache__", "*.tar.gz")
+    with tempfile.TemporaryDirectory() as tmp:
+        project = Path(tmp) / PROJECT_ROOT.name
+        shutil.copytree(PROJECT_ROOT, project, ignore=ignore)
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "scripts/package_extension.py"],
+            cwd=project,
+            check=True,
+            capture_output=True,
+        )
+        seconds = time.perf_counter() - start
+        archive = next(project.glob("*.tar.gz"))
+        return {"seconds": seconds, "archive_bytes": archive.stat().st_size}
+
+
+def run_benchmarks(duration: float) -> dict[str, dict[str, float]]:
+    """Run every benchmark.
+
+    :param duration: Seconds to run each loop benchmark
+    :return: Metrics keyed by benchmark name
+    """
+    monitor_class = load_monitor_class()
+    results: dict[str, dict[str, float]] = {}
+
+    for interval in INTERVALS:
+        for batch_size in (1, 10):
+            name = f"loop[interval={interval},batch={batch_size}]"
+            config = {"interval": interval, "batch_size": batch_size}
+            results[name] = bench_loop(monitor_class, config, duration)
+            print(f"  {name}: {results[name]['samples_per_sec']:.0f} samples/s")
+
+    for batch_size in (1, 100):
+        name = f"max_throughput[batch={batch_size}]"
+        results[name] = bench_max_throughput(monitor_class, {"batch_size": batch_size}, duration)
+        print(f"  {name}: {results[name]['samples_per_sec']:.0f} samples/s")
+
+    results["define_schema"] = bench_define_schema(monitor_class)
+    print(f"  define_schema: {results['define_schema']['mean_us']:.1f} us")
+
+    results["package"] = bench_package()
+    print(f"  package: {results['package']['seconds']:.2f} s")
+    return results
+
+
+def compare(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    tolerance: float,
+) -> list[str]:
+    """Find metrics that regressed by more than ``tolerance`` against the baseline.
+
+    :param results: Current metrics keyed by benchmark name
+    :param baseline: Baseline metrics keyed by benchmark name
+    :param tolerance: Allowed relative regression (0.2 = 20%)
+    :return: Human-readable regression descriptions
+    """
+    regressions = []
+    for name, metrics in results.items():
+        for metric, value in metrics.items():
+            if metric not in HIGHER_IS_BETTER or metric not in baseline.get(name, {}):
+                continue
+            reference = baseline[name][metric]
+            if reference == 0:
+                continue
+            change = (value - reference) / abs(reference)
+            if not HIGHER_IS_BETTER[metric]:
+                change = -change
+            if change < -tolerance:
+                regressions.append(
+                    f"{name} {metric}: {value:.3g} vs baseline {reference:.3g} ({change:+.0%})"
+                )
+    return regressions
+
+
+def main() -> None:
+    """Run benchmarks, write JSON results and compare against a baseline."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--duration", type=float, default=1.0, help="Seconds per loop benchmark")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="Results JSON path")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="Baseline JSON")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.2, help="Allowed relative regression (0.2 = 20%%)"
+    )
+    parser.add_argument(
+        "--save-baseline", action="store_true", help="Write results as the new baseline"
+    )
+    args = parser.parse_args()
+
+    print("Running benchmarks...")
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.time(),
+        "results": run_benchmarks(args.duration),
+    }
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2) + "\n")
+    print(f"\n✓ Results written to {args.output}")
+
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"✓ Baseline saved to {args.baseline}")
+        return
+
+    if not args.baseline.exists():
+        # Baselines depend on the machine, so none is committed; without one nothing is compared
+        print(
+            f"\n⚠️  No baseline at {args.baseline}, regressions were NOT checked\n"
+            "   Record one on this machine with --save-baseline before changing the hot loop"
+        )
+        return
+
+    baseline = json.loads(args.baseline.read_text())["results"]
+    regressions = compare(report["results"], baseline, args.tolerance)
+    if regressions:
+        print(f"\n❌ {len(regressions)} regression(s) against {args.baseline}:")
+        for regression in regressions:
+            print(f"  - {regression}")
+        sys.exit(1)
+    print(f"✓ No regressions against {args.baseline} (tolerance {args.tolerance:.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Minimal offline stand-in for the parts of ``zelos_sdk`` the extension uses.
+
+Installing the stub replaces ``zelos_sdk`` in ``sys.modules`` so benchmarks run
+without an agent and measure the extension's own overhead rather than the
+transport. Trace sources are the in-process fake from tests/fakes.py (the same
+one the ``fake_sdk`` test fixture uses), caching logged values like
+``TraceSourceCacheLast`` does.
+"""
+
+import sys
+import types
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tests"))
+
+from fakes import FakeTraceSource  # noqa: E402
+
+
+class DataType:
+    """Trace field data types (names only)."""
+
+    Float32 = "Float32"
+    Float64 = "Float64"
+    Int8 = "Int8"
+    Int16 = "Int16"
+    Int32 = "Int32"
+    Int64 = "Int64"
+    UInt8 = "UInt8"
+    UInt16 = "UInt16"
+    UInt32 = "UInt32"
+    UInt64 = "UInt64"
+    Boolean = "Boolean"
+    String = "String"
+
+
+class TraceEventFieldMetadata:
+    """Trace field definition."""
+
+    def __init__(self, name: str, data_type: str, unit: str | None = None) -> None:
+        self.name = name
+        self.data_type = data_type
+        self.unit = unit
+
+
+def trace_source(name: str) -> FakeTraceSource:
+    """``zelos_sdk.TraceSourceCacheLast`` stand-in that keeps only the last logged values.
+
+    :param name: Source name
+    :return: Shared test fake with no rows recorded, so logging allocates nothing
+    """
+    return FakeTraceSource(name, capacity=0)
+
+
+class _ActionDecorator:
+    """``zelos_sdk.action`` stand-in: every decorator returns the function unchanged."""
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Callable[[Callable], Callable]:
+        return lambda func: func
+
+    def __getattr__(self, name: str) -> Callable[..., Callable[[Callable], Callable]]:
+        return self.__call__
+
+
+class _ActionsRegistry:
+    """``zelos_sdk.actions_registry`` stand-in that remembers registered objects."""
+
+    def __init__(self) -> None:
+        self.registered: list[Any] = []
+
+    def register(self, obj: Any) -> None:
+        self.registered.append(obj)
+
+
+def install() -> types.ModuleType:
+    """Install the stub as ``zelos_sdk`` (idempotent).
+
+    :return: The stub module
+    """
+    existing = sys.modules.get("zelos_sdk")
+    if existing is not None and getattr(existing, "__stub__", False):
+        return existing
+
+    module = types.ModuleType("zelos_sdk")
+    module.__stub__ = True
+    module.DataType = DataType
+    module.TraceEventFieldMetadata = TraceEventFieldMetadata
+    module.TraceSourceCacheLast = trace_source
+    module.action = _ActionDecorator()
+    module.actions_registry = _ActionsRegistry()
+    module.init = lambda *args, **kwargs: None
+    sys.modules["zelos_sdk"] = module
+    return module
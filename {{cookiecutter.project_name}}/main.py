@@ -1,53 +1,269 @@
 #!/usr/bin/env python3
 """{{cookiecutter.project_description}}"""
 
+import argparse
+import atexit
+import inspect
 import logging
+import re
 import signal
+import sys
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
 from types import FrameType
+from typing import TYPE_CHECKING, Any
 
-import zelos_sdk
-from zelos_sdk.extensions import load_config
-from zelos_sdk.hooks.logging import TraceLoggingHandler
+# Heavy imports (zelos_sdk, pyarrow, the monitors) happen inside create_app(), so
+# importing this module from tests or tools is cheap and has no side effects
+if TYPE_CHECKING:
+    from {{cookiecutter.project_slug}}.async_monitor import AsyncSensorMonitor
+    from {{cookiecutter.project_slug}}.extension import SensorMonitor
+    from {{cookiecutter.project_slug}}.schema_monitor import SchemaMonitor
+    from {{cookiecutter.project_slug}}.supervisor import ProcessSupervisor
 
-from {{cookiecutter.project_slug}}.extension import SensorMonitor
+    Monitor = SensorMonitor | SchemaMonitor | AsyncSensorMonitor | ProcessSupervisor
 
-# Configure basic logging before SDK initialization
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Initialize SDK
-zelos_sdk.init(name="{{cookiecutter.project_slug}}", actions=True)
+# Offline bundles (package_extension.py --offline) ship their locked dependencies here
+WHEELHOUSE = Path(__file__).parent / "wheels"
 
-# Add trace logging handler to send logs to Zelos
-handler = TraceLoggingHandler("{{cookiecutter.project_slug}}_logger")
-logging.getLogger().addHandler(handler)
 
-# Load configuration from config.json (with schema defaults applied)
-config = load_config()
+class StartupProfile:
+    """Wall time spent in each startup phase."""
 
-# Create sensor monitor
-monitor = SensorMonitor(config)
+    def __init__(self) -> None:
+        """Initialize an empty profile."""
+        self.phases: dict[str, float] = {}
 
-# Register interactive actions for the Zelos App
-zelos_sdk.actions_registry.register(monitor)
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time a startup phase.
 
+        :param name: Phase name
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - start
 
-def shutdown_handler(signum: int, frame: FrameType | None) -> None:
-    """Handle graceful shutdown on SIGTERM or SIGINT.
+    def report(self) -> str:
+        """Format the phases as a table.
 
-    :param signum: Signal number (SIGTERM=15, SIGINT=2)
-    :param frame: Current stack frame
+        :return: One line per phase plus the total, in milliseconds
+        """
+        lines = ["Startup profile (ms):"]
+        lines += [f"  {name:<18}{seconds * 1e3:9.1f}" for name, seconds in self.phases.items()]
+        lines.append(f"  {'total':<18}{sum(self.phases.values()) * 1e3:9.1f}")
+        return "\n".join(lines)
+
+
+def install_bundled_wheels(wheelhouse: Path = WHEELHOUSE) -> bool:
+    """Install the locked dependencies from a bundled wheelhouse if any are missing.
+
+    Nothing happens without a wheelhouse or when every pinned version is
+    installed, so this costs a few metadata lookups on a normal start. Pins
+    with an environment marker only count as missing when another version is
+    installed. Installing never reaches the network; if it fails, startup
+    continues with the packages that are installed.
+
+    :param wheelhouse: Directory with the wheels and their requirements.txt
+    :return: True if wheels were installed
     """
-    logger.info("Shutting down...")
-    monitor.stop()
+    requirements = wheelhouse / "requirements.txt"
+    if not requirements.exists():
+        return False
 
+    from importlib import metadata
 
-# Register signal handlers for graceful shutdown
-signal.signal(signal.SIGTERM, shutdown_handler)
-signal.signal(signal.SIGINT, shutdown_handler)
+    missing = []
+    for line in requirements.read_text().splitlines():
+        match = re.match(r"\s*([A-Za-z0-9][A-Za-z0-9._-]*)\s*==\s*([^\s;\\]+)(\s*;)?", line)
+        if match is None:
+            continue
+        name, version, marker = match.groups()
+        try:
+            installed = metadata.version(name)
+        except metadata.PackageNotFoundError:
+            installed = None
+        if installed != version and (installed is not None or marker is None):
+            missing.append(f"{name}=={version}")
+    if not missing:
+        return False
+
+    import shutil
+    import subprocess
+
+    uv = shutil.which("uv")
+    installer = (
+        [uv, "pip", "install", "--python", sys.executable]
+        if uv
+        else [sys.executable, "-m", "pip", "install"]
+    )
+    logger.info(f"Installing {len(missing)} bundled wheels: {', '.join(missing)}")
+    try:
+        subprocess.run(
+            [*installer, "--no-index", "--find-links", str(wheelhouse), "-r", str(requirements)],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+    except (OSError, subprocess.CalledProcessError) as e:
+        detail = getattr(e, "stderr", None) or e
+        logger.warning(f"Installing bundled wheels failed, continuing without them: {detail}")
+        return False
+    return True
+
+
+def create_app(
+    config: dict[str, Any] | None = None, profile: StartupProfile | None = None
+) -> "Monitor":
+    """Initialize the SDK, load config, create the monitor and register its actions.
+
+    Only the monitor for the configured mode is imported. When the config is
+    loaded from config.json, the file is watched and changes are applied to
+    the running monitor (see ``config_reload``).
+
+    :param config: Configuration (loaded from config.json when None)
+    :param profile: Optional profile recording the time of each startup phase
+    :return: The monitor, ready to start
+    """
+    profile = profile or StartupProfile()
+
+    with profile.phase("import"):
+        import zelos_sdk
+        from zelos_sdk.extensions import load_config
+        from zelos_sdk.hooks.logging import TraceLoggingHandler
+
+    with profile.phase("init"):
+        # Initialize SDK
+        zelos_sdk.init(name="{{cookiecutter.project_slug}}", actions=True)
+
+    with profile.phase("config"):
+        # Load configuration from config.json (with schema defaults applied)
+        from_file = config is None
+        if config is None:
+            config = load_config()
+
+    with profile.phase("logging"):
+        from {{cookiecutter.project_slug}}.utils.log_pipeline import LogPipeline
+
+        # Send logs to Zelos from a background thread, batched and rate limited,
+        # so logging never blocks the sampling loop
+        handler = TraceLoggingHandler("{{cookiecutter.project_slug}}_logger")
+        pipeline = LogPipeline.from_config(handler, config.get("logging", {}))
+        pipeline.start()
+        atexit.register(pipeline.stop)
+
+    # Create sensor monitor: async mode hosts many sensors on one event loop,
+    # multiprocess mode shards them across worker processes, and configured
+    # events replace the built-in schema in sync mode
+    mode = config.get("mode")
+    with profile.phase("monitor"):
+        if mode == "multiprocess":
+            from {{cookiecutter.project_slug}}.supervisor import ProcessSupervisor, read_grace_seconds
+
+            grace_seconds = read_grace_seconds(Path(__file__).parent / "extension.toml")
+            monitor: Monitor = ProcessSupervisor(config, grace_seconds=grace_seconds)
+        elif mode == "async":
+            from {{cookiecutter.project_slug}}.async_monitor import AsyncSensorMonitor
+
+            monitor = AsyncSensorMonitor(config)
+        elif config.get("events"):
+            from {{cookiecutter.project_slug}}.schema_monitor import SchemaMonitor
+
+            monitor = SchemaMonitor(config)
+        else:
+            from {{cookiecutter.project_slug}}.extension import SensorMonitor
+
+            monitor = SensorMonitor(config)
+
+    # Schema definition runs inside monitor construction; report it separately
+    sensors = getattr(monitor, "sensors", None) or {"": monitor}
+    schema_seconds = sum(getattr(sensor, "schema_seconds", 0.0) for sensor in sensors.values())
+    profile.phases["monitor"] -= schema_seconds
+    profile.phases["define_schema"] = schema_seconds
+
+    with profile.phase("register_actions"):
+        # Register interactive actions for the Zelos App
+        zelos_sdk.actions_registry.register(monitor)
+
+    with profile.phase("gc"):
+        from {{cookiecutter.project_slug}}.utils.memory import tune_gc
+
+        # Startup is done: optionally freeze its objects out of garbage collection
+        tune_gc(config.get("gc", {}))
+
+    reload = config.get("config_reload", {})
+    if from_file and reload.get("enabled", True):
+        from {{cookiecutter.project_slug}}.utils.config import ConfigWatcher, config_path
+
+        # Apply edits to config.json while running, without losing trace source state
+        watcher = ConfigWatcher(
+            config_path(), load_config, monitor.apply_config, reload.get("poll_interval", 1.0)
+        )
+        watcher.start()
+        atexit.register(watcher.stop)
+
+    return monitor
+
+
+def run(monitor: "Monitor") -> None:
+    """Run the monitor until SIGTERM or SIGINT.
+
+    :param monitor: Monitor from :func:`create_app`
+    """
+
+    def shutdown_handler(signum: int, frame: FrameType | None) -> None:
+        """Handle graceful shutdown on SIGTERM or SIGINT.
+
+        :param signum: Signal number (SIGTERM=15, SIGINT=2)
+        :param frame: Current stack frame
+        """
+        logger.info("Shutting down...")
+        monitor.stop()
+
+    # Register signal handlers for graceful shutdown
+    signal.signal(signal.SIGTERM, shutdown_handler)
+    signal.signal(signal.SIGINT, shutdown_handler)
 
-# Run
-if __name__ == "__main__":
     logger.info("Starting {{cookiecutter.project_name}}")
     monitor.start()
-    monitor.run()
+    if inspect.iscoroutinefunction(monitor.run):
+        import asyncio
+
+        asyncio.run(monitor.run())
+    else:
+        monitor.run()
+
+
+def main() -> None:
+    """Parse arguments, then create and run the app."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="Report the time spent in each startup phase and exit",
+    )
+    args, _ = parser.parse_known_args()
+
+    # Configure basic logging before SDK initialization
+    logging.basicConfig(level=logging.INFO)
+
+    # Offline bundles install their own dependencies on first start
+    install_bundled_wheels()
+
+    profile = StartupProfile()
+    monitor = create_app(profile=profile)
+    if args.profile_startup:
+        print(profile.report())
+        return
+    run(monitor)
+
+
+# Setup lives in main() because worker processes (multiprocess mode) re-import this module
+if __name__ == "__main__":
+    main()
@@ -1,24 +1,89 @@
 #!/usr/bin/env python3
-"""Package the Zelos extension into a tar.gz archive."""
+"""Package the Zelos extension into a tar.gz archive.
 
+Archives are reproducible: members are sorted and their mtimes, owners and
+permissions normalized, so identical inputs produce byte-identical archives.
+A build cache records the size, mtime and SHA-256 of every packaged file and
+skips the build entirely when nothing changed since the last one.
+
+Inputs are pre-scanned (total size and largest files) before compressing,
+the compressed size is checked while the archive is written so an oversized
+package fails early, and per-file stats are written as JSON for CI.
+
+With ``--offline`` the archive also carries a wheelhouse built from uv.lock
+(``wheels/``) and bytecode precompiled for the runtime's Python version, so
+the extension installs and starts without network access or a compile step.
+
+Package code is checked against the static import graph of ``runtime.entry``:
+modules nothing imports and package data files no reachable module names
+are reported, and excluded with ``--prune``.
+"""
+
+import argparse
+import ast
+import gzip
+import hashlib
+import importlib.util
+import io
+import json
+import os
+import re
+import shutil
+import subprocess
 import sys
 import tarfile
+import time
+from bisect import bisect_left
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from fnmatch import fnmatch
 from pathlib import Path
+from typing import Any, BinaryIO
 
 try:
     import tomllib  # Python 3.11+
 except ModuleNotFoundError:
     import tomli as tomllib  # type: ignore
 
+CACHE_PATH = Path(".artifacts") / "package-cache.json"
+STATS_PATH = Path(".artifacts") / "package-stats.json"
+
+# Staging area for the wheelhouse and bytecode of offline bundles
+OFFLINE_DIR = Path(".artifacts") / "offline"
+
+# Archive directory holding the wheelhouse of an offline bundle
+WHEELHOUSE_DIR = "wheels"
+
+# Zelos marketplace archive size limit
+MAX_SIZE_MB = 500
+
+# Calls that import the module named by their first argument
+DYNAMIC_IMPORTS = {"import_module", "__import__"}
+
+# Number of largest inputs listed by the pre-scan
+TOP_INPUTS = 5
+
+# Bump when the archive layout changes, to invalidate existing caches
+CACHE_VERSION = 3
+
+# Uncompressed bytes per gzip member when compressing in parallel
+CHUNK_SIZE = 1 << 20
 
-def filter_archive_files(tarinfo: tarfile.TarInfo) -> tarfile.TarInfo | None:
+
+def filter_archive_files(
+    tarinfo: tarfile.TarInfo, bytecode_tag: str | None = None
+) -> tarfile.TarInfo | None:
     """Filter out unwanted files from archive per Zelos security requirements.
 
     :param tarinfo: Tar member info
+    :param bytecode_tag: Cache tag (e.g. ``cpython-311``) of precompiled bytecode
+        to keep; None drops all Python cache files
     :return: None if should be excluded, tarinfo otherwise
     """
-    # Skip Python cache files
-    if "__pycache__" in tarinfo.name or tarinfo.name.endswith((".pyc", ".pyo")):
+    # Skip Python cache files, except precompiled bytecode for the target runtime
+    is_cache = "__pycache__" in tarinfo.name or tarinfo.name.endswith((".pyc", ".pyo"))
+    if is_cache and (bytecode_tag is None or not is_bytecode_member(tarinfo, bytecode_tag)):
         return None
 
     # Skip hidden files/directories (security requirement)
@@ -37,8 +102,842 @@ def filter_archive_files(tarinfo: tarfile.TarInfo) -> tarfile.TarInfo | None:
     return tarinfo
 
 
+def is_bytecode_member(tarinfo: tarfile.TarInfo, bytecode_tag: str) -> bool:
+    """Check that a member is a ``__pycache__`` directory or bytecode for ``bytecode_tag``.
+
+    :param tarinfo: Tar member info
+    :param bytecode_tag: Cache tag of the target runtime
+    :return: True for ``__pycache__`` directories and ``__pycache__/<module>.<tag>.pyc`` files
+    """
+    parts = Path(tarinfo.name).parts
+    if tarinfo.isdir():
+        return parts[-1] == "__pycache__" and "__pycache__" not in parts[:-1]
+    return (
+        len(parts) >= 2
+        and parts[-2] == "__pycache__"
+        and "__pycache__" not in parts[:-2]
+        and parts[-1].endswith(f".{bytecode_tag}.pyc")
+    )
+
+
+def normalize(tarinfo: tarfile.TarInfo, mtime: int) -> tarfile.TarInfo:
+    """Strip build-machine details from a member so archives are reproducible.
+
+    :param tarinfo: Tar member info
+    :param mtime: Fixed modification time for every member
+    :return: The normalized tarinfo
+    """
+    tarinfo.mtime = mtime
+    tarinfo.uid = tarinfo.gid = 0
+    tarinfo.uname = tarinfo.gname = ""
+    tarinfo.mode = 0o755 if tarinfo.isdir() or tarinfo.mode & 0o111 else 0o644
+    return tarinfo
+
+
+def scan_members(files: list[str], mtime: int) -> list[tarfile.TarInfo]:
+    """Expand top-level files and directories into sorted, filtered archive members.
+
+    :param files: Top-level paths to package, relative to the project root
+    :param mtime: Fixed modification time for every member
+    :return: Normalized members in archive order (arcname equals the source path)
+    """
+    scanner = tarfile.TarFile(fileobj=io.BytesIO(), mode="w")
+    members: list[tarfile.TarInfo] = []
+
+    def visit(name: str) -> None:
+        tarinfo = filter_archive_files(scanner.gettarinfo(name, arcname=name))
+        if tarinfo is None:
+            return
+        members.append(normalize(tarinfo, mtime))
+        if tarinfo.isdir():
+            for child in sorted(path.name for path in Path(name).iterdir()):
+                visit(f"{name}/{child}")
+
+    for name in sorted(set(files)):
+        visit(name)
+    return members
+
+
+def scan_staged(
+    root: Path,
+    prefix: str,
+    mtime: int,
+    existing: set[str],
+    include: Callable[[str], bool],
+    bytecode_tag: str | None = None,
+) -> tuple[list[tarfile.TarInfo], dict[str, Path]]:
+    """Scan a staging directory into archive members stored under ``prefix``.
+
+    :param root: Staging directory
+    :param prefix: Archive directory for the staged files ("" for the archive root)
+    :param mtime: Fixed modification time for every member
+    :param existing: Names of members already in the archive (their directories aren't repeated)
+    :param include: Whether to package a staged file, by archive name
+    :param bytecode_tag: Cache tag of bytecode to keep (see :func:`filter_archive_files`)
+    :return: Normalized members, and the path each staged member is read from
+    """
+    scanner = tarfile.TarFile(fileobj=io.BytesIO(), mode="w")
+    members: list[tarfile.TarInfo] = []
+    sources: dict[str, Path] = {}
+    paths = [root, *sorted(root.rglob("*"))] if prefix else sorted(root.rglob("*"))
+    for path in paths:
+        name = Path(prefix, path.relative_to(root)).as_posix()
+        if name in existing or (path.is_file() and not include(name)):
+            continue
+        if path.is_dir() and not any(include(f"{name}/{child}") for child in _files_below(path)):
+            continue
+        tarinfo = filter_archive_files(scanner.gettarinfo(path, arcname=name), bytecode_tag)
+        if tarinfo is None:
+            continue
+        members.append(normalize(tarinfo, mtime))
+        sources[name] = path
+    return members, sources
+
+
+def _files_below(path: Path) -> list[str]:
+    """Paths of the files below a directory, relative to it."""
+    return [child.relative_to(path).as_posix() for child in path.rglob("*") if child.is_file()]
+
+
+def read_pins(requirements: Path) -> list[tuple[str, str]]:
+    """Read the pinned ``name==version`` requirements of an exported lock file.
+
+    :param requirements: requirements.txt exported from uv.lock
+    :return: (normalized name, version) pairs
+    """
+    pins = []
+    for line in requirements.read_text().splitlines():
+        match = re.match(r"\s*([A-Za-z0-9][A-Za-z0-9._-]*)\s*==\s*([^\s;\\]+)", line)
+        if match:
+            pins.append((re.sub(r"[-_.]+", "_", match[1]).lower(), match[2]))
+    return pins
+
+
+class OfflineBundleError(Exception):
+    """Raised when the wheelhouse or bytecode of an offline bundle can't be built."""
+
+
+def run_tool(command: list[str]) -> str:
+    """Run a build tool.
+
+    :param command: Command line
+    :return: Standard output
+    :raises OfflineBundleError: If the tool is missing or fails
+    """
+    try:
+        result = subprocess.run(command, check=True, capture_output=True, text=True)
+    except OSError as e:
+        raise OfflineBundleError(f"Can't run {command[0]}: {e}") from e
+    except subprocess.CalledProcessError as e:
+        raise OfflineBundleError(f"{' '.join(command[:3])} failed:\n{e.stderr.strip()}") from e
+    return result.stdout
+
+
+def build_wheelhouse(dest: Path, python_version: str, platforms: list[str]) -> None:
+    """Download a wheel for every locked dependency into ``dest``.
+
+    uv.lock is exported (with hashes) to ``dest/requirements.txt``, then pip
+    downloads binary wheels for the target Python and platforms without
+    resolving again, verifying every hash. Wheels already in ``dest`` are
+    reused and wheels no longer locked are removed.
+
+    :param dest: Wheelhouse directory
+    :param python_version: Target Python version (e.g. ``3.11``)
+    :param platforms: Target pip platform tags (e.g. ``manylinux2014_aarch64``); empty
+        for the build machine's platform
+    :raises OfflineBundleError: If uv or pip is missing or a download fails
+    """
+    uv = shutil.which("uv")
+    if uv is None:
+        raise OfflineBundleError("uv is needed to export uv.lock (or pass --wheelhouse)")
+    dest.mkdir(parents=True, exist_ok=True)
+    requirements = dest / "requirements.txt"
+    run_tool(
+        [
+            uv,
+            "export",
+            "--frozen",
+            "--no-dev",
+            "--no-emit-project",
+            "--format",
+            "requirements-txt",
+            "--output-file",
+            str(requirements),
+        ]
+    )
+    has_pip = importlib.util.find_spec("pip") is not None
+    pip = [sys.executable, "-m", "pip"] if has_pip else [uv, "tool", "run", "pip"]
+    command = [
+        *pip,
+        "download",
+        "--only-binary=:all:",
+        "--no-deps",
+        "--python-version",
+        python_version,
+        "--implementation",
+        "cp",
+        "--dest",
+        str(dest),
+        "-r",
+        str(requirements),
+    ]
+    for platform in platforms:
+        command += ["--platform", platform]
+    print(f"Downloading wheels for Python {python_version} ({', '.join(platforms) or 'host'})...")
+    run_tool(command)
+
+    pinned = set(read_pins(requirements))
+    for wheel in dest.glob("*.whl"):
+        name, version = wheel.name.split("-")[:2]
+        if (re.sub(r"[-_.]+", "_", name).lower(), version) not in pinned:
+            wheel.unlink()
+
+
+def find_python(version: str) -> str:
+    """Find an interpreter for the target Python version.
+
+    :param version: Python version (e.g. ``3.11``)
+    :return: Interpreter path
+    :raises OfflineBundleError: If no interpreter of that version is found
+    """
+    if f"{sys.version_info.major}.{sys.version_info.minor}" == version:
+        return sys.executable
+    python = shutil.which(f"python{version}")
+    if python is not None:
+        return python
+    uv = shutil.which("uv")
+    if uv is not None:
+        try:
+            return run_tool([uv, "python", "find", version]).strip()
+        except OfflineBundleError:
+            pass
+    raise OfflineBundleError(
+        f"Python {version} is needed to precompile bytecode for the runtime "
+        f"(install it with `uv python install {version}`)"
+    )
+
+
+def compile_bytecode(members: list[tarfile.TarInfo], dest: Path, python_version: str) -> str:
+    """Precompile the package modules for the target Python version into ``dest``.
+
+    Bytecode uses checked-hash invalidation: it records a hash of its source
+    instead of an mtime, so it is reproducible and, should a source file
+    change after install, Python ignores the stale bytecode and compiles the
+    source as usual. Top-level scripts (``main.py``) are never imported and
+    aren't compiled.
+
+    :param members: Archive members
+    :param dest: Staging directory (replaced)
+    :param python_version: Target Python version
+    :return: Cache tag of the bytecode (e.g. ``cpython-311``)
+    :raises OfflineBundleError: If no matching interpreter is found or compiling fails
+    """
+    python = find_python(python_version)
+    shutil.rmtree(dest, ignore_errors=True)
+    dest.mkdir(parents=True)
+    for tarinfo in members:
+        if tarinfo.isfile() and "/" in tarinfo.name and tarinfo.name.endswith(".py"):
+            target = dest / tarinfo.name
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(tarinfo.name, target)
+    run_tool(
+        [
+            python,
+            "-m",
+            "compileall",
+            "-q",
+            "--invalidation-mode",
+            "checked-hash",
+            "-s",
+            str(dest),
+            str(dest),
+        ]
+    )
+    return f"cpython-{python_version.replace('.', '')}"
+
+
+def bundle_offline(
+    members: list[tarfile.TarInfo],
+    python_version: str,
+    platforms: list[str],
+    wheelhouse: Path | None,
+    mtime: int,
+) -> tuple[list[tarfile.TarInfo], dict[str, Path]]:
+    """Stage the wheelhouse and precompiled bytecode of an offline bundle.
+
+    :param members: Archive members of the project files
+    :param python_version: Target Python version
+    :param platforms: Target pip platform tags
+    :param wheelhouse: Prebuilt wheelhouse (wheels and requirements.txt) to use
+        instead of downloading
+    :param mtime: Fixed modification time for every member
+    :return: Extra members, and the path each of them is read from
+    :raises OfflineBundleError: If the wheelhouse or bytecode can't be built
+    """
+    if wheelhouse is None:
+        wheelhouse = OFFLINE_DIR / "wheels"
+        build_wheelhouse(wheelhouse, python_version, platforms)
+    elif not (wheelhouse / "requirements.txt").exists():
+        raise OfflineBundleError(f"{wheelhouse} has no requirements.txt")
+    bytecode_dir = OFFLINE_DIR / "bytecode"
+    tag = compile_bytecode(members, bytecode_dir, python_version)
+
+    existing = {tarinfo.name for tarinfo in members}
+    wheels, sources = scan_staged(
+        wheelhouse,
+        WHEELHOUSE_DIR,
+        mtime,
+        existing,
+        include=lambda name: name.endswith((".whl", "/requirements.txt")),
+    )
+    bytecode, bytecode_sources = scan_staged(
+        bytecode_dir,
+        "",
+        mtime,
+        existing,
+        include=lambda name: "__pycache__" in name,
+        bytecode_tag=tag,
+    )
+    return wheels + bytecode, {**sources, **bytecode_sources}
+
+
+def module_name(name: str) -> str | None:
+    """Get the module name of a packaged Python file.
+
+    :param name: Archive member name (e.g. ``pkg/sub/mod.py``)
+    :return: Module name (``pkg.sub.mod``; ``pkg.sub`` for ``__init__.py``), or None
+        for files that aren't modules of a package
+    """
+    if "/" not in name or not name.endswith(".py"):
+        return None
+    parts = name[:-3].split("/")
+    if parts[-1] == "__init__":
+        parts.pop()
+    return ".".join(parts)
+
+
+def scan_module(path: Path, package: str) -> tuple[set[str], set[str]]:
+    """Find the modules a file may import and the strings it contains.
+
+    Every import statement counts, including those inside functions and
+    ``TYPE_CHECKING`` blocks, as do ``import_module``/``__import__`` calls
+    with a literal name. ``from X import Y`` yields ``X`` and ``X.Y``, since
+    ``Y`` may be a submodule.
+
+    :param path: Python file
+    :param package: Package relative imports resolve against ("" for top-level scripts)
+    :return: Absolute names of possibly imported modules, and every string literal
+    """
+    tree = ast.parse(path.read_bytes(), filename=str(path))
+    imports: set[str] = set()
+    strings: set[str] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            imports.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            base = node.module or ""
+            if node.level:
+                parts = package.split(".")
+                parent = ".".join(parts[: len(parts) - node.level + 1])
+                base = f"{parent}.{base}".strip(".")
+            imports.add(base)
+            imports.update(f"{base}.{alias.name}" for alias in node.names)
+        elif isinstance(node, ast.Call) and node.args:
+            func = node.func
+            called = func.attr if isinstance(func, ast.Attribute) else getattr(func, "id", None)
+            argument = node.args[0]
+            if called in DYNAMIC_IMPORTS and isinstance(argument, ast.Constant):
+                imports.add(str(argument.value))
+        elif isinstance(node, ast.Constant) and isinstance(node.value, str):
+            strings.add(node.value)
+    return imports, strings
+
+
+def find_unused(
+    members: list[tarfile.TarInfo], entry: str, keep: list[str]
+) -> tuple[list[tarfile.TarInfo], list[tarfile.TarInfo]]:
+    """Walk the static import graph from the entry script to find code and data nothing uses.
+
+    Importing a module also imports its parent packages. A data file in a
+    package counts as used when a reachable module mentions its file name in
+    a string literal (e.g. ``Path(__file__).parent / "table.csv"``). Modules
+    imported by computed names (plugins, ``importlib`` with a variable) and
+    data files found by pattern can't be seen and belong in ``keep``.
+
+    :param members: Archive members (arcname equals the source path)
+    :param entry: Entry script (``runtime.entry``)
+    :param keep: Allowlist of fnmatch patterns for module names or archive paths;
+        kept modules are treated as reachable
+    :return: Unreachable modules and unused data files, each largest first
+    """
+    modules = {module_name(t.name): t for t in members if t.isfile() and module_name(t.name)}
+
+    def is_kept(tarinfo: tarfile.TarInfo) -> bool:
+        module = module_name(tarinfo.name) or ""
+        return any(fnmatch(tarinfo.name, p) or fnmatch(module, p) for p in keep)
+
+    reachable: set[str] = set()
+    pending: deque[str] = deque()
+
+    def reach(name: str) -> None:
+        parts = name.split(".")
+        for i in range(1, len(parts) + 1):
+            module = ".".join(parts[:i])
+            if module in modules and module not in reachable:
+                reachable.add(module)
+                pending.append(module)
+
+    imports, strings = scan_module(Path(entry), "")
+    for name in imports:
+        reach(name)
+    for module, tarinfo in modules.items():
+        if is_kept(tarinfo):
+            reach(module)
+    while pending:
+        module = pending.popleft()
+        name = modules[module].name
+        package = module if name.endswith("/__init__.py") else module.rpartition(".")[0]
+        imports, module_strings = scan_module(Path(name), package)
+        strings |= module_strings
+        for imported in imports:
+            reach(imported)
+
+    packages = {name.split(".")[0] for name in modules}
+    unreachable = [t for module, t in modules.items() if module not in reachable]
+    unused = [
+        t
+        for t in members
+        if t.isfile()
+        and t.name.split("/")[0] in packages
+        and not t.name.endswith(".py")
+        and not is_kept(t)
+        and not any(Path(t.name).name in string for string in strings)
+    ]
+    return (
+        sorted(unreachable, key=lambda t: t.size, reverse=True),
+        sorted(unused, key=lambda t: t.size, reverse=True),
+    )
+
+
+def report_unused(
+    unreachable: list[tarfile.TarInfo], unused: list[tarfile.TarInfo], prune: bool
+) -> None:
+    """Print the modules and data files the import graph doesn't reach.
+
+    :param unreachable: Unreachable modules
+    :param unused: Unused data files
+    :param prune: Whether they are being excluded
+    """
+    if not unreachable and not unused:
+        return
+    total = sum(tarinfo.size for tarinfo in [*unreachable, *unused])
+    action = "excluding" if prune else "pass --prune to exclude, or allowlist with --keep"
+    print(
+        f"Unused by the import graph: {len(unreachable)} modules, {len(unused)} data files, "
+        f"{total / 1024:.1f} KB ({action})"
+    )
+    for label, files in (("module", unreachable), ("data", unused)):
+        for tarinfo in files:
+            print(f"  {tarinfo.size / 1024:10.1f} KB  {label:<6}  {tarinfo.name}")
+
+
+def prune_members(members: list[tarfile.TarInfo], drop: set[str]) -> list[tarfile.TarInfo]:
+    """Remove members, and the directories that leaves empty.
+
+    :param members: Archive members
+    :param drop: Names of the members to remove
+    :return: Remaining members, in the same order
+    """
+    remaining = [tarinfo for tarinfo in members if tarinfo.name not in drop]
+    files = [tarinfo.name for tarinfo in remaining if not tarinfo.isdir()]
+    return [
+        tarinfo
+        for tarinfo in remaining
+        if not tarinfo.isdir()
+        or not any(name.startswith(f"{tarinfo.name}/") for name in drop)
+        or any(name.startswith(f"{tarinfo.name}/") for name in files)
+    ]
+
+
+def load_settings() -> dict[str, Any]:
+    """Load the ``[tool.package-extension]`` settings from pyproject.toml.
+
+    :return: Settings (``prune``, ``keep``), empty without pyproject.toml
+    """
+    try:
+        with Path("pyproject.toml").open("rb") as f:
+            pyproject = tomllib.load(f)
+    except FileNotFoundError:
+        return {}
+    return pyproject.get("tool", {}).get("package-extension", {})
+
+
+def sha256_file(path: str | Path) -> str:
+    """SHA-256 of a file's contents.
+
+    :param path: File to hash
+    :return: Hex digest
+    """
+    digest = hashlib.sha256()
+    with Path(path).open("rb") as f:
+        while chunk := f.read(1 << 20):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def fingerprint(
+    members: list[tarfile.TarInfo],
+    cached: dict[str, list[Any]],
+    sources: dict[str, Path] | None = None,
+) -> dict[str, list[Any]]:
+    """Fingerprint every member as [size, mtime_ns, mode, sha256].
+
+    Files whose size and mtime match the cache reuse the cached hash, so an
+    unchanged tree is checked without reading any file contents.
+
+    :param members: Archive members
+    :param cached: Fingerprints from the previous build
+    :param sources: Paths of staged members whose archive name isn't their path
+    :return: Fingerprints keyed by member name (directories have no hash)
+    """
+    sources = sources or {}
+    fingerprints = {}
+    for tarinfo in members:
+        path = sources.get(tarinfo.name, Path(tarinfo.name))
+        stat = path.stat()
+        entry: list[Any] = [stat.st_size, stat.st_mtime_ns, tarinfo.mode, None]
+        if tarinfo.isfile():
+            previous = cached.get(tarinfo.name)
+            if previous is not None and previous[:2] == entry[:2]:
+                entry[3] = previous[3]
+            else:
+                entry[3] = sha256_file(path)
+        fingerprints[tarinfo.name] = entry
+    return fingerprints
+
+
+def load_cache() -> dict[str, Any]:
+    """Load the build cache from the previous run.
+
+    :return: Cache contents, or an empty dict if missing or unreadable
+    """
+    try:
+        return json.loads(CACHE_PATH.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def is_up_to_date(
+    cache: dict[str, Any], key: dict[str, Any], files: dict[str, list[Any]], archive: Path
+) -> bool:
+    """Check whether the archive from the previous build can be reused.
+
+    :param cache: Cache from the previous build
+    :param key: Build settings of this build
+    :param files: Fingerprints of this build's members
+    :param archive: Archive path
+    :return: True if inputs, settings and the archive itself are unchanged
+    """
+    if not archive.exists() or cache.get("key") != key:
+        return False
+    hashes = {name: (entry[2], entry[3]) for name, entry in files.items()}
+    cached_hashes = {name: (entry[2], entry[3]) for name, entry in cache.get("files", {}).items()}
+    stat = archive.stat()
+    return hashes == cached_hashes and cache.get("archive") == [stat.st_size, stat.st_mtime_ns]
+
+
+def report_inputs(members: list[tarfile.TarInfo]) -> int:
+    """Print the total input size and the largest input files.
+
+    :param members: Archive members
+    :return: Total size of all files in bytes
+    """
+    files = [tarinfo for tarinfo in members if tarinfo.isfile()]
+    total = sum(tarinfo.size for tarinfo in files)
+    print(f"Inputs: {len(files)} files, {total / (1024 * 1024):.2f} MB uncompressed")
+    for tarinfo in sorted(files, key=lambda t: t.size, reverse=True)[:TOP_INPUTS]:
+        share = tarinfo.size / total if total else 0.0
+        print(f"  {tarinfo.size / 1024:10.1f} KB  {share:4.0%}  {tarinfo.name}")
+    return total
+
+
+class ArchiveTooLargeError(Exception):
+    """Raised when the compressed archive exceeds the size budget."""
+
+
+class BudgetWriter:
+    """Binary file wrapper that counts written bytes and enforces a size budget."""
+
+    def __init__(self, fileobj: BinaryIO, budget: int) -> None:
+        """Initialize the writer.
+
+        :param fileobj: Binary file to write to
+        :param budget: Maximum number of bytes
+        """
+        self._out = fileobj
+        self.budget = budget
+        self.written = 0
+
+    def write(self, data: bytes) -> int:
+        """Write data, failing as soon as the budget is exceeded.
+
+        :param data: Bytes to write
+        :return: Number of bytes written
+        :raises ArchiveTooLargeError: If the total exceeds the budget
+        """
+        self.written += len(data)
+        if self.written > self.budget:
+            raise ArchiveTooLargeError(f"{self.written} bytes written, budget {self.budget}")
+        return self._out.write(data)
+
+    def flush(self) -> None:
+        """Flush the underlying file."""
+        self._out.flush()
+
+
+class ParallelGzipWriter:
+    """Write-only file that gzips fixed-size chunks on a thread pool.
+
+    Every chunk becomes its own gzip member (the same layout pigz uses for
+    independent blocks). Concatenated members form a valid gzip stream that
+    standard readers decompress in one pass. zlib releases the GIL while
+    compressing, so chunks compress in parallel; output order is preserved.
+
+    ``points`` maps uncompressed offsets at chunk ends to the compressed bytes
+    written up to that point.
+    """
+
+    def __init__(self, fileobj: BinaryIO, jobs: int, level: int) -> None:
+        """Initialize the writer.
+
+        :param fileobj: Binary file to write compressed data to
+        :param jobs: Number of compression threads
+        :param level: gzip compression level (1-9)
+        """
+        self._out = fileobj
+        self._level = level
+        self._pool = ThreadPoolExecutor(max_workers=jobs)
+        self._pending: deque[tuple[int, Future[bytes]]] = deque()
+        self._max_pending = 2 * jobs
+        self._buffer = bytearray()
+        self._offset = 0
+        self._written = 0
+        self.points: list[tuple[int, int]] = [(0, 0)]
+
+    def write(self, data: bytes) -> int:
+        """Buffer data and submit every full chunk for compression.
+
+        :param data: Uncompressed bytes
+        :return: Number of bytes written
+        """
+        self._buffer += data
+        self._offset += len(data)
+        while len(self._buffer) >= CHUNK_SIZE:
+            self._submit(bytes(self._buffer[:CHUNK_SIZE]))
+            del self._buffer[:CHUNK_SIZE]
+        return len(data)
+
+    def tell(self) -> int:
+        """Uncompressed bytes written so far."""
+        return self._offset
+
+    def _submit(self, chunk: bytes) -> None:
+        """Queue a chunk, writing out the oldest result when the queue is full."""
+        if len(self._pending) >= self._max_pending:
+            self._write_oldest()
+        end = self._offset - len(self._buffer) + len(chunk)
+        self._pending.append((end, self._pool.submit(gzip.compress, chunk, self._level, mtime=0)))
+
+    def _write_oldest(self) -> None:
+        """Write the oldest compressed chunk (waiting for it if needed)."""
+        end, future = self._pending.popleft()
+        member = future.result()
+        self._out.write(member)
+        self._written += len(member)
+        self.points.append((end, self._written))
+
+    def close(self) -> None:
+        """Compress the remaining data and write every pending member."""
+        if self._buffer:
+            self._submit(bytes(self._buffer))
+            self._buffer.clear()
+        while self._pending:
+            self._write_oldest()
+        self._pool.shutdown()
+
+
+def interpolate(points: list[tuple[int, int]], offset: int) -> float:
+    """Estimate the compressed bytes written up to an uncompressed offset.
+
+    :param points: Known (uncompressed offset, compressed bytes) pairs, ascending
+    :param offset: Uncompressed offset
+    :return: Compressed bytes, linearly interpolated between known points
+    """
+    index = bisect_left(points, (offset, -1))
+    if index >= len(points):
+        return float(points[-1][1])
+    end, compressed = points[index]
+    if end == offset or index == 0:
+        return float(compressed)
+    start, start_compressed = points[index - 1]
+    return start_compressed + (compressed - start_compressed) * (offset - start) / (end - start)
+
+
+def write_archive(
+    archive: Path,
+    members: list[tarfile.TarInfo],
+    jobs: int,
+    level: int,
+    budget: int,
+    sources: dict[str, Path] | None = None,
+) -> list[dict[str, Any]]:
+    """Write the members to a tar.gz archive within a compressed size budget.
+
+    The archive is written to a temporary file and renamed into place, so an
+    interrupted or oversized build never leaves a truncated archive behind.
+
+    :param archive: Archive path
+    :param members: Normalized archive members
+    :param jobs: Compression threads (1 writes a single gzip member)
+    :param level: gzip compression level (1-9)
+    :param budget: Maximum compressed size in bytes
+    :param sources: Paths of staged members whose archive name isn't their path
+    :return: Per-file stats (name, size, compressed bytes, including the tar header).
+        With a single gzip member the compressor is sync-flushed after every file,
+        so sizes are exact; with ``jobs`` > 1 they are apportioned from per-chunk sizes.
+    :raises ArchiveTooLargeError: As soon as the compressed output exceeds the budget
+    """
+    sources = sources or {}
+    partial = archive.with_name(archive.name + ".partial")
+    ranges = []
+    try:
+        with partial.open("wb") as out:
+            counter = BudgetWriter(out, budget)
+            if jobs > 1:
+                compressed: Any = ParallelGzipWriter(counter, jobs, level)
+                points = compressed.points
+            else:
+                compressed = gzip.GzipFile(
+                    filename="", mode="wb", fileobj=counter, compresslevel=level, mtime=0
+                )
+                points = [(0, 0)]
+            with tarfile.open(fileobj=compressed, mode="w", format=tarfile.PAX_FORMAT) as tar:
+                for tarinfo in members:
+                    if not tarinfo.isfile():
+                        tar.addfile(tarinfo)
+                        continue
+                    start = tar.offset
+                    with sources.get(tarinfo.name, Path(tarinfo.name)).open("rb") as f:
+                        tar.addfile(tarinfo, f)
+                    ranges.append((tarinfo, start, tar.offset))
+                    if jobs <= 1:
+                        compressed.flush()
+                        points.append((tar.offset, counter.written))
+            compressed.close()
+    except BaseException:
+        partial.unlink(missing_ok=True)
+        raise
+    stats = [
+        {
+            "name": tarinfo.name,
+            "size": tarinfo.size,
+            "compressed": round(interpolate(points, end) - interpolate(points, start)),
+        }
+        for tarinfo, start, end in ranges
+    ]
+    partial.replace(archive)
+    return stats
+
+
+def write_stats(
+    path: Path, archive: Path, stats: list[dict[str, Any]], input_bytes: int, seconds: float
+) -> None:
+    """Write packaging stats as JSON for CI dashboards.
+
+    :param path: Stats file path
+    :param archive: Archive path
+    :param stats: Per-file stats from :func:`write_archive`
+    :param input_bytes: Total uncompressed input size
+    :param seconds: Build time
+    """
+    archive_bytes = archive.stat().st_size
+    for entry in stats:
+        entry["ratio"] = entry["compressed"] / entry["size"] if entry["size"] else 0.0
+    report = {
+        "archive": archive.name,
+        "archive_bytes": archive_bytes,
+        "input_bytes": input_bytes,
+        "ratio": archive_bytes / input_bytes if input_bytes else 0.0,
+        "seconds": seconds,
+        "files": sorted(stats, key=lambda entry: entry["compressed"], reverse=True),
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2) + "\n")
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Package the extension into a tar.gz archive")
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Compression threads; above 1, the archive is written as independent gzip "
+        "members (default: 1, a single gzip member)",
+    )
+    parser.add_argument(
+        "--level", type=int, default=9, choices=range(1, 10), help="gzip compression level"
+    )
+    parser.add_argument("--force", action="store_true", help="Rebuild even if nothing changed")
+    parser.add_argument(
+        "--max-size-mb",
+        type=float,
+        default=MAX_SIZE_MB,
+        help=f"Compressed size budget in MB (default: {MAX_SIZE_MB}, the marketplace limit)",
+    )
+    parser.add_argument(
+        "--stats", type=Path, default=STATS_PATH, help=f"Stats JSON path (default: {STATS_PATH})"
+    )
+    parser.add_argument(
+        "--prune",
+        action="store_true",
+        help="Exclude modules and package data files the import graph of runtime.entry "
+        "doesn't reach (also [tool.package-extension] prune in pyproject.toml)",
+    )
+    parser.add_argument(
+        "--keep",
+        action="append",
+        default=[],
+        help="Module name or path pattern to always package, for dynamic imports "
+        "(repeatable; adds to [tool.package-extension] keep)",
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Bundle a wheelhouse built from uv.lock and bytecode precompiled for the "
+        "runtime's python_version, so the extension installs without network access",
+    )
+    parser.add_argument(
+        "--platform",
+        action="append",
+        default=[],
+        help="pip platform tag of the target machines for --offline, e.g. "
+        "manylinux2014_aarch64 (repeatable; default: this machine's platform)",
+    )
+    parser.add_argument(
+        "--wheelhouse",
+        type=Path,
+        help="Prebuilt wheelhouse (wheels and requirements.txt) for --offline instead of "
+        "downloading",
+    )
+    return parser.parse_args()
+
+
 def main() -> None:
     """Package the extension."""
+    args = parse_args()
+
     # Load manifest
     try:
         with Path("extension.toml").open("rb") as f:
@@ -99,38 +998,116 @@ def main() -> None:
         ".vscode",
         ".github",
         "scripts",
+        "benchmarks",
     }
     for path in Path().iterdir():
         if path.is_dir() and path.name not in exclude_dirs and (path / "__init__.py").exists():
             files.append(path.name)
 
+    for file_path in sorted(set(files)):
+        if not Path(file_path).exists():
+            print(f"ERROR: Required file missing: {file_path}")
+            sys.exit(1)
+
     # Create archive
     project_name = Path.cwd().name
     archive_name = f"{project_name}-v{version}.tar.gz"
+    archive_path = Path(archive_name)
 
-    print(f"Creating {archive_name}...")
-    print("Packaging files for Zelos marketplace...")
+    # Member mtimes follow SOURCE_DATE_EPOCH (https://reproducible-builds.org/)
+    mtime = int(os.environ.get("SOURCE_DATE_EPOCH", "0"))
+    members = scan_members(files, mtime)
 
-    with tarfile.open(archive_name, "w:gz") as tar:
-        for file_path in sorted(set(files)):
-            path = Path(file_path)
-            if not path.exists():
-                print(f"ERROR: Required file missing: {file_path}")
-                sys.exit(1)
+    # Report (and optionally exclude) package code the entry script never imports
+    settings = load_settings()
+    prune = args.prune or settings.get("prune", False)
+    keep = sorted({*settings.get("keep", []), *args.keep})
+    entry = runtime.get("entry", "")
+    if entry.endswith(".py"):
+        try:
+            unreachable, unused = find_unused(members, entry, keep)
+        except SyntaxError as e:
+            print(f"ERROR: Can't parse {e.filename}: {e}")
+            sys.exit(1)
+        report_unused(unreachable, unused, prune)
+        if prune:
+            members = prune_members(members, {t.name for t in [*unreachable, *unused]})
+
+    sources: dict[str, Path] = {}
+    offline = None
+    if args.offline:
+        python_version = runtime.get(
+            "python_version", f"{sys.version_info.major}.{sys.version_info.minor}"
+        )
+        try:
+            staged, sources = bundle_offline(
+                members, python_version, args.platform, args.wheelhouse, mtime
+            )
+        except OfflineBundleError as e:
+            print(f"ERROR: Offline bundle failed: {e}")
+            sys.exit(1)
+        members = sorted(members + staged, key=lambda tarinfo: tarinfo.name)
+        offline = {"python": python_version, "platforms": sorted(args.platform)}
+        wheels = sum(1 for name in sources if name.endswith(".whl"))
+        bytecode = sum(1 for name in sources if name.endswith(".pyc"))
+        print(f"Offline bundle: {wheels} wheels, {bytecode} precompiled modules")
+
+    input_bytes = report_inputs(members)
 
-            tar.add(file_path, arcname=file_path, filter=filter_archive_files)
+    cache = load_cache()
+    fingerprints = fingerprint(members, cache.get("files", {}), sources)
+    key = {
+        "version": CACHE_VERSION,
+        "mtime": mtime,
+        "level": args.level,
+        "gzip_members": "single" if args.jobs <= 1 else CHUNK_SIZE,
+        "offline": offline,
+        "keep": keep if prune else None,
+    }
+
+    if not args.force and is_up_to_date(cache, key, fingerprints, archive_path):
+        print(f"✓ {archive_name} is up to date ({len(members)} files unchanged)")
+    else:
+        print(f"\nCreating {archive_name}...")
+        print("Packaging files for Zelos marketplace...")
+        budget = int(args.max_size_mb * 1024 * 1024)
+        start = time.perf_counter()
+        try:
+            stats = write_archive(archive_path, members, args.jobs, args.level, budget, sources)
+        except ArchiveTooLargeError:
+            print(
+                f"\n❌ ERROR: Archive too large (exceeded {args.max_size_mb:g} MB while "
+                "compressing); see the largest inputs above"
+            )
+            sys.exit(1)
+        for file_path in sorted(set(files)):
             print(f"  + {file_path}")
+        if sources:
+            print(f"  + {WHEELHOUSE_DIR}/ and precompiled bytecode")
+        write_stats(args.stats, archive_path, stats, input_bytes, time.perf_counter() - start)
+
+        stat = archive_path.stat()
+        CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        CACHE_PATH.write_text(
+            json.dumps(
+                {
+                    "key": key,
+                    "archive": [stat.st_size, stat.st_mtime_ns],
+                    "files": fingerprints,
+                },
+                indent=2,
+            )
+            + "\n"
+        )
 
     # Verify archive size constraints
-    archive_path = Path(archive_name)
     size_bytes = archive_path.stat().st_size
     size_kb = size_bytes / 1024
     size_mb = size_kb / 1024
 
-    # Check against Zelos marketplace limits
-    MAX_SIZE_MB = 500
-    if size_mb > MAX_SIZE_MB:
-        print(f"\n❌ ERROR: Archive too large ({size_mb:.1f} MB > {MAX_SIZE_MB} MB limit)")
+    # Check against the size budget (also covers an up-to-date archive from an earlier build)
+    if size_mb > args.max_size_mb:
+        print(f"\n❌ ERROR: Archive too large ({size_mb:.1f} MB > {args.max_size_mb:g} MB limit)")
         sys.exit(1)
 
     print(f"\n✓ Package created: {archive_name}")
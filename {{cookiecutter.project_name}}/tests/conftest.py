@@ -0,0 +1,132 @@
+"""Shared fixtures: an in-process trace source and actions registry, and a load-test harness."""
+
+import gc
+import statistics
+import threading
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+from typing import Any
+
+import pytest
+import zelos_sdk
+from fakes import DEFAULT_CAPACITY, FakeTraceSource
+
+
+class FakeActionsRegistry:
+    """In-process stand-in for ``zelos_sdk.actions_registry``, keyed by action title."""
+
+    def __init__(self) -> None:
+        self.actions: dict[str, Callable[..., Any]] = {}
+
+    def register(self, obj: Any) -> None:
+        """Register the ``@zelos_sdk.action`` methods of ``obj``."""
+        for name in dir(type(obj)):
+            action = getattr(getattr(type(obj), name), "_action", None)
+            if action is not None:
+                self.actions[action.title] = getattr(obj, name)
+
+    def list(self) -> list[str]:
+        """Titles of the registered actions."""
+        return sorted(self.actions)
+
+    def execute(self, title: str, **params: Any) -> Any:
+        """Run an action like the Zelos App does."""
+        return self.actions[title](**params)
+
+
+class FakeSdk:
+    """Trace sources created while the fake is installed, and the fake actions registry."""
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        self.sources: dict[str, FakeTraceSource] = {}
+        self.actions = FakeActionsRegistry()
+        self.name: str | None = None
+
+    def init(self, name: str | None = None, **kwargs: Any) -> None:
+        """Record the extension name (installed as ``zelos_sdk.init``, which only runs once)."""
+        self.name = name
+
+    def create_source(self, name: str) -> FakeTraceSource:
+        """Create a trace source (installed as ``zelos_sdk.TraceSourceCacheLast``)."""
+        self.sources[name] = FakeTraceSource(name, self.capacity)
+        return self.sources[name]
+
+
+@pytest.fixture
+def fake_sdk(monkeypatch: pytest.MonkeyPatch) -> FakeSdk:
+    """Replace SDK init, the trace source and the actions registry with in-process fakes.
+
+    Monitors created in the test log into :class:`FakeTraceSource` objects
+    (``fake_sdk.sources[name]``) instead of a Zelos agent.
+    """
+    sdk = FakeSdk(DEFAULT_CAPACITY)
+    monkeypatch.setattr(zelos_sdk, "TraceSourceCacheLast", sdk.create_source)
+    monkeypatch.setattr(zelos_sdk, "actions_registry", sdk.actions)
+    monkeypatch.setattr(zelos_sdk, "init", sdk.init)
+    return sdk
+
+
+class LoadResult:
+    """Throughput, jitter and memory growth of one load-test run."""
+
+    def __init__(
+        self, samples: int, seconds: float, intervals: list[float], memory_growth: int
+    ) -> None:
+        self.samples = samples
+        self.seconds = seconds
+        self.rate = samples / seconds
+        # Median deviation of the time between samples from its median, so a
+        # few late wake-ups on a busy CI runner don't dominate
+        median = statistics.median(intervals) if intervals else 0.0
+        self.jitter = statistics.median(abs(i - median) for i in intervals) if intervals else 0.0
+        self.max_interval = max(intervals, default=0.0)
+        self.memory_growth = memory_growth
+
+    def __repr__(self) -> str:
+        return (
+            f"LoadResult(rate={self.rate:.0f}/s, jitter={self.jitter * 1e6:.0f}us, "
+            f"max_interval={self.max_interval * 1e3:.1f}ms, memory_growth={self.memory_growth}B)"
+        )
+
+
+@pytest.fixture
+def load_test(fake_sdk: FakeSdk) -> Iterator[Callable[..., LoadResult]]:
+    """Drive ``monitor.run()`` on a thread for a fixed duration and measure it.
+
+    Call it with a monitor (created after the fixture, so it logs into the
+    fake SDK), the duration, the event whose rows are counted and a warm-up
+    time. Memory growth is measured with tracemalloc from the end of the
+    warm-up to the end of the run.
+    """
+
+    def run(
+        monitor: Any, duration: float, event: str = "environmental", warmup: float = 0.2
+    ) -> LoadResult:
+        recorded = fake_sdk.sources[monitor.source.name].events[event]
+        thread = threading.Thread(target=monitor.run, name="load-test", daemon=True)
+        gc.collect()
+        tracemalloc.start()
+        monitor.start()
+        thread.start()
+        time.sleep(warmup)
+        first = recorded.count
+        baseline = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        time.sleep(duration)
+        samples = recorded.count - first
+        seconds = time.perf_counter() - start
+        gc.collect()
+        growth = tracemalloc.get_traced_memory()[0] - baseline
+        monitor.stop()
+        thread.join(5.0)
+        tracemalloc.stop()
+        times = recorded.times
+        last = min(first + samples, recorded.recorded)
+        intervals = [(times[i] - times[i - 1]) / 1e9 for i in range(first + 1, last)]
+        return LoadResult(samples, seconds, intervals, growth)
+
+    yield run
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
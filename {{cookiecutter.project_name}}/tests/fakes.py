@@ -0,0 +1,166 @@
+"""In-process stand-in for ``zelos_sdk.TraceSourceCacheLast``.
+
+Shared by the ``fake_sdk`` test fixture (see conftest.py) and the offline SDK
+stub the benchmarks run against (benchmarks/stub_sdk.py). It doesn't import
+``zelos_sdk``, so it works where the SDK isn't installed.
+"""
+
+import threading
+import time
+from array import array
+from collections.abc import Mapping
+from typing import Any
+
+# Rows recorded per event; later calls are counted but not stored
+DEFAULT_CAPACITY = 16384
+
+
+class FakeField:
+    """Last logged value of one field, read like ``TraceSourceCacheLast`` fields."""
+
+    __slots__ = ("_event", "name")
+
+    def __init__(self, event: "FakeEvent", name: str) -> None:
+        self._event = event
+        self.name = name
+
+    def get(self) -> Any:
+        """Get the last logged value (None before the first log)."""
+        return self._event.last.get(self.name)
+
+
+class FakeEvent:
+    """Records every logged row into preallocated arrays.
+
+    ``times`` and ``columns[field]`` hold the first ``capacity`` rows, so
+    recording allocates nothing per call and doesn't skew memory or timing
+    measurements. ``count`` counts every row, recorded or not.
+    """
+
+    def __init__(self, name: str, fields: list[Any], capacity: int) -> None:
+        self.name = name
+        self.fields = tuple(field.name for field in fields)
+        self.data_types = {field.name: field.data_type for field in fields}
+        self.capacity = capacity
+        self.times = array("q", bytes(8 * capacity))
+        self.columns = {name: array("d", bytes(8 * capacity)) for name in self.fields}
+        self.count = 0
+        self.last: dict[str, Any] = {}
+
+    def __getattr__(self, name: str) -> FakeField:
+        if name in self.__dict__.get("fields", ()):
+            return FakeField(self, name)
+        raise AttributeError(name)
+
+    @property
+    def recorded(self) -> int:
+        """Number of rows stored in the arrays."""
+        return min(self.count, self.capacity)
+
+    def log(self, **fields: Any) -> None:
+        """Record a row timestamped now."""
+        self.log_at(time.time_ns(), **fields)
+
+    def log_at(self, time_ns: int, **fields: Any) -> None:
+        """Record a row.
+
+        :raises KeyError: If a field isn't part of the event
+        """
+        row = self.count
+        self.count = row + 1
+        self.last.update(fields)
+        if row < self.capacity:
+            self.times[row] = time_ns
+            columns = self.columns
+            for name, value in fields.items():
+                columns[name][row] = value
+
+    def log_batch(self, batch: Any) -> None:
+        """Record a ``pyarrow.RecordBatch`` with a ``time_ns`` column."""
+        start = self.count
+        stored = max(0, min(batch.num_rows, self.capacity - start))
+        self.count = start + batch.num_rows
+        stop = start + stored
+        for name, column in zip(batch.schema.names, batch.columns, strict=True):
+            if name == "time_ns":
+                values = column.slice(0, stored).cast("int64").to_pylist()
+                self.times[start:stop] = array("q", values)
+                continue
+            self.last[name] = column[-1].as_py()
+            self.columns[name][start:stop] = array("d", column.slice(0, stored).to_pylist())
+
+    def intervals(self) -> list[float]:
+        """Seconds between consecutive recorded rows."""
+        times = self.times
+        return [(times[i] - times[i - 1]) / 1e9 for i in range(1, self.recorded)]
+
+
+class FakeTraceSource:
+    """In-process stand-in for ``zelos_sdk.TraceSourceCacheLast`` that records what is logged.
+
+    :meth:`stall` makes the source-level ``log``/``log_at``/``log_batch`` calls
+    block (or raise) like a stalled backend or agent connection, until
+    :meth:`resume`.
+    """
+
+    def __init__(self, name: str, capacity: int = DEFAULT_CAPACITY) -> None:
+        self.name = name
+        self.capacity = capacity
+        self.events: dict[str, FakeEvent] = {}
+        self.value_tables: dict[tuple[str, str], dict[int, str]] = {}
+        self._flowing = threading.Event()
+        self._flowing.set()
+        self._stall_error: Exception | None = None
+
+    def __getattr__(self, name: str) -> FakeEvent:
+        try:
+            return self.__dict__["events"][name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def add_event(self, name: str, fields: list[Any]) -> FakeEvent:
+        """Define an event."""
+        self.events[name] = FakeEvent(name, fields, self.capacity)
+        return self.events[name]
+
+    def get_event(self, name: str) -> FakeEvent:
+        """Get an event by name (for names that aren't identifiers)."""
+        return self.events[name]
+
+    def add_value_table(self, name: str, field_name: str, data: Mapping[int, str]) -> None:
+        """Define a value table."""
+        self.value_tables[(name, field_name)] = dict(data)
+
+    def stall(self, error: Exception | None = None) -> None:
+        """Stall logging until :meth:`resume`.
+
+        :param error: Raise this from every log call instead of blocking
+        """
+        self._stall_error = error
+        self._flowing.clear()
+
+    def resume(self) -> None:
+        """Let stalled and later log calls through."""
+        self._flowing.set()
+
+    def _wait(self) -> None:
+        """Block (or raise) while stalled."""
+        if not self._flowing.is_set():
+            if self._stall_error is not None:
+                raise self._stall_error
+            self._flowing.wait()
+
+    def log(self, name: str, data: Mapping[str, Any]) -> None:
+        """Record a row timestamped now."""
+        self._wait()
+        self.events[name].log(**data)
+
+    def log_at(self, time_ns: int, name: str, data: Mapping[str, Any]) -> None:
+        """Record a row."""
+        self._wait()
+        self.events[name].log_at(time_ns, **data)
+
+    def log_batch(self, name: str, batch: Any) -> None:
+        """Record a batch of rows."""
+        self._wait()
+        self.events[name].log_batch(batch)
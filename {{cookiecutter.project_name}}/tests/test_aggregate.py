@@ -0,0 +1,87 @@
+"""Tests for windowed min/max/mean aggregation."""
+
+import asyncio
+import threading
+import time
+
+from {{cookiecutter.project_slug}}.async_monitor import AsyncSensorMonitor
+from {{cookiecutter.project_slug}}.extension import SensorMonitor
+from {{cookiecutter.project_slug}}.utils.aggregate import WindowAggregator
+
+
+def test_aggregate_summarizes_closed_window(check) -> None:
+    """A window is summarized when the first sample of the next one arrives."""
+    aggregator = WindowAggregator(fields=2, window=1.0)
+    check.that(aggregator.add(10.1, 1.0, 5.0), "is", None)
+    check.that(aggregator.add(10.5, 3.0, 4.0), "is", None)
+    check.that(aggregator.add(10.9, 2.0, 6.0), "is", None)
+
+    start, count, stats = aggregator.add(11.2, 9.0, 9.0)
+    check.that(start, "==", 10.0)
+    check.that(count, "==", 3)
+    check.that(stats[0][0], "==", 1.0)
+    check.that(stats[0][1], "==", 3.0)
+    check.that(stats[0][2], "==", 2.0)
+    check.that(stats[1][0], "==", 4.0)
+    check.that(stats[1][1], "==", 6.0)
+
+
+def test_aggregate_skips_empty_windows(check) -> None:
+    """Gaps produce no summaries; the next window aligns to the window length."""
+    aggregator = WindowAggregator(fields=1, window=0.5)
+    aggregator.add(1.1, 1.0)
+    start, count, _ = aggregator.add(3.7, 2.0)
+    check.that(start, "==", 1.0)
+    check.that(count, "==", 1)
+
+    start, count, stats = aggregator.flush()
+    check.that(start, "==", 3.5)
+    check.that(stats[0][2], "==", 2.0)
+    check.that(aggregator.flush(), "is", None)
+
+
+def test_aggregate_window_change_keeps_open_window_end(check) -> None:
+    """A new window length applies from the next window, not to the open one."""
+    aggregator = WindowAggregator(fields=1, window=1.0)
+    aggregator.add(10.2, 1.0)
+    aggregator.window = 5.0
+    check.that(aggregator.add(10.9, 2.0), "is", None)
+
+    start, count, _ = aggregator.add(11.1, 3.0)
+    check.that(start, "==", 10.0)
+    check.that(count, "==", 2)
+    check.that(aggregator.add(14.9, 4.0), "is", None)
+    start, count, _ = aggregator.add(15.0, 5.0)
+    check.that(start, "==", 10.0)
+    check.that(count, "==", 2)
+
+
+def test_monitor_logs_last_window_on_stop(check, fake_sdk) -> None:
+    """Stopping logs the open window, in the blocking and asyncio runners alike."""
+    config = {
+        "interval": 0.01,
+        "metrics": False,
+        "aggregation": {"enabled": True, "window": 3600.0},
+    }
+    monitor = SensorMonitor({**config, "sensor_name": "agg-sync"}, source_name="agg-sync")
+    monitor.start()
+    thread = threading.Thread(target=monitor.run)
+    thread.start()
+    time.sleep(0.1)
+    monitor.stop()
+    thread.join()
+
+    async_monitor = AsyncSensorMonitor({**config, "sensors": [{"sensor_name": "agg-async"}]})
+    async_monitor.start()
+
+    async def run_briefly() -> None:
+        asyncio.get_running_loop().call_later(0.1, async_monitor.stop)
+        await async_monitor.run()
+
+    asyncio.run(run_briefly())
+
+    for name in ("agg-sync", "agg-async"):
+        source = fake_sdk.sources[name]
+        check.that(source.environmental_agg.count, "==", 1)
+        check.that(source.power_agg.count, "==", 1)
+        check.that(source.environmental_agg.last["count"], "==", source.environmental.count)
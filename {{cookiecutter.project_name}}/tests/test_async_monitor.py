@@ -0,0 +1,72 @@
+"""Tests for the asyncio multi-sensor runner."""
+
+import asyncio
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from {{cookiecutter.project_slug}}.async_monitor import AsyncSensorMonitor
+
+
+async def run_for(monitor: AsyncSensorMonitor, seconds: float) -> float:
+    """Run the monitor and stop it after ``seconds``; return total run time."""
+    loop = asyncio.get_running_loop()
+    loop.call_later(seconds, monitor.stop)
+    start = time.monotonic()
+    await monitor.run()
+    return time.monotonic() - start
+
+
+def test_async_monitor_runs_sensors_concurrently(check, fake_sdk) -> None:
+    """Each sensor ticks on its own interval and stop cancels long sleeps."""
+    config = {
+        "sensor_name": "host",
+        "interval": 1.0,
+        "sensors": [
+            {"sensor_name": "async-fast", "interval": 0.01},
+            {"sensor_name": "async-slow", "interval": 1.0},
+        ],
+    }
+    monitor = AsyncSensorMonitor(config)
+    monitor.start()
+    elapsed = asyncio.run(run_for(monitor, 0.3))
+
+    check.that(elapsed, "<", 0.9)
+    check.that(monitor.sensors["async-fast"].scheduler.ticks, ">", 10)
+    check.that(monitor.sensors["async-slow"].scheduler.ticks, "==", 1)
+    check.that(monitor.sensors["async-fast"].metrics.sleeps, ">", 10)
+
+
+def test_async_monitor_set_interval_targets_one_sensor(check, fake_sdk) -> None:
+    """Set Interval only changes the named sensor."""
+    config = {
+        "sensor_name": "host",
+        "interval": 0.1,
+        "sensors": [{"sensor_name": "async-a"}, {"sensor_name": "async-b"}],
+    }
+    monitor = AsyncSensorMonitor(config)
+    monitor.set_interval(0.5, sensor="async-b")
+
+    check.that(monitor.sensors["async-a"].config["interval"], "==", 0.1)
+    check.that(monitor.sensors["async-b"].config["interval"], "==", 0.5)
+
+
+@pytest.mark.parametrize(
+    "setting",
+    [
+        {"pipeline": True},
+        {"spool": {"enabled": True}},
+        {"sensors": [{"sensor_name": "async-a"}, {"sensor_name": "async-b", "pipeline": True}]},
+    ],
+)
+def test_async_monitor_rejects_pipeline_and_spool(
+    check, fake_sdk, tmp_path: Path, setting: dict[str, Any]
+) -> None:
+    """The pipeline and the spool need the sync monitor, so async mode refuses them."""
+    config = {"sensor_name": "host", "spool": {"path": str(tmp_path / "spool")}, **setting}
+    with pytest.raises(ValueError, match="only supported in sync mode"):
+        AsyncSensorMonitor(config)
+    # Rejected before any sensor opened its spool
+    check.that((tmp_path / "spool").exists(), "is", False)
@@ -0,0 +1,89 @@
+"""Tests for batched sampling and logging (``batch_size`` > 1)."""
+
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from {{cookiecutter.project_slug}}.extension import SensorMonitor
+
+HYSTERESIS_RULES = [
+    {"status": "WARNING", "above": 25.0, "hysteresis": 2.0},
+    {"status": "ERROR", "above": 30.0, "hysteresis": 2.0},
+]
+
+
+def logged_status(fake_sdk, path: Path, name: str, batch_size: int, rules: Any) -> list[int]:
+    """Replay a capture through a monitor and return the status column it logged."""
+    config = {
+        "sensor_name": name,
+        "metrics": False,
+        "batch_size": batch_size,
+        "source": {"type": "replay", "path": str(path), "speed": 0},
+    }
+    if rules is not None:
+        config["status_rules"] = rules
+    monitor = SensorMonitor(config, source_name=name)
+    monitor.start()
+    monitor.run()
+    environmental = fake_sdk.sources[name].environmental
+    return [int(value) for value in environmental.columns["status"][: environmental.recorded]]
+
+
+@pytest.mark.parametrize(
+    ("rules", "expected"),
+    [
+        (None, [0, 0, 1, 2, 0, 1, 0]),
+        (HYSTERESIS_RULES, [0, 0, 1, 2, 1, 1, 0]),
+    ],
+)
+def test_batch_status_carries_over_batches(
+    check, fake_sdk, tmp_path: Path, rules: Any, expected: list[int]
+) -> None:
+    """Each sample's status uses the temperature before it, also across batch boundaries."""
+    path = tmp_path / "capture.csv"
+    temperatures = (20, 26, 31, 24, 26, 20, 21)
+    path.write_text(
+        "time_ns,temperature,pressure,voltage,current\n"
+        + "".join(f"{i + 1},{t},1013,12,2.5\n" for i, t in enumerate(temperatures))
+    )
+
+    # Batches of two put every temperature change on a batch boundary once
+    batched = logged_status(fake_sdk, path, "batch-2", 2, rules)
+    single = logged_status(fake_sdk, path, "batch-1", 1, rules)
+    check.that(len(batched), "==", len(expected))
+    check.that(len(single), "==", len(expected))
+    for status, single_status, want in zip(batched, single, expected, strict=False):
+        check.that(status, "==", want)
+        check.that(single_status, "==", want)
+
+
+def test_batch_timestamps_follow_interval_per_batch(check, fake_sdk) -> None:
+    """Each batch is timestamped one interval apart, ending at the time it was read."""
+    monitor = SensorMonitor(
+        {"sensor_name": "batch-times", "metrics": False, "interval": 0.01, "batch_size": 4},
+        source_name="batch-times",
+    )
+    monitor.start()
+    reads = []
+    for _ in range(2):
+        before = time.time_ns()
+        monitor.step()
+        reads.append((before, time.time_ns()))
+        time.sleep(0.05)
+
+    source = fake_sdk.sources["batch-times"]
+    times = list(source.environmental.times[: source.environmental.recorded])
+    check.that(len(times), "==", 8)
+    for power_time, time_ns in zip(source.power.times[:8], times, strict=False):
+        check.that(power_time, "==", time_ns)
+    gaps = [times[i] - times[i - 1] for i in range(1, 8)]
+    for gap in gaps[:3] + gaps[4:]:
+        check.that(gap, "==", 10_000_000)
+    # Batches don't continue each other's timestamps: reads are at least 50 ms apart
+    # and a batch spans 30 ms
+    check.that(gaps[3], ">=", 20_000_000)
+    for batch, (before, after) in enumerate(reads):
+        check.that(times[4 * batch + 3], ">=", before)
+        check.that(times[4 * batch + 3], "<=", after)
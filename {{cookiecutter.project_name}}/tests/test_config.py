@@ -0,0 +1,143 @@
+"""Tests for config snapshots, hot reload and the config watcher."""
+
+import json
+import pickle
+from pathlib import Path
+
+import pytest
+from zelos_sdk.extensions import load_config
+
+from {{cookiecutter.project_slug}}.extension import SensorMonitor
+from {{cookiecutter.project_slug}}.utils.config import ConfigSnapshot, ConfigWatcher
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.mark.parametrize("config", [{}, {"sensor_name": "abc"}])
+def test_shipped_schema_loads_and_starts(check, fake_sdk, tmp_path: Path, config: dict) -> None:
+    """Configs relying on the schema defaults pass the SDK's validation and build a monitor."""
+    path = tmp_path / "config.json"
+    path.write_text(json.dumps(config))
+    loaded = load_config(config_path=path, schema_path=PROJECT_ROOT / "config.schema.json")
+
+    check.that(len(loaded["gc"]["thresholds"]), "==", 0)
+    monitor = SensorMonitor(loaded, source_name="defaults")
+    check.that(monitor.config["sensor_name"], "==", loaded["sensor_name"])
+
+
+def test_config_snapshot_is_immutable(check) -> None:
+    """Snapshots reject mutation at every level and derive new snapshots with replace()."""
+    snapshot = ConfigSnapshot({"interval": 0.1, "deadband": {"enabled": True}, "sensors": [{}]})
+    with pytest.raises(TypeError):
+        snapshot["interval"] = 0.2
+    with pytest.raises(TypeError):
+        snapshot["deadband"].update(enabled=False)
+    check.that(isinstance(snapshot["sensors"], tuple), "is", True)
+
+    changed = snapshot.replace(interval=0.2)
+    check.that(changed["interval"], "==", 0.2)
+    check.that(snapshot["interval"], "==", 0.1)
+    restored = pickle.loads(pickle.dumps(snapshot))
+    check.that(restored["interval"], "==", 0.1)
+    check.that(restored["deadband"]["enabled"], "is", True)
+    check.that(len(restored["sensors"]), "==", 1)
+    thawed = snapshot.thaw()["sensors"]
+    check.that(isinstance(thawed, list), "is", True)
+    check.that(len(thawed), "==", 1)
+    check.that(len(thawed[0]), "==", 0)
+
+
+def test_monitor_apply_config(check, fake_sdk) -> None:
+    """Per-tick settings apply in place; restart-only settings are kept and reported."""
+    monitor = SensorMonitor(
+        {"sensor_name": "reload", "metrics": False, "interval": 0.1, "pipeline": False},
+        source_name="reload",
+    )
+    source = monitor.source
+    result = monitor.apply_config(
+        {
+            "sensor_name": "reload",
+            "metrics": False,
+            "interval": 0.02,
+            "pipeline": True,
+            "overrun_policy": "catch_up",
+            "status_rules": [{"status": "ERROR", "above": 10.0}],
+        }
+    )
+
+    applied = ["interval", "overrun_policy", "status_rules"]
+    check.that(len(result["applied"]), "==", len(applied))
+    for got, want in zip(result["applied"], applied, strict=False):
+        check.that(got, "==", want)
+    check.that(len(result["restart_required"]), "==", 1)
+    check.that(result["restart_required"][0], "==", "pipeline")
+    check.that(monitor.config["interval"], "==", 0.02)
+    check.that(monitor.config["pipeline"], "is", False)
+    check.that(monitor.scheduler.policy, "==", "catch_up")
+    check.that(monitor.status_rules.update(12.0), "==", 2)
+    check.that(monitor.source is source, "is", True)
+
+    with pytest.raises(ValueError):
+        monitor.apply_config({"sensor_name": "reload", "overrun_policy": "sometimes"})
+    check.that(monitor.config["interval"], "==", 0.02)
+
+
+def test_monitor_event_intervals(check, fake_sdk) -> None:
+    """Per-event rates change from config, Set Interval and Set Event Interval."""
+    config = {"sensor_name": "rates", "metrics": False, "event_intervals": {"power": 0.01}}
+    monitor = SensorMonitor(config, source_name="rates")
+    check.that(len(monitor.rates.intervals), "==", 2)
+    check.that(monitor.rates.intervals["environmental"], "==", 0.1)
+    check.that(monitor.rates.intervals["power"], "==", 0.01)
+
+    monitor.set_interval(0.5)
+    monitor.set_event_interval("environmental", 2.0)
+    monitor.rates.advance()
+    check.that(monitor.rates.intervals["environmental"], "==", 2.0)
+    check.that(monitor.rates.intervals["power"], "==", 0.01)
+    check.that(monitor.get_status()["event_intervals"]["environmental"], "==", 2.0)
+    with pytest.raises(ValueError):
+        monitor.set_event_interval("gps", 1.0)
+
+    result = monitor.apply_config({**config, "event_intervals": {"power": 0.002}})
+    monitor.rates.advance()
+    check.that(len(result["applied"]), "==", 2)
+    check.that(result["applied"][0], "==", "event_intervals")
+    check.that(result["applied"][1], "==", "interval")
+    check.that(monitor.rates.intervals["environmental"], "==", 0.1)
+    check.that(monitor.rates.intervals["power"], "==", 0.002)
+    result = monitor.apply_config({**config, "event_intervals": {}})
+    check.that(len(result["restart_required"]), "==", 1)
+    check.that(result["restart_required"][0], "==", "event_intervals")
+    with pytest.raises(ValueError):
+        SensorMonitor({**config, "event_intervals": {"gps": 1.0}}, source_name="rates-bad")
+
+
+def test_monitor_apply_config_keeps_deadband_state(check, fake_sdk) -> None:
+    """Changing deadband thresholds updates the running filters in place."""
+    config = {"sensor_name": "deadband-reload", "metrics": False, "deadband": {"enabled": True}}
+    monitor = SensorMonitor(config, source_name="deadband-reload")
+    filters = monitor.deadband
+    monitor.apply_config(
+        {**config, "deadband": {"enabled": True, "thresholds": {"power.voltage": 0.5}}}
+    )
+    check.that(monitor.deadband is filters, "is", True)
+    check.that(monitor.deadband["power"].thresholds[0], "==", 0.5)
+
+
+def test_config_watcher_applies_valid_changes(check, tmp_path: Path) -> None:
+    """The watcher reloads on change and ignores files that fail to load."""
+    path = tmp_path / "config.json"
+    path.write_text(json.dumps({"interval": 0.1}))
+    applied = []
+    watcher = ConfigWatcher(path, lambda: json.loads(path.read_text()), applied.append)
+
+    check.that(watcher.check(), "is", False)
+    path.write_text(json.dumps({"interval": 0.25}))
+    check.that(watcher.check(), "is", True)
+    check.that(applied[-1]["interval"], "==", 0.25)
+
+    path.write_text("{not json")
+    check.that(watcher.check(), "is", False)
+    check.that(watcher.errors, "==", 1)
+    check.that(len(applied), "==", 1)
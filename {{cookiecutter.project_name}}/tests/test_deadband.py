@@ -0,0 +1,30 @@
+"""Tests for the change-only logging filter."""
+
+from {{cookiecutter.project_slug}}.utils.deadband import DeadbandFilter
+
+
+def test_deadband_suppresses_small_changes(check) -> None:
+    """Only changes larger than the threshold pass."""
+    deadband = DeadbandFilter([0.5, 0.0], max_silence=60.0)
+    check.that(deadband.should_log(0.0, 20.0, 0), "==", True)
+    check.that(deadband.should_log(0.1, 20.4, 0), "==", False)
+    check.that(deadband.should_log(0.2, 20.6, 0), "==", True)
+    check.that(deadband.should_log(0.3, 20.6, 1), "==", True)
+    check.that(deadband.stats()["suppressed"], "==", 1)
+
+
+def test_deadband_compares_against_last_logged_value(check) -> None:
+    """Slow drift is logged once it accumulates past the threshold."""
+    deadband = DeadbandFilter([0.5], max_silence=60.0)
+    flags = deadband.mask([0.0, 0.1, 0.2, 0.3], [10.0, 10.2, 10.4, 10.6])
+    check.that(flags.count(True), "==", 2)
+    check.that(flags[-1], "==", True)
+
+
+def test_deadband_heartbeat(check) -> None:
+    """An unchanged value is still logged once max_silence has passed."""
+    deadband = DeadbandFilter([1.0], max_silence=1.0)
+    deadband.should_log(0.0, 5.0)
+    check.that(deadband.should_log(0.5, 5.0), "==", False)
+    check.that(deadband.should_log(1.0, 5.0), "==", True)
+    check.that(deadband.stats()["suppression_ratio"], "==", 1 / 3)
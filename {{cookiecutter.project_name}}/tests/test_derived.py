@@ -0,0 +1,159 @@
+"""Tests for derived channels compiled from config expressions."""
+
+import math
+
+import pyarrow as pa
+import pytest
+import zelos_sdk
+
+from {{cookiecutter.project_slug}}.extension import EVENT_FIELDS, INPUTS, SensorMonitor
+from {{cookiecutter.project_slug}}.schema_monitor import SchemaMonitor
+from {{cookiecutter.project_slug}}.utils.derived import DerivedChannels
+
+STATEFUL_CHANNELS = [
+    {"name": "temp_ewma", "expr": "ewma(environmental.temperature, 0.25)"},
+    {"name": "current_rms", "expr": "sqrt(rolling_mean(power.current ** 2, 4))", "unit": "A"},
+    {"name": "dp_dt", "expr": "derivative(environmental.pressure)", "unit": "hPa/s"},
+    {"name": "dv_mean", "expr": "rolling_mean(derivative(power.voltage), 3)"},
+    {"name": "temp_mean", "expr": "rolling_mean(environmental.temperature, 3)"},
+    {"name": "clamped", "expr": "min(max(environmental.temperature, 21), 25)"},
+]
+
+
+def test_derived_channels_compile_in_dependency_order(check) -> None:
+    """Channels may use channels declared after them; shared fields are read once."""
+    derived = DerivedChannels(
+        [
+            {"name": "kilowatts", "expr": "watts / 1000", "unit": "kW"},
+            {"name": "watts", "expr": "power.voltage * power.current", "unit": "W"},
+            {"name": "margin", "expr": "max(-environmental.temperature + 50, 0)"},
+        ],
+        EVENT_FIELDS,
+        INPUTS,
+    )
+    values = derived.evaluate(0, 30.0, 1013.0, 12.0, 2.5, 0)
+
+    expected = [("kilowatts", "kW", 0.03), ("watts", "W", 30.0), ("margin", None, 20.0)]
+    check.that(len(derived.fields), "==", len(expected))
+    check.that(len(values), "==", len(expected))
+    fields = zip(derived.fields, values.items(), expected, strict=False)
+    for (field, unit), (name, value), (want_name, want_unit, want_value) in fields:
+        check.that(field, "==", want_name)
+        check.that(unit, "==", want_unit)
+        check.that(name, "==", want_name)
+        check.that(value, "==", want_value)
+
+
+@pytest.mark.parametrize(
+    "expr",
+    [
+        "power.watts",
+        "power.voltage +",
+        "log(power.voltage)",
+        "ewma(power.voltage, 2.0)",
+        "derivative(3)",
+        "2 * 3",
+        "power.voltage if power.current else 0",
+        "other",
+        "loop + 1",
+    ],
+)
+def test_derived_channels_reject_invalid_expressions(expr: str) -> None:
+    """Unknown fields, functions and names, bad arguments, constants and cycles are errors."""
+    with pytest.raises(ValueError):
+        DerivedChannels([{"name": "loop", "expr": expr}], EVENT_FIELDS, INPUTS)
+
+
+def test_derived_batches_match_single_samples(check) -> None:
+    """Vectorized batches of any size give the per-sample results, state carried across.
+
+    Nan inputs and the nan from the first derivative affect only the windows that hold them.
+    """
+    count = 20
+    time_ns = [i * 250_000_000 for i in range(count)]
+    temp = [math.nan if i in (5, 13) else 20.0 + (i % 7) for i in range(count)]
+    voltage = [12.0 + i / 2 for i in range(count)]
+    pressure = [1000.0 + i * i / 4 for i in range(count)]
+    current = [(-1.0) ** i * (1 + i / 10) for i in range(count)]
+
+    single = DerivedChannels(STATEFUL_CHANNELS, EVENT_FIELDS, INPUTS)
+    expected = [
+        single.evaluate(time_ns[i], temp[i], pressure[i], voltage[i], current[i], 0)
+        for i in range(count)
+    ]
+
+    batched = DerivedChannels(STATEFUL_CHANNELS, EVENT_FIELDS, INPUTS)
+    rows = []
+    start = 0
+    for size in (1, 3, 7, 2, 7):
+        stop = start + size
+        columns = [
+            pa.array(column[start:stop], pa.float64())
+            for column in (temp, pressure, voltage, current)
+        ]
+        outputs = batched.evaluate_batch(
+            pa.array(time_ns[start:stop], pa.timestamp("ns", tz="UTC")),
+            [*columns, pa.array([0] * size, pa.uint8())],
+        )
+        rows.extend(
+            dict(zip(outputs, values, strict=True))
+            for values in zip(*(column.to_pylist() for column in outputs.values()), strict=True)
+        )
+        start = stop
+
+    check.that(len(rows), "==", count)
+    check.that(math.isnan(rows[0]["dp_dt"]), "is", True)
+    check.that(rows[2]["dp_dt"], "==", 3.0)
+    # The first derivative is nan; it leaves the window at the fourth sample
+    for row in rows[:3]:
+        check.that(math.isnan(row["dv_mean"]), "is", True)
+    check.that(rows[3]["dv_mean"], "==", 2.0)
+    check.that(math.isnan(rows[7]["temp_mean"]), "is", True)
+    check.that(rows[9]["temp_mean"], "==", 21.0)
+    check.that(math.isnan(rows[5]["clamped"]), "is", True)
+    # Equal within rounding, with nan equal to nan and infinities equal to themselves
+    for row, want in zip(rows, expected, strict=True):
+        for name in want:
+            check.that(row[name], "is_close", want[name], abs_tol=1e-9, nan_ok=True)
+
+
+def test_monitor_logs_derived_event(check, fake_sdk) -> None:
+    """The derived event is defined with units and logged per sample and per batch."""
+    channels = [{"name": "watts", "expr": "power.voltage * power.current", "unit": "W"}]
+    monitor = SensorMonitor(
+        {"sensor_name": "derived", "metrics": False, "derived": channels}, source_name="derived"
+    )
+    monitor.start()
+    monitor.step()
+    derived = fake_sdk.sources["derived"].derived
+    power = fake_sdk.sources["derived"].power
+    check.that(derived.count, "==", 1)
+    check.that(derived.times[0], "==", power.times[0])
+    check.that(derived.watts.get(), "==", power.voltage.get() * power.current.get())
+
+    monitor.config = monitor.config.replace(batch_size=4)
+    monitor.step()
+    check.that(derived.count, "==", 5)
+    check.that(str(derived.data_types["watts"]), "==", str(zelos_sdk.DataType.Float64))
+
+    events = [{"name": "battery", "fields": [{"name": "amps", "input": "current"}]}]
+    schema = SchemaMonitor(
+        {
+            "sensor_name": "derived-schema",
+            "metrics": False,
+            "events": events,
+            "derived": [{"name": "amp_hours", "expr": "battery.amps / 3600"}],
+        },
+        source_name="derived-schema",
+    )
+    schema.start()
+    schema.step()
+    check.that(fake_sdk.sources["derived-schema"].derived.count, "==", 1)
+    with pytest.raises(ValueError):
+        SchemaMonitor(
+            {
+                "metrics": False,
+                "events": events,
+                "derived": [{"name": "x", "expr": "power.current"}],
+            }
+        )
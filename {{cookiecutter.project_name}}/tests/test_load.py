@@ -0,0 +1,79 @@
+"""Hot-loop load tests against the in-process trace source (see conftest.py)."""
+
+import pytest
+
+from {{cookiecutter.project_slug}}.extension import SensorMonitor
+
+# Bytes the loop may allocate and keep while running at a steady rate
+MAX_MEMORY_GROWTH = 256 * 1024
+
+# Fraction of the target rate the loop must reach (shared CI runners are noisy)
+MIN_RATE_RATIO = 0.8
+
+
+def test_fake_sdk_records_monitor(check, fake_sdk) -> None:
+    """The fake trace source records every logged row and serves registered actions."""
+    monitor = SensorMonitor({"sensor_name": "fake", "metrics": False}, source_name="fake")
+    fake_sdk.actions.register(monitor)
+    monitor.start()
+    for _ in range(3):
+        monitor.step()
+
+    environmental = fake_sdk.sources["fake"].environmental
+    check.that(environmental.count, "==", 3)
+    check.that(environmental.columns["temperature"][2], "==", environmental.temperature.get())
+    check.that(fake_sdk.sources["fake"].value_tables[("environmental", "status")][2], "==", "ERROR")
+    check.that(fake_sdk.actions.execute("Set Interval", seconds=0.05)["interval"], "==", 0.05)
+    check.that(fake_sdk.actions.execute("Get Status")["interval"], "==", 0.05)
+
+
+@pytest.mark.parametrize("interval", [0.01, 0.002])
+def test_load_sustains_target_rate(check, load_test, interval: float) -> None:
+    """The loop holds its target rate with low jitter and no steady memory growth."""
+    config = {"sensor_name": "load", "interval": interval, "overrun_policy": "catch_up"}
+    monitor = SensorMonitor(config, source_name="load")
+    result = load_test(monitor, duration=1.0)
+
+    target = 1 / interval
+    check.that(result.rate, ">=", MIN_RATE_RATIO * target)
+    check.that(result.rate, "<=", 1.1 * target)
+    check.that(result.jitter, "<", interval / 2)
+    check.that(result.memory_growth, "<", MAX_MEMORY_GROWTH)
+
+
+def test_load_sustains_batched_rate(check, load_test) -> None:
+    """Batched logging holds 1 kHz in blocks of 10 samples."""
+    monitor = SensorMonitor(
+        {
+            "sensor_name": "load-batch",
+            "interval": 0.001,
+            "batch_size": 10,
+            "overrun_policy": "catch_up",
+        },
+        source_name="load-batch",
+    )
+    result = load_test(monitor, duration=1.0)
+
+    check.that(result.rate, ">=", MIN_RATE_RATIO * 1000)
+    check.that(result.memory_growth, "<", MAX_MEMORY_GROWTH)
+
+
+def test_load_event_rates(check, load_test, fake_sdk) -> None:
+    """Per-event rates log each event at its own rate from one loop."""
+    monitor = SensorMonitor(
+        {
+            "sensor_name": "load-rates",
+            "interval": 0.1,
+            "event_intervals": {"power": 0.002, "environmental": 0.05},
+            "overrun_policy": "catch_up",
+        },
+        source_name="load-rates",
+    )
+    result = load_test(monitor, duration=1.0, event="power")
+
+    environmental = fake_sdk.sources["load-rates"].environmental.count
+    check.that(result.rate, ">=", MIN_RATE_RATIO * 500)
+    check.that(result.rate, "<=", 1.1 * 500)
+    check.that(environmental, ">=", 20)
+    check.that(environmental, "<=", 27)
+    check.that(result.memory_growth, "<", MAX_MEMORY_GROWTH)
@@ -0,0 +1,58 @@
+"""Tests for the batched, rate-limited logging pipeline."""
+
+import logging
+from types import SimpleNamespace
+
+from {{cookiecutter.project_slug}}.utils.log_pipeline import LogPipeline, RateLimitFilter
+
+
+class FakeTraceHandler:
+    """Stands in for TraceLoggingHandler, recording every bulk call."""
+
+    level = logging.DEBUG
+
+    def __init__(self) -> None:
+        self.calls: list[list[tuple]] = []
+        self.trace_event = SimpleNamespace(name="log")
+        self.trace_source = self
+
+    def log_many(self, events: list[tuple]) -> None:
+        self.calls.append(events)
+
+
+def record(name: str) -> logging.LogRecord:
+    """Make an INFO record for ``name``."""
+    return logging.LogRecord(name, logging.INFO, __file__, 1, "hello", None, None)
+
+
+def test_rate_limit_per_logger(check) -> None:
+    """Each logger has its own bucket; overrides apply to child loggers."""
+    limit = RateLimitFilter(rate=1.0, burst=2, overrides={"noisy": 0.0})
+    passed = [limit.filter(record("chatty")) for _ in range(5)]
+    check.that(passed.count(True), "==", 2)
+    check.that(limit.dropped["chatty"], "==", 3)
+    check.that(limit.filter(record("other")), "==", True)
+    check.that(all(limit.filter(record("noisy.child")) for _ in range(100)), "==", True)
+
+
+def test_pipeline_batches_and_counts_drops(check) -> None:
+    """Records reach the trace source in bulk calls; overflow is counted, not raised."""
+    trace = FakeTraceHandler()
+    logger = logging.getLogger("pipeline-test")
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    pipeline = LogPipeline(trace, queue_size=100, batch_size=50, rate=0.0)
+
+    # Fill the queue before the listener runs so records are batched and some overflow
+    logger.addHandler(pipeline.handler)
+    for i in range(150):
+        logger.info("sample %d", i)
+    logger.removeHandler(pipeline.handler)
+    pipeline.start(logger)
+    pipeline.stop(logger)
+
+    stats = pipeline.stats()
+    check.that(stats["emitted"], "==", 100)
+    check.that(stats["dropped_queue_full"], "==", 50)
+    check.that(len(trace.calls), "==", 2)
+    check.that(trace.calls[0][0][2]["message"], "==", "sample 0")
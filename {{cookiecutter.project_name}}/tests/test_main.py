@@ -0,0 +1,67 @@
+"""Tests for the entry point: a cheap import and one monitor type per mode."""
+
+import atexit
+import importlib
+import subprocess
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+import pytest
+
+from {{cookiecutter.project_slug}}.async_monitor import AsyncSensorMonitor
+from {{cookiecutter.project_slug}}.extension import SensorMonitor
+from {{cookiecutter.project_slug}}.schema_monitor import SchemaMonitor
+from {{cookiecutter.project_slug}}.supervisor import ProcessSupervisor
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+EVENTS = [{"name": "battery", "fields": [{"name": "amps", "input": "current"}]}]
+
+
+@pytest.fixture
+def main(monkeypatch: pytest.MonkeyPatch) -> ModuleType:
+    """Import main.py, collecting its atexit callbacks and running them after the test."""
+    monkeypatch.syspath_prepend(str(PROJECT_ROOT))
+    callbacks: list[Any] = []
+    monkeypatch.setattr(atexit, "register", callbacks.append)
+    yield importlib.import_module("main")
+    for callback in callbacks:
+        callback()
+
+
+def test_main_import_is_cheap(check) -> None:
+    """Importing main.py or a single utility loads neither the SDK nor pyarrow."""
+    code = (
+        "import sys, main\n"
+        "from {{cookiecutter.project_slug}}.utils import LogPipeline\n"
+        "print(sorted(name for name in ('zelos_sdk', 'pyarrow') if name in sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+    )
+    check.that(result.stdout.strip(), "==", "[]")
+
+
+@pytest.mark.parametrize(
+    ("config", "monitor_type"),
+    [
+        ({}, SensorMonitor),
+        ({"events": EVENTS}, SchemaMonitor),
+        ({"mode": "async"}, AsyncSensorMonitor),
+        ({"mode": "multiprocess", "workers": 1}, ProcessSupervisor),
+    ],
+)
+def test_create_app_builds_monitor_for_mode(
+    check, fake_sdk, main: ModuleType, config: dict[str, Any], monitor_type: type
+) -> None:
+    """create_app builds the configured mode's monitor, registers it and profiles startup."""
+    profile = main.StartupProfile()
+    monitor = main.create_app({"metrics": False, **config}, profile)
+
+    check.that(type(monitor).__name__, "==", monitor_type.__name__)
+    check.that(fake_sdk.name, "==", "{{cookiecutter.project_slug}}")
+    check.that(len(fake_sdk.actions.list()), ">", 0)
+    for phase in ("import", "monitor", "define_schema"):
+        check.that(phase, "in", list(profile.phases))
@@ -0,0 +1,69 @@
+"""Tests for hot-loop instrumentation."""
+
+import sys
+import threading
+
+from {{cookiecutter.project_slug}}.utils.metrics import LoopMetrics
+
+
+def test_metrics_histogram_percentiles(check) -> None:
+    """Percentiles come from the fixed-bucket iteration histogram."""
+    metrics = LoopMetrics()
+    for _ in range(98):
+        metrics.record_iteration(40e-6)
+    metrics.record_iteration(400e-6)
+    metrics.record_iteration(3e-3)
+
+    snapshot = metrics.snapshot()
+    check.that(snapshot["iteration_p50_us"], "==", 50.0)
+    check.that(snapshot["iteration_p99_us"], "==", 500.0)
+    check.that(round(snapshot["iteration_max_us"]), "==", 3000)
+    check.that(snapshot["histogram_us"]["<=50"], "==", 98)
+
+
+def test_metrics_reset_starts_new_window(check) -> None:
+    """A resetting snapshot clears window stats but keeps the running total."""
+    metrics = LoopMetrics()
+    metrics.record_iteration(1e-3)
+    metrics.record_log(1e-4)
+    metrics.record_overshoot(2e-4)
+
+    first = metrics.snapshot(reset=True)
+    second = metrics.snapshot()
+    check.that(round(first["sleep_overshoot_max_us"]), "==", 200)
+    check.that(second["iteration_mean_us"], "==", 0.0)
+    check.that(second["log_mean_us"], "==", 0.0)
+    check.that(second["iterations"], "==", 1)
+
+
+def test_metrics_window_counts_are_exact_across_threads(check) -> None:
+    """Every iteration recorded on one thread lands in exactly one window snapshotted on another."""
+    metrics = LoopMetrics()
+    count = 200_000
+    windows = []
+
+    def record() -> None:
+        for _ in range(count):
+            metrics.record_iteration(40e-6)
+
+    previous = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        thread = threading.Thread(target=record)
+        thread.start()
+        while thread.is_alive():
+            windows.append(metrics.snapshot(reset=True))
+        thread.join()
+    finally:
+        sys.setswitchinterval(previous)
+    windows.append(metrics.snapshot(reset=True))
+
+    # Each snapshot is consistent: the window histograms so far add up to the running total
+    recorded = 0
+    inconsistent = 0
+    for window in windows:
+        recorded += sum(window["histogram_us"].values())
+        inconsistent += recorded != window["iterations"]
+    check.that(len(windows), ">", 1)
+    check.that(inconsistent, "==", 0)
+    check.that(recorded, "==", count)
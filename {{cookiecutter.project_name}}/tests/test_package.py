@@ -0,0 +1,138 @@
+"""Tests for the packaging script."""
+
+import json
+import shutil
+import subprocess
+import sys
+import tarfile
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def package(project: Path, *args: str, check: bool = True) -> str:
+    """Run the packaging script in ``project`` and return its output."""
+    result = subprocess.run(
+        [sys.executable, "scripts/package_extension.py", *args],
+        cwd=project,
+        check=check,
+        capture_output=True,
+        text=True,
+    )
+    return result.stdout
+
+
+def copy_project(tmp_path: Path) -> Path:
+    """Copy the project (without build outputs) into a scratch directory."""
+    project = tmp_path / "project"
+    shutil.copytree(
+        PROJECT_ROOT, project, ignore=shutil.ignore_patterns(".*", "__pycache__", "*.tar.gz")
+    )
+    return project
+
+
+def test_package_is_reproducible_and_cached(check, tmp_path) -> None:
+    """Identical inputs give identical bytes, and unchanged inputs skip the build."""
+    project = copy_project(tmp_path)
+
+    check.that(package(project), "contains", "Creating")
+    archive = next(project.glob("*.tar.gz"))
+    first = archive.read_bytes()
+    check.that(package(project), "contains", "up to date")
+
+    (project / "main.py").touch()
+    check.that(package(project), "contains", "up to date")
+
+    package(project, "--force")
+    check.that(archive.read_bytes() == first, "==", True)
+
+    package(project, "--force", "--jobs", "4")
+    check.that(archive.read_bytes() == first, "==", False)
+    with tarfile.open(archive) as tar:
+        main = tar.extractfile("main.py").read()
+    check.that(main == (project / "main.py").read_bytes(), "==", True)
+
+
+def test_package_size_budget_and_stats(check, tmp_path) -> None:
+    """An archive over budget fails without leaving files behind; stats cover every file."""
+    project = copy_project(tmp_path)
+    (project / "assets" / "blob.bin").write_bytes(bytes(range(256)) * 4096)
+
+    output = package(project, "--max-size-mb", "0.001", check=False)
+    check.that(output, "contains", "Archive too large")
+    check.that(len(list(project.glob("*.tar.gz*"))), "==", 0)
+
+    package(project)
+    stats = json.loads((project / ".artifacts" / "package-stats.json").read_text())
+    blob = next(entry for entry in stats["files"] if entry["name"] == "assets/blob.bin")
+    check.that(blob["size"], "==", 1024 * 1024)
+    check.that(blob["ratio"], "<", 0.1)
+    total = sum(entry["compressed"] for entry in stats["files"])
+    check.that(total, "<=", stats["archive_bytes"])
+
+
+def test_package_offline_bundle(check, tmp_path) -> None:
+    """Offline bundles carry the wheelhouse and checked-hash bytecode, and stay reproducible."""
+    project = copy_project(tmp_path)
+    wheelhouse = tmp_path / "wheelhouse"
+    wheelhouse.mkdir()
+    (wheelhouse / "requirements.txt").write_text("demo-pkg==1.0\n")
+    (wheelhouse / "demo_pkg-1.0-py3-none-any.whl").write_bytes(b"wheel")
+    (wheelhouse / "notes.md").write_text("not packaged")
+    stray = project / "{{cookiecutter.project_slug}}" / "__pycache__" / "stray.cpython-311.pyc"
+    stray.parent.mkdir()
+    stray.write_bytes(b"stale")
+
+    args = ("--force", "--offline", "--wheelhouse", str(wheelhouse))
+    check.that(package(project, *args), "contains", "1 wheels")
+    archive = next(project.glob("*.tar.gz"))
+    first = archive.read_bytes()
+    package(project, *args)
+    check.that(archive.read_bytes() == first, "==", True)
+    check.that(package(project, *args[1:]), "contains", "up to date")
+
+    with tarfile.open(archive) as tar:
+        names = tar.getnames()
+        pyc = tar.extractfile("{{cookiecutter.project_slug}}/__pycache__/extension.cpython-311.pyc")
+        flags = int.from_bytes(pyc.read()[4:8], "little")
+    check.that(names == sorted(names), "==", True)
+    check.that("wheels/requirements.txt" in names, "==", True)
+    check.that("wheels/demo_pkg-1.0-py3-none-any.whl" in names, "==", True)
+    check.that("wheels/notes.md" in names, "==", False)
+    check.that(any(name.endswith("stray.cpython-311.pyc") for name in names), "==", False)
+    check.that(any(name.startswith("tests/") for name in names), "==", False)
+    # Checked-hash invalidation: the bytecode is validated against its source's hash
+    check.that(flags, "==", 0b11)
+
+
+def test_package_prunes_unreachable_code(check, tmp_path) -> None:
+    """Modules and data files outside the import graph are reported, and pruned on request."""
+    project = copy_project(tmp_path)
+    package_dir = project / "{{cookiecutter.project_slug}}"
+    (package_dir / "legacy.py").write_text("import json\n")
+    (package_dir / "plugin.py").write_text("VALUE = 1\n")
+    (package_dir / "fixtures").mkdir()
+    (package_dir / "fixtures" / "capture.bin").write_bytes(bytes(64 * 1024))
+
+    output = package(project)
+    check.that(output, "contains", "2 modules, 1 data files")
+    check.that(output, "contains", "{{cookiecutter.project_slug}}/fixtures/capture.bin")
+    archive = next(project.glob("*.tar.gz"))
+    with tarfile.open(archive) as tar:
+        full = tar.getnames()
+
+    package(project, "--prune", "--keep", "{{cookiecutter.project_slug}}.plugin")
+    with tarfile.open(archive) as tar:
+        pruned = tar.getnames()
+    removed = sorted(set(full) - set(pruned))
+    check.that(
+        removed
+        == [
+            "{{cookiecutter.project_slug}}/fixtures",
+            "{{cookiecutter.project_slug}}/fixtures/capture.bin",
+            "{{cookiecutter.project_slug}}/legacy.py",
+        ],
+        "==",
+        True,
+    )
+    check.that(set(pruned) <= set(full), "==", True)
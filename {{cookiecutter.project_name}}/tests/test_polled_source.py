@@ -0,0 +1,113 @@
+"""Tests for concurrent source polling, network devices and source plugins."""
+
+import math
+import time
+from importlib.metadata import EntryPoint
+
+import pytest
+
+from {{cookiecutter.project_slug}} import sources
+from {{cookiecutter.project_slug}}.extension import SensorMonitor
+from {{cookiecutter.project_slug}}.sources import PolledSource, SimulatedSource, create_source
+
+
+def test_polled_source_reads_simulated_devices(check) -> None:
+    """TCP (async) and UDP (threaded) devices merge into full samples."""
+    source = create_source(
+        {
+            "type": "merged",
+            "sources": [
+                {"type": "tcp", "simulate": True, "fields": ["temperature", "pressure"]},
+                {"type": "udp", "simulate": True, "fields": ["voltage", "current"]},
+            ],
+        }
+    )
+    try:
+        samples = [source.read() for _ in range(3)]
+    finally:
+        source.close()
+
+    check.that(isinstance(source, PolledSource), "is", True)
+    check.that(len(samples[-1]), "==", 5)
+    check.that(any(math.isnan(value) for sample in samples for value in sample[1:]), "is", False)
+    check.that(samples[-1][1], ">=", 15.0)
+    check.that(samples[-1][3], ">=", 11.5)
+    stats = source.stats()["sources"]
+    check.that(stats[0]["reads"], "==", 3)
+    check.that(stats[1]["reads"], "==", 3)
+
+
+def test_polled_source_slow_device_does_not_stall(check) -> None:
+    """A device slower than its timeout only delays the first read and serves stale values."""
+    source = create_source(
+        {
+            "type": "merged",
+            "sources": [
+                {"type": "simulated", "fields": ["temperature", "pressure"]},
+                {
+                    "type": "udp",
+                    "simulate": True,
+                    "delay": 1.0,
+                    "timeout": 0.05,
+                    "fields": ["voltage", "current"],
+                },
+            ],
+        }
+    )
+    try:
+        start = time.monotonic()
+        first = source.read()
+        first_elapsed = time.monotonic() - start
+        start = time.monotonic()
+        source.read()
+        second_elapsed = time.monotonic() - start
+    finally:
+        source.close()
+
+    check.that(first_elapsed, "<", 0.5)
+    check.that(second_elapsed, "<", 0.05)
+    check.that(math.isnan(first[3]), "is", True)
+    check.that(math.isnan(first[1]), "is", False)
+    check.that(source.stats()["sources"][1]["stale"], ">=", 2)
+
+
+def test_polled_source_requires_every_field_once(check) -> None:
+    """Merged sources must cover every field exactly once."""
+    with pytest.raises(ValueError, match="No source provides"):
+        create_source({"type": "merged", "sources": [{"fields": ["temperature"]}]})
+    with pytest.raises(ValueError, match="more than one source"):
+        create_source({"type": "merged", "sources": [{}, {"fields": ["voltage"]}]})
+    check.that(isinstance(create_source({}), SimulatedSource), "is", True)
+
+
+def test_sources_load_entry_point_plugins(check, monkeypatch) -> None:
+    """Source types registered under the entry point group can be configured."""
+
+    def fake_entry_points(group: str, name: str | None = None) -> list[EntryPoint]:
+        value = "{{cookiecutter.project_slug}}.sources.simulated:SimulatedSource"
+        plugins = [EntryPoint("plugin", value, group)]
+        return [ep for ep in plugins if name in (None, ep.name)]
+
+    monkeypatch.setattr(sources, "entry_points", fake_entry_points)
+    check.that("plugin", "in", sources.available_sources())
+    check.that(isinstance(create_source({"type": "plugin"}), SimulatedSource), "is", True)
+    with pytest.raises(ValueError, match="Unknown source type"):
+        create_source({"type": "missing"})
+
+
+def test_monitor_logs_device_samples(check, fake_sdk) -> None:
+    """SensorMonitor runs unchanged on a polled device source."""
+    monitor = SensorMonitor(
+        {
+            "sensor_name": "device",
+            "metrics": False,
+            "batch_size": 5,
+            "source": {"type": "tcp", "simulate": True},
+        },
+        source_name="device",
+    )
+    monitor.start()
+    monitor.step()
+    monitor.close()
+    check.that(monitor.data_source.stats()["samples"], "==", 5)
+    check.that(monitor.last.temperature, ">=", 15.0)
@@ -0,0 +1,60 @@
+"""Tests for the bounded ring buffer."""
+
+import threading
+
+from {{cookiecutter.project_slug}}.utils.ring_buffer import RingBuffer
+
+
+def test_ring_buffer_wraps_in_order(check) -> None:
+    """Records come out oldest first across the wrap-around point."""
+    ring = RingBuffer("<qf", capacity=4)
+    for i in range(3):
+        ring.put(i, float(i))
+    check.that(len(ring.drain(2)), "==", 2)
+    for i in range(3, 6):
+        ring.put(i, float(i))
+
+    records = ring.drain(10)
+    check.that(len(records), "==", 4)
+    check.that(records[0][0], "==", 2)
+    check.that(records[-1][0], "==", 5)
+    check.that(ring.high_water, "==", 4)
+
+
+def test_ring_buffer_drop_oldest(check) -> None:
+    """Overflow overwrites the oldest records and counts them."""
+    ring = RingBuffer("<q", capacity=3, policy="drop_oldest")
+    for i in range(5):
+        ring.put(i)
+
+    records = ring.drain(10)
+    check.that(records[0][0], "==", 2)
+    check.that(ring.dropped, "==", 2)
+
+
+def test_ring_buffer_drop_newest(check) -> None:
+    """Overflow rejects incoming records and counts them."""
+    ring = RingBuffer("<q", capacity=3, policy="drop_newest")
+    accepted = sum(ring.put(i) for i in range(5))
+
+    records = ring.drain(10)
+    check.that(accepted, "==", 3)
+    check.that(records[-1][0], "==", 2)
+    check.that(ring.dropped, "==", 2)
+
+
+def test_ring_buffer_block_waits_for_consumer(check) -> None:
+    """A blocked producer resumes once the consumer frees space."""
+    ring = RingBuffer("<q", capacity=2, policy="block")
+    ring.put(0)
+    ring.put(1)
+    producer = threading.Thread(target=ring.put, args=(2,))
+    producer.start()
+    producer.join(timeout=0.05)
+    check.that(producer.is_alive(), "==", True)
+
+    ring.drain(1)
+    producer.join(timeout=1.0)
+    check.that(producer.is_alive(), "==", False)
+    check.that(ring.dropped, "==", 0)
+    check.that(ring.drain(10)[-1][0], "==", 2)
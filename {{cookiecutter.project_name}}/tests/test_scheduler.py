@@ -0,0 +1,142 @@
+"""Tests for the deadline-based loop scheduler and the multi-rate event scheduler."""
+
+from collections import Counter
+
+from {{cookiecutter.project_slug}}.utils.scheduler import DeadlineScheduler, RateScheduler
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def make_scheduler(clock: FakeClock, policy: str, interval: list[float]) -> DeadlineScheduler:
+    return DeadlineScheduler(
+        lambda: interval[0], policy=policy, max_burst=2, clock=clock, sleep=clock.sleep
+    )
+
+
+def test_scheduler_does_not_drift(check) -> None:
+    """Loop cost is absorbed by the deadline instead of adding to the period."""
+    clock = FakeClock()
+    scheduler = make_scheduler(clock, "skip", [0.01])
+    for _ in range(100):
+        clock.now += 0.004  # simulated work
+        scheduler.wait()
+    check.that(round(clock.now, 6), "==", round(100 * 0.01 + 0.004, 6))
+    check.that(scheduler.missed, "==", 0)
+
+
+def test_scheduler_skip_keeps_phase(check) -> None:
+    """Skipped ticks are counted and the next deadline stays on the grid."""
+    clock = FakeClock()
+    scheduler = make_scheduler(clock, "skip", [0.01])
+    scheduler.wait()
+    clock.now += 0.035  # overrun by three and a half periods
+    scheduler.wait()
+    check.that(scheduler.missed, "==", 3)
+    check.that(round(clock.now, 6), "==", 0.05)
+
+
+def test_scheduler_catch_up_runs_missed_ticks(check) -> None:
+    """Catch-up returns immediately until the schedule is met again."""
+    clock = FakeClock()
+    scheduler = make_scheduler(clock, "catch_up", [0.01])
+    scheduler.wait()
+    clock.now += 0.035
+    delays = [scheduler.advance() for _ in range(4)]
+    check.that(sum(delays[:3]), "==", 0.0)
+    check.that(delays[3], ">", 0.0)
+    check.that(scheduler.missed, "==", 3)
+
+
+def test_scheduler_burst_is_bounded(check) -> None:
+    """Burst catches up at most ``max_burst`` ticks before skipping."""
+    clock = FakeClock()
+    scheduler = make_scheduler(clock, "burst", [0.01])
+    scheduler.wait()
+    clock.now += 0.055
+    delays = [scheduler.advance() for _ in range(3)]
+    check.that(sum(delays[:2]), "==", 0.0)
+    check.that(delays[2], ">", 0.0)
+    check.that(round(scheduler.deadline, 6), "==", 0.07)
+
+
+def test_scheduler_interval_change_keeps_phase(check) -> None:
+    """A new interval applies from the next deadline onwards."""
+    clock = FakeClock()
+    interval = [0.01]
+    scheduler = make_scheduler(clock, "skip", interval)
+    scheduler.wait()
+    scheduler.wait()
+    interval[0] = 0.1
+    scheduler.wait()
+    check.that(round(clock.now, 6), "==", 0.12)
+
+
+def make_rates(clock: FakeClock, policy: str, intervals: dict[str, float]) -> RateScheduler:
+    return RateScheduler(intervals, policy=policy, max_burst=2, clock=clock, sleep=clock.sleep)
+
+
+# Intervals below are powers of two, so the fake clock's sums are exact
+
+
+def test_rate_scheduler_serves_mixed_rates(check) -> None:
+    """Every key ticks at its own rate; keys due together share a wake-up."""
+    clock = FakeClock()
+    rates = make_rates(clock, "skip", {"power": 1 / 1024, "environmental": 1.0, "gps": 1 / 8})
+    counts: Counter[str] = Counter()
+    wakeups = 0
+    while clock.now < 2.0:
+        counts.update(rates.wait())
+        wakeups += 1
+
+    check.that(counts["power"], "==", 2049)
+    check.that(counts["gps"], "==", 17)
+    check.that(counts["environmental"], "==", 3)
+    check.that(wakeups, "==", 2049)
+    check.that(rates.missed, "==", 0)
+
+
+def test_rate_scheduler_interval_change_keeps_other_phases(check) -> None:
+    """A new interval continues from the key's last deadline; other keys are untouched."""
+    clock = FakeClock()
+    rates = make_rates(clock, "skip", {"fast": 1 / 128, "slow": 1.0})
+    first = sorted(rates.wait())
+    check.that(len(first), "==", 2)
+    check.that(first[0], "==", "fast")
+    check.that(first[1], "==", "slow")
+    rates.set_interval("slow", 1 / 16)
+    times: dict[str, list[float]] = {"fast": [], "slow": []}
+    while clock.now < 0.25:
+        for key in rates.wait():
+            times[key].append(clock.now)
+
+    check.that(len(times["slow"]), "==", 4)
+    for i, now in enumerate(times["slow"]):
+        check.that(now, "==", (i + 1) / 16)
+    check.that(len(times["fast"]), "==", 32)
+
+
+def test_rate_scheduler_overrun_policy_per_key(check) -> None:
+    """A late wake-up catches up each key on its own grid, bounded by the burst."""
+    clock = FakeClock()
+    rates = make_rates(clock, "burst", {"fast": 1 / 64, "slow": 1.0})
+    rates.wait()
+    clock.now += 0.1
+    due = [rates.due(), rates.due(), rates.due()]
+
+    for keys in due:
+        check.that(len(keys), "==", 1)
+        check.that(keys[0], "==", "fast")
+    # Two catch-up ticks, then the remaining three are skipped
+    check.that(rates.missed, "==", 5)
+    check.that(round(rates.advance(), 6), "==", 0.009375)
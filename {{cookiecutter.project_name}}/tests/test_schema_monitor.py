@@ -0,0 +1,105 @@
+"""Tests for the monitor whose events are declared in config."""
+
+import pytest
+
+from {{cookiecutter.project_slug}}.schema_monitor import (
+    DEFAULT_EVENTS,
+    SchemaMonitor,
+    compile_sample_logger,
+    parse_events,
+)
+
+EVENTS = [
+    {
+        "name": "battery",
+        "fields": [
+            {"name": "volts", "input": "voltage", "type": "Float64", "unit": "V"},
+            {"name": "state", "input": "status", "type": "UInt8", "values": {"0": "OK"}},
+            {"name": "charging", "input": "current", "type": "Boolean"},
+        ],
+    },
+    {"name": "climate/air", "fields": [{"name": "temperature"}]},
+]
+
+
+def test_schema_monitor_logs_default_events(check, fake_sdk) -> None:
+    """Without configured events the SensorMonitor schema is logged."""
+    monitor = SchemaMonitor({"sensor_name": "schema", "metrics": False}, source_name="schema")
+    monitor.start()
+    monitor.step()
+
+    environmental = monitor.source.environmental
+    check.that(abs(environmental.temperature.get() - monitor.last.temperature), "<", 1e-3)
+    check.that(environmental.status.get(), "==", 0)
+    check.that(abs(monitor.source.power.current.get() - monitor.last.current), "<", 1e-3)
+    check.that(len(monitor.events), "==", len(DEFAULT_EVENTS))
+
+
+@pytest.mark.parametrize("batch_size", [1, 5])
+def test_schema_monitor_logs_configured_events(check, fake_sdk, batch_size: int) -> None:
+    """Configured events log their inputs with the configured types, per sample or per batch."""
+    monitor = SchemaMonitor(
+        {"sensor_name": "battery", "events": EVENTS, "batch_size": batch_size},
+        source_name=f"battery-{batch_size}",
+    )
+    monitor.start()
+    monitor.step()
+
+    battery = monitor.source.battery
+    check.that(abs(battery.volts.get() - monitor.last.voltage), "<", 1e-3)
+    check.that(battery.state.get(), "==", monitor.last.status)
+    check.that(battery.charging.get(), "is", True)
+    check.that(abs(monitor.source.get_event("climate/air").temperature.get() - 20.0), "<=", 5.0)
+    check.that(monitor.get_status()["source"]["samples"], "==", batch_size)
+
+
+def test_schema_monitor_logs_due_events(check, fake_sdk) -> None:
+    """With per-event rates, a step logs only the configured events that are due."""
+    monitor = SchemaMonitor(
+        {"sensor_name": "rated", "events": EVENTS, "event_intervals": {"battery": 0.01}},
+        source_name="rated",
+    )
+    monitor.start()
+    monitor.step(["battery"])
+    monitor.step(["battery", "climate/air"])
+
+    source = fake_sdk.sources["rated"]
+    check.that(source.battery.count, "==", 2)
+    check.that(source.get_event("climate/air").count, "==", 1)
+    check.that(monitor.rates.intervals["climate/air"], "==", 0.1)
+
+
+def test_parse_events_rejects_invalid_events(check, fake_sdk) -> None:
+    """Unknown inputs and types, duplicate names and misplaced value tables are rejected."""
+    invalid = [
+        [],
+        [{"name": "e", "fields": []}],
+        [{"name": "e", "fields": [{"name": "x"}]}],
+        [{"name": "e", "fields": [{"name": "voltage", "type": "String"}]}],
+        [{"name": "e", "fields": [{"name": "voltage", "values": {"0": "OK"}}]}],
+        [{"name": "e", "fields": [{"name": "voltage"}, {"name": "voltage"}]}],
+        [{"name": "self_metrics", "fields": [{"name": "voltage"}]}],
+    ]
+    for events in invalid:
+        with pytest.raises(ValueError):
+            parse_events(events)
+    with pytest.raises(ValueError, match="not supported"):
+        SchemaMonitor({"events": EVENTS, "deadband": {"enabled": True}})
+    values = parse_events(EVENTS)[0][1][1][4]
+    check.that(len(values), "==", 1)
+    check.that(values[0], "==", "OK")
+
+
+def test_compile_sample_logger_embeds_names_safely(check) -> None:
+    """Event and field names from config become literals in the generated code."""
+    name = "x'); raise SystemExit('"
+    events = parse_events([{"name": name, "fields": [{"name": name, "input": "status"}]}])
+    logged = []
+    log_sample = compile_sample_logger(events, lambda *args: logged.append(args))
+    log_sample(1, 20.0, 1013.0, 12.0, 2.5, 2)
+    check.that(len(logged), "==", 1)
+    time_ns, event, data = logged[0]
+    check.that(time_ns, "==", 1)
+    check.that(event, "==", name)
+    check.that(len(data), "==", 1)
+    check.that(data[name], "==", 2)
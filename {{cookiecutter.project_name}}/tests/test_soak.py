@@ -0,0 +1,97 @@
+"""Soak test and memory watch tests.
+
+``just soak SECONDS`` runs the soak test for longer (``SOAK_SECONDS``); CI runs it
+for five minutes and fails when traced memory grows past ``SOAK_MAX_GROWTH_MB``.
+"""
+
+import gc
+import os
+import threading
+import time
+import tracemalloc
+
+from {{cookiecutter.project_slug}}.extension import SensorMonitor
+from {{cookiecutter.project_slug}}.utils.memory import MemoryWatch, tune_gc
+
+SOAK_SECONDS = float(os.environ.get("SOAK_SECONDS", "2"))
+SOAK_MAX_GROWTH_MB = float(os.environ.get("SOAK_MAX_GROWTH_MB", "1"))
+
+
+def test_soak_memory_is_bounded(check, fake_sdk) -> None:
+    """Running the loop doesn't grow traced memory past the soak threshold."""
+    monitor = SensorMonitor(
+        {
+            "sensor_name": "soak",
+            "interval": 0.002,
+            "metrics_interval": 0.1,
+            "soak": {
+                "enabled": True,
+                "interval": SOAK_SECONDS / 8,
+                "max_growth_mb": SOAK_MAX_GROWTH_MB,
+                "tracemalloc": True,
+            },
+        },
+        source_name="soak",
+    )
+    thread = threading.Thread(target=monitor.run, daemon=True)
+    monitor.start()
+    thread.start()
+    time.sleep(SOAK_SECONDS)
+    memory = monitor.get_status()["memory"]
+    monitor.stop()
+    thread.join(5.0)
+
+    check.that(memory["samples"], ">=", 4)
+    check.that(memory["traced_growth_mb"], "<", SOAK_MAX_GROWTH_MB)
+    check.that(memory["exceeded"], "is", False)
+    check.that(fake_sdk.sources["soak"].memory.count, ">=", memory["samples"])
+
+
+def test_memory_watch_reports_growing_allocators(check) -> None:
+    """Growth past the limit is flagged and traced back to the allocating line."""
+    watch = MemoryWatch(interval=3600.0, max_growth_mb=0.5, trace_allocations=True)
+    watch.start()
+    try:
+        check.that(watch.sample(), "is", None)
+        leak = [bytearray(1024) for _ in range(1024)]
+        sample = watch.sample()
+    finally:
+        watch.stop()
+
+    check.that(sample["traced_growth_mb"], ">=", 1.0)
+    check.that(sample["top"][0]["location"], "contains", "test_soak.py")
+    check.that(watch.exceeded, "is", True)
+    check.that(len(leak), "==", 1024)
+
+
+def test_memory_watch_samples_rss_only_by_default(check) -> None:
+    """Without trace_allocations the watch never starts tracemalloc and limits RSS growth."""
+    watch = MemoryWatch(interval=3600.0, max_growth_mb=0.5)
+    watch.start()
+    try:
+        tracing = tracemalloc.is_tracing()
+        check.that(watch.sample(), "is", None)
+        leak = bytearray(8 * 1024 * 1024)
+        leak[::4096] = b"x" * len(leak[::4096])
+        sample = watch.sample()
+    finally:
+        watch.stop()
+
+    check.that(tracing, "is", False)
+    check.that(sample["traced_mb"], "==", 0.0)
+    check.that(len(sample["top"]), "==", 0)
+    check.that(sample["rss_growth_mb"], ">=", 4.0)
+    check.that(watch.exceeded, "is", True)
+
+
+def test_tune_gc(check) -> None:
+    """GC thresholds and the startup freeze are applied from config."""
+    thresholds = gc.get_threshold()
+    try:
+        tune_gc({"thresholds": [50000, 20], "freeze": True})
+        check.that(gc.get_threshold()[0], "==", 50000)
+        check.that(gc.get_threshold()[1], "==", 20)
+        check.that(gc.get_freeze_count(), ">", 0)
+    finally:
+        gc.unfreeze()
+        gc.set_threshold(*thresholds)
@@ -0,0 +1,107 @@
+"""Tests for sample sources, capture replay and recording."""
+
+from pathlib import Path
+
+import pyarrow as pa
+
+from {{cookiecutter.project_slug}}.extension import SensorMonitor
+from {{cookiecutter.project_slug}}.sources import Recorder, ReplaySource, create_source
+
+
+def test_recorder_round_trip(check, tmp_path: Path) -> None:
+    """Samples appended one at a time and in blocks replay in order with their timestamps."""
+    recorder = Recorder(tmp_path / "capture.arrow", batch_rows=2)
+    recorder.append(1_000, 20.0, 1013.0, 12.0, 2.5)
+    recorder.append(2_000, 21.0, 1014.0, 12.5, 2.0)
+    recorder.append(3_000, 22.0, 1015.0, 11.5, 3.0)
+    recorder.write(
+        pa.array([4_000, 5_000], pa.timestamp("ns", tz="UTC")),
+        *(pa.array([value, value], pa.float32()) for value in (23.0, 1016.0, 12.0, 2.25)),
+    )
+    recorder.close()
+    check.that(recorder.rows, "==", 5)
+    check.that(recorder.batches, "==", 3)
+
+    source = ReplaySource(recorder.path, speed=0)
+    samples = [source.read() for _ in range(5)]
+    check.that(source.read(), "is", None)
+    for i, sample in enumerate(samples):
+        check.that(sample[0], "==", (i + 1) * 1_000)
+    for got, want in zip(samples[2][1:], (22.0, 1015.0, 11.5, 3.0), strict=False):
+        check.that(got, "==", want)
+    check.that(samples[4][4], "==", 2.25)
+    check.that(source.stats()["samples"], "==", 5)
+
+
+def test_replay_csv_paces_by_recorded_time(check, tmp_path: Path) -> None:
+    """Periods follow the recorded timestamps divided by the speed."""
+    path = tmp_path / "capture.csv"
+    path.write_text(
+        "time,temperature,pressure,voltage,current\n"
+        "100.0,20,1013,12,2.5\n"
+        "100.5,21,1013,12,2.5\n"
+        "101.5,22,1013,12,2.5\n"
+        "102.0,23,1013,12,2.5\n"
+    )
+    source = create_source({"type": "replay", "path": str(path), "speed": 2.0})
+    check.that(source.paced, "is", True)
+
+    check.that(source.read()[0], "==", 100_000_000_000)
+    check.that(source.period(0.1, 1), "==", 0.25)
+
+    time_ns, temp, *_ = source.read_batch(2, 0.1)
+    times = time_ns.cast(pa.int64()).to_pylist()
+    check.that(len(times), "==", 2)
+    check.that(times[0], "==", 100_500_000_000)
+    check.that(times[1], "==", 101_500_000_000)
+    check.that(temp[0].as_py(), "==", 21.0)
+    check.that(temp[1].as_py(), "==", 22.0)
+    check.that(source.period(0.1, 2), "==", 0.75)
+
+    source.read_batch(2, 0.1)
+    check.that(source.read_batch(2, 0.1), "is", None)
+
+
+def test_replay_loop_keeps_timestamps_increasing(check, tmp_path: Path) -> None:
+    """A looping replay restarts shifted by the file span plus one sample gap."""
+    path = tmp_path / "capture.csv"
+    path.write_text(
+        "time_ns,temperature,pressure,voltage,current\n10,20,1013,12,2.5\n20,21,1013,12,2.5\n"
+    )
+    source = ReplaySource(path, speed=0, loop=True)
+    times = [source.read()[0] for _ in range(5)]
+    for i, time_ns in enumerate(times):
+        check.that(time_ns, "==", (i + 1) * 10)
+    check.that(source.loops, "==", 2)
+
+
+def test_monitor_records_and_replays_at_max_speed(check, fake_sdk, tmp_path: Path) -> None:
+    """A recorded run replays completely, as fast as possible, then stops the monitor."""
+    path = tmp_path / "recording.arrow"
+    recorder = SensorMonitor(
+        {"sensor_name": "record", "metrics": False, "record": {"enabled": True, "path": str(path)}},
+        source_name="record",
+    )
+    recorder.start()
+    for _ in range(25):
+        recorder.step()
+    recorder.close()
+
+    replay = SensorMonitor(
+        {
+            "sensor_name": "replay",
+            "metrics": False,
+            "batch_size": 10,
+            "source": {"type": "replay", "path": str(path), "speed": 0},
+        },
+        source_name="replay",
+    )
+    replay.start()
+    replay.run()
+
+    status = replay.get_status()
+    check.that(replay.running, "is", False)
+    check.that(status["source"]["samples"], "==", 25)
+    check.that(status["source"]["position"], "==", 25)
+    check.that(replay.scheduler.ticks, "==", 0)
+    check.that(abs(status["temperature"] - recorder.last.temperature), "<", 1e-4)
@@ -0,0 +1,137 @@
+"""Tests for the store-and-forward disk spool, against a stallable trace source."""
+
+import threading
+import time
+from typing import Any
+
+from {{cookiecutter.project_slug}}.extension import SensorMonitor
+from {{cookiecutter.project_slug}}.utils.spool import HEADER, DiskSpool
+
+# Four "<qf" records (12 bytes each) per segment
+SEGMENT_BYTES = HEADER.size + 4 * 12
+
+
+def wait_until(condition, timeout: float = 5.0) -> bool:
+    """Poll ``condition`` until it holds or ``timeout`` seconds pass."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def check_records(check, records: list[tuple], expected: list[tuple]) -> None:
+    """The spooled ``(time_ns, value)`` records are ``expected``, in order."""
+    check.that(len(records), "==", len(expected))
+    for (time_ns, value), (want_time_ns, want_value) in zip(records, expected, strict=False):
+        check.that(time_ns, "==", want_time_ns)
+        check.that(value, "==", want_value)
+
+
+def test_spool_round_trip_and_reopen(check, tmp_path) -> None:
+    """Records come back oldest first across segments and survive reopening."""
+    spool = DiskSpool(tmp_path, "<qf", segment_bytes=SEGMENT_BYTES)
+    for i in range(10):
+        spool.put(i, float(i))
+    check.that(spool.depth, "==", 10)
+    check.that(spool.stats()["segments"], "==", 3)
+
+    records, end = spool.peek(6)
+    check_records(check, records, [(i, float(i)) for i in range(6)])
+    # Peeking again returns the same records until they are committed
+    check_records(check, spool.peek(6)[0], records)
+    spool.commit(end)
+    check.that(spool.depth, "==", 4)
+    check.that(spool.stats()["segments"], "==", 2)
+    spool.close()
+
+    spool = DiskSpool(tmp_path, "<qf", segment_bytes=SEGMENT_BYTES)
+    records, end = spool.peek(10)
+    check_records(check, records, [(i, float(i)) for i in range(6, 10)])
+    spool.commit(end)
+    spool.put(10, 10.0)
+    check_records(check, spool.peek(10)[0], [(10, 10.0)])
+    spool.close()
+
+
+def test_spool_size_and_age_limits(check, tmp_path) -> None:
+    """The oldest segments are dropped, and counted, past the size or age limit."""
+    spool = DiskSpool(tmp_path / "size", "<qf", SEGMENT_BYTES, max_bytes=2 * SEGMENT_BYTES)
+    for i in range(12):
+        spool.put(i, 0.0)
+    records, end = spool.peek(1)
+    check.that(records[0][0], "==", 4)
+    check.that(spool.dropped, "==", 4)
+
+    # A commit for records dropped since the peek skips them
+    for i in range(12, 16):
+        spool.put(i, 0.0)
+    spool.commit(end)
+    check.that(spool.depth, "==", 8)
+
+    spool = DiskSpool(tmp_path / "age", "<qf", SEGMENT_BYTES, max_age=0.01)
+    for i in range(5):
+        spool.put(i, 0.0)
+    time.sleep(0.05)
+    check_records(check, spool.peek(10)[0], [(4, 0.0)])
+    check.that(spool.stats()["dropped"], "==", 4)
+
+
+def run_stalled(
+    fake_sdk, tmp_path, name: str, error: Exception | None
+) -> tuple[SensorMonitor, dict[str, Any], bool]:
+    """Run a spooling monitor through a 0.5 s logging stall and wait for the replay.
+
+    :return: The monitor, its spool status during the stall, and whether the replay finished
+    """
+    config = {
+        "sensor_name": name,
+        "interval": 0.005,
+        "metrics": False,
+        "buffer_capacity": 16,
+        "publish_batch": 16,
+        "spool": {"enabled": True, "path": str(tmp_path), "replay_rate": 5000.0},
+    }
+    monitor = SensorMonitor(config, source_name=name)
+    sink = fake_sdk.sources[name]
+    monitor.start()
+    thread = threading.Thread(target=monitor.run)
+    thread.start()
+    time.sleep(0.1)
+
+    sink.stall(error)
+    time.sleep(0.5)
+    status = monitor.get_status()["spool"]
+    sink.resume()
+    replayed = wait_until(lambda: monitor.spool.depth == 0)
+    monitor.stop()
+    thread.join()
+    return monitor, status, replayed
+
+
+def check_replayed(check, fake_sdk, name: str, error: Exception | None, tmp_path) -> None:
+    """Every sample was logged once, spooled ones late with their original timestamps."""
+    monitor, status, replayed = run_stalled(fake_sdk, tmp_path, name, error)
+    environmental = fake_sdk.sources[name].environmental
+    times = environmental.times[: environmental.recorded]
+    check.that(replayed, "is", True)
+    check.that(status["state"], "==", "spooling")
+    check.that(status["depth"], ">", 0)
+    check.that(monitor.spool.dropped, "==", 0)
+    check.that(environmental.count, "==", monitor.data_source.stats()["samples"])
+    check.that(fake_sdk.sources[name].power.count, "==", environmental.count)
+    check.that(len(set(times)), "==", len(times))
+    # Replayed samples arrive after live ones, so some timestamps go backwards
+    backwards = sum(1 for earlier, later in zip(times, times[1:], strict=False) if later < earlier)
+    check.that(backwards, ">", 0)
+
+
+def test_monitor_spools_while_logging_blocks(check, fake_sdk, tmp_path) -> None:
+    """A blocked log call fills the ring buffer, then acquisition spools to disk."""
+    check_replayed(check, fake_sdk, "spool-block", None, tmp_path)
+
+
+def test_monitor_spools_while_logging_fails(check, fake_sdk, tmp_path) -> None:
+    """Batches that fail to log are spooled and replayed once logging recovers."""
+    check_replayed(check, fake_sdk, "spool-error", ConnectionError("agent down"), tmp_path)
@@ -0,0 +1,32 @@
+"""Tests for data-driven status rules."""
+
+from {{cookiecutter.project_slug}}.extension import SensorMonitor
+from {{cookiecutter.project_slug}}.utils.status import DEFAULT_STATUS_RULES, StatusEvaluator
+
+
+def test_status_default_thresholds(check) -> None:
+    """The default rules reproduce the WARNING >25 / ERROR >30 thresholds."""
+    rules = StatusEvaluator(DEFAULT_STATUS_RULES, SensorMonitor.STATUS)
+    check.that(rules.stateless, "==", True)
+    check.that(rules.update(25.0), "==", 0)
+    check.that(rules.update(25.5), "==", 1)
+    check.that(rules.update(30.5), "==", 2)
+    check.that(rules.update(20.0), "==", 0)
+
+
+def test_status_hysteresis(check) -> None:
+    """A status is held until the value falls below threshold minus hysteresis."""
+    rules = StatusEvaluator(
+        [
+            {"status": "WARNING", "above": 25.0, "hysteresis": 1.0},
+            {"status": "ERROR", "above": 30.0, "hysteresis": 2.0},
+        ],
+        SensorMonitor.STATUS,
+    )
+    check.that(rules.stateless, "==", False)
+    check.that(rules.update(30.5), "==", 2)
+    check.that(rules.update(28.5), "==", 2)
+    check.that(rules.update(27.5), "==", 1)
+    check.that(rules.update(24.5), "==", 1)
+    check.that(rules.update(24.0), "==", 0)
+    check.that(rules.update(24.5), "==", 0)
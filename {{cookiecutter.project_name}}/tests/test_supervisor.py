@@ -0,0 +1,68 @@
+"""Tests for the multi-process sensor supervisor."""
+
+import threading
+import time
+
+import pytest
+
+from {{cookiecutter.project_slug}}.supervisor import ProcessSupervisor
+
+CONFIG = {
+    "sensor_name": "host",
+    "interval": 0.01,
+    "workers": 2,
+    "sensors": [
+        {"sensor_name": "shard-a"},
+        {"sensor_name": "shard-b"},
+        {"sensor_name": "shard-c", "interval": 0.02},
+    ],
+}
+
+
+def test_supervisor_shards_sensors_round_robin(check) -> None:
+    """Sensors are spread over the workers and routed by name."""
+    supervisor = ProcessSupervisor(CONFIG)
+    check.that(len(supervisor.shards), "==", 2)
+    check.that(supervisor.assignment["shard-a"], "==", 0)
+    check.that(supervisor.assignment["shard-b"], "==", 1)
+    check.that(supervisor.assignment["shard-c"], "==", 0)
+
+    single = ProcessSupervisor({**CONFIG, "workers": 8})
+    check.that(len(single.shards), "==", 3)
+
+
+def test_supervisor_rejects_pipeline_before_starting_workers() -> None:
+    """A sensor enabling the pipeline fails in the supervisor, not in a worker."""
+    sensors = [*CONFIG["sensors"], {"sensor_name": "shard-d", "pipeline": True}]
+    with pytest.raises(ValueError, match="only supported in sync mode"):
+        ProcessSupervisor({**CONFIG, "sensors": sensors})
+
+
+def test_supervisor_forwards_actions_and_stops_workers(check) -> None:
+    """Actions reach the worker owning a sensor and stop ends every worker."""
+    supervisor = ProcessSupervisor(CONFIG, grace_seconds=5.0)
+    supervisor.start()
+    runner = threading.Thread(target=supervisor.run)
+    runner.start()
+    try:
+        result = supervisor.set_interval(0.05, sensor="shard-b")
+        check.that(result["sensors"][0], "==", "shard-b")
+
+        status = supervisor.get_status()
+        check.that(len(status["workers"]), "==", 2)
+        check.that(status["sensors"]["shard-a"]["interval"], "==", 0.01)
+        check.that(status["sensors"]["shard-b"]["interval"], "==", 0.05)
+
+        # A worker count change needs a restart, and stays reported until then
+        for _ in range(2):
+            result = supervisor.apply_config({**CONFIG, "workers": 3})
+            check.that("workers", "in", result["restart_required"])
+        check.that(supervisor.config["workers"], "==", 2)
+    finally:
+        start = time.monotonic()
+        supervisor.stop()
+        runner.join(timeout=10)
+
+    check.that(runner.is_alive(), "==", False)
+    check.that(time.monotonic() - start, "<", 4.0)
+    check.that(sum(process.exitcode for process in supervisor.processes), "==", 0)
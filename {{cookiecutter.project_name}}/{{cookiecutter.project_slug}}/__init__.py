@@ -3,8 +3,35 @@
 A Zelos extension for sensor monitoring.
 """
 
-from {{cookiecutter.project_slug}}.extension import SensorMonitor
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from {{cookiecutter.project_slug}}.async_monitor import AsyncSensorMonitor
+    from {{cookiecutter.project_slug}}.extension import SensorMonitor
+
+# Module defining each export, imported on first access (see utils/__init__.py)
+_EXPORTS = {
+    "AsyncSensorMonitor": "async_monitor",
+    "SensorMonitor": "extension",
+}
 
 __all__: list[str] = [
+    "AsyncSensorMonitor",
     "SensorMonitor",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import an export from its module on first access.
+
+    :param name: Export name
+    :return: The exported object
+    :raises AttributeError: If ``name`` isn't an export
+    """
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,269 @@
+"""Asyncio runner hosting many sensors on one event loop."""
+
+import asyncio
+import logging
+from collections.abc import Mapping
+from typing import Any
+
+import zelos_sdk
+
+from {{cookiecutter.project_slug}}.extension import SensorMonitor
+from {{cookiecutter.project_slug}}.utils.config import ConfigSnapshot
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncSensorMonitor:
+    """Runs many sensors as coroutines on a single asyncio event loop.
+
+    Each entry in the ``sensors`` config list becomes a :class:`SensorMonitor`
+    with its own interval, scheduler and ``TraceSourceCacheLast`` (named after
+    the sensor). Sensor entries inherit every top-level setting they don't
+    override. With no ``sensors`` configured, a single sensor is built from the
+    top-level config and logs to the default source.
+    """
+
+    def __init__(self, config: Mapping[str, Any]) -> None:
+        """Initialize the monitor and all of its sensors.
+
+        :param config: Configuration from config.json
+        :raises ValueError: If two sensors share the same name, or a sensor
+            enables the pipeline or the spool
+        """
+        self.config = ConfigSnapshot(config)
+        self.running = False
+        self.sensors: dict[str, SensorMonitor] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._tasks: list[asyncio.Task] = []
+
+        sensors = self.config.get("sensors") or []
+        # Check every sensor before any of them opens its source or spool
+        check_supported(self.config)
+        for sensor in sensors:
+            check_supported({**self.config, **sensor})
+        if not sensors:
+            name = self.config.get("sensor_name", "sensor")
+            self.sensors[name] = SensorMonitor(self.config)
+        for sensor in sensors:
+            sensor_config = {**self.config, **sensor}
+            name = sensor_config["sensor_name"]
+            if name in self.sensors:
+                raise ValueError(f"Duplicate sensor name: {name}")
+            self.sensors[name] = SensorMonitor(sensor_config, source_name=name)
+
+    def start(self) -> None:
+        """Start all sensors."""
+        logger.info(f"Starting {len(self.sensors)} sensor(s)")
+        for monitor in self.sensors.values():
+            monitor.start()
+        self.running = True
+
+    def stop(self) -> None:
+        """Stop all sensors and cancel their tasks.
+
+        Safe to call from a signal handler or any thread.
+        """
+        self.running = False
+        for monitor in self.sensors.values():
+            monitor.stop()
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._cancel_tasks)
+
+    async def run(self) -> None:
+        """Run every sensor concurrently until stopped."""
+        self._loop = asyncio.get_running_loop()
+        self._tasks = [
+            asyncio.create_task(self._run_sensor(monitor), name=name)
+            for name, monitor in self.sensors.items()
+        ]
+        try:
+            results = await asyncio.gather(*self._tasks, return_exceptions=True)
+            for name, result in zip(self.sensors, results, strict=True):
+                if isinstance(result, Exception):
+                    logger.error(f"Sensor {name} failed: {result!r}")
+        finally:
+            self._loop = None
+            self._tasks = []
+
+    async def _run_sensor(self, monitor: SensorMonitor) -> None:
+        """Sample one sensor on its own deadline schedule, then close it.
+
+        :param monitor: Sensor to drive
+        """
+        paced = monitor.data_source.paced
+        rates = monitor.rates if paced else None
+        metrics = monitor.metrics
+        try:
+            while monitor.running:
+                if rates is not None:
+                    # Per-event rates: sleep until the next event is due, then log the due ones
+                    delay = rates.advance()
+                    await asyncio.sleep(delay)
+                    rates.woke(delay)
+                    if metrics is not None:
+                        metrics.record_overshoot(rates.overshoot)
+                    monitor.step(rates.due())
+                    continue
+                monitor.step()
+                # Always yield, even when catching up, so other sensors keep running
+                scheduler = monitor.scheduler
+                delay = scheduler.advance()
+                await asyncio.sleep(delay)
+                if paced:
+                    scheduler.woke(delay)
+                    if metrics is not None:
+                        metrics.record_overshoot(scheduler.overshoot)
+        finally:
+            # Also on cancellation by stop(): log the last aggregation windows
+            monitor.close()
+
+    def apply_config(self, config: Mapping[str, Any]) -> dict[str, Any]:
+        """Switch every sensor to a new configuration without restarting.
+
+        Sensors keep their own overrides from the ``sensors`` list. Adding,
+        removing or renaming sensors needs a restart.
+
+        :param config: New configuration (validated, with schema defaults applied)
+        :return: Dictionary with keys:
+            - applied (list[str]): Changed settings now in effect on any sensor
+            - restart_required (list[str]): Changed settings that need a restart
+        :raises ValueError: If a status rule or the overrun policy is invalid
+        """
+        entries = {
+            sensor.get("sensor_name", config.get("sensor_name", "sensor")): sensor
+            for sensor in config.get("sensors") or []
+        }
+        applied: set[str] = set()
+        restart: set[str] = set()
+        if entries and set(entries) != set(self.sensors):
+            restart.add("sensors")
+        for name, monitor in self.sensors.items():
+            if not entries:
+                sensor_config = config
+            elif name in entries:
+                sensor_config = {**config, **entries[name]}
+            else:
+                continue
+            result = monitor.apply_config(sensor_config)
+            applied.update(result["applied"])
+            restart.update(result["restart_required"])
+        self.config = ConfigSnapshot(config)
+        return {"applied": sorted(applied), "restart_required": sorted(restart)}
+
+    def _cancel_tasks(self) -> None:
+        """Cancel all sensor tasks (runs on the event loop)."""
+        for task in self._tasks:
+            task.cancel()
+
+    @zelos_sdk.action("Set Interval", "Change sample rate")
+    @zelos_sdk.action.number(
+        "seconds",
+        minimum=0.001,
+        maximum=1.0,
+        multiple_of=0.001,
+        default=0.1,
+        title="Interval (seconds)",
+        description="Sample interval from 1kHz to 1Hz",
+        widget="range",
+    )
+    @zelos_sdk.action.text(
+        "sensor",
+        required=False,
+        title="Sensor",
+        description="Sensor name (leave empty for all sensors)",
+    )
+    def set_interval(self, seconds: float, sensor: str = "") -> dict[str, Any]:
+        """Update the sample interval of one or all sensors.
+
+        :param seconds: New interval in seconds (0.001 to 1.0)
+        :param sensor: Sensor name, or empty for all sensors
+        :return: Confirmation dictionary with keys:
+            - message (str): Success message
+            - interval (float): The new interval value
+            - sensors (list[str]): Names of the updated sensors
+        :raises ValueError: If the sensor name is unknown
+        """
+        if sensor and sensor not in self.sensors:
+            raise ValueError(f"Unknown sensor: {sensor}")
+        names = [sensor] if sensor else list(self.sensors)
+        for name in names:
+            self.sensors[name].set_interval(seconds)
+        return {"message": f"Interval set to {seconds}s", "interval": seconds, "sensors": names}
+
+    @zelos_sdk.action("Set Event Interval", "Change the sample rate of one event")
+    @zelos_sdk.action.text(
+        "event",
+        title="Event",
+        description="Event name, e.g. power or environmental",
+    )
+    @zelos_sdk.action.number(
+        "seconds",
+        minimum=0.001,
+        maximum=3600.0,
+        default=1.0,
+        title="Interval (seconds)",
+        description="Seconds between samples of this event",
+    )
+    @zelos_sdk.action.text(
+        "sensor",
+        required=False,
+        title="Sensor",
+        description="Sensor name (leave empty for all sensors)",
+    )
+    def set_event_interval(self, event: str, seconds: float, sensor: str = "") -> dict[str, Any]:
+        """Update the sample interval of one event on one or all sensors.
+
+        :param event: Event name
+        :param seconds: New interval in seconds
+        :param sensor: Sensor name, or empty for all sensors
+        :return: Confirmation dictionary with keys:
+            - message (str): Success message
+            - interval (float): The new interval value
+            - sensors (list[str]): Names of the updated sensors
+        :raises ValueError: If the sensor name is unknown, or per-event rates are
+            disabled or the event is unknown on a sensor
+        """
+        if sensor and sensor not in self.sensors:
+            raise ValueError(f"Unknown sensor: {sensor}")
+        names = [sensor] if sensor else list(self.sensors)
+        for name in names:
+            self.sensors[name].set_event_interval(event, seconds)
+        return {
+            "message": f"{event} interval set to {seconds}s",
+            "interval": seconds,
+            "sensors": names,
+        }
+
+    @zelos_sdk.action("Get Status", "Get current sensor status")
+    def get_status(self) -> dict[str, Any]:
+        """Get current status of every sensor.
+
+        :return: Status dictionary with per-sensor values
+        """
+        return {
+            "running": self.running,
+            "sensors": {name: monitor.get_status() for name, monitor in self.sensors.items()},
+        }
+
+    @zelos_sdk.action("Get Metrics", "Get hot-loop performance metrics")
+    def get_metrics(self) -> dict[str, Any]:
+        """Get performance metrics of every sensor.
+
+        :return: Metrics dictionary with per-sensor values
+        """
+        return {name: monitor.get_metrics() for name, monitor in self.sensors.items()}
+
+
+def check_supported(config: Mapping[str, Any]) -> None:
+    """Reject features that need the sync monitor's own threads.
+
+    Async and multiprocess modes step each sensor on the event loop, so the
+    acquisition thread, ring buffer and spool never run.
+
+    :param config: Configuration of one sensor
+    :raises ValueError: If the pipeline or the spool is enabled
+    """
+    if config.get("pipeline", False):
+        raise ValueError("pipeline is only supported in sync mode")
+    if config.get("spool", {}).get("enabled", False):
+        raise ValueError("spool is only supported in sync mode")
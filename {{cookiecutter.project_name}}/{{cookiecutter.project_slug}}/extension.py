@@ -1,14 +1,88 @@
 """Example Sensor monitoring implementation."""
 
 import logging
-import random
+import threading
 import time
+from collections.abc import Collection, Mapping
+from pathlib import Path
 from typing import Any
 
+import pyarrow as pa
+import pyarrow.compute as pc
 import zelos_sdk
 
+from {{cookiecutter.project_slug}}.sources import Recorder, create_source
+from {{cookiecutter.project_slug}}.sources.base import FIELDS
+from {{cookiecutter.project_slug}}.utils.aggregate import WindowAggregator, WindowSummary
+from {{cookiecutter.project_slug}}.utils.config import ConfigSnapshot
+from {{cookiecutter.project_slug}}.utils.deadband import DeadbandFilter
+from {{cookiecutter.project_slug}}.utils.derived import DerivedChannels
+from {{cookiecutter.project_slug}}.utils.memory import MB, MemoryWatch
+from {{cookiecutter.project_slug}}.utils.metrics import LoopMetrics
+from {{cookiecutter.project_slug}}.utils.ring_buffer import RingBuffer
+from {{cookiecutter.project_slug}}.utils.scheduler import (
+    OVERRUN_POLICIES,
+    DeadlineScheduler,
+    RateScheduler,
+)
+from {{cookiecutter.project_slug}}.utils.spool import DiskSpool
+from {{cookiecutter.project_slug}}.utils.status import (
+    DEFAULT_STATUS_RULES,
+    LastValues,
+    StatusEvaluator,
+)
+
 logger = logging.getLogger(__name__)
 
+# Ring buffer record: time_ns, temperature, pressure, voltage, current
+RECORD_FORMAT = "<qffff"
+
+# Values a field can log: the sample fields and the evaluated status
+INPUTS = (*FIELDS, "status")
+
+# Input behind each field of the SensorMonitor events, for derived channel expressions
+EVENT_FIELDS = {
+    "environmental.temperature": "temperature",
+    "environmental.pressure": "pressure",
+    "environmental.status": "status",
+    "power.voltage": "voltage",
+    "power.current": "current",
+}
+
+# Fields compared by the deadband filter, per event
+DEADBAND_FIELDS = {
+    "environmental": ("temperature", "pressure", "status"),
+    "power": ("voltage", "current"),
+}
+
+# Fields (and units) summarized in the <event>_agg events
+AGGREGATE_FIELDS = {
+    "environmental": (("temperature", "°C"), ("pressure", "hPa")),
+    "power": (("voltage", "V"), ("current", "A")),
+}
+
+# Settings that shape the pipeline, source or trace schema; changing them needs a restart
+RESTART_SETTINGS = (
+    "backpressure_policy",
+    "buffer_capacity",
+    "derived",
+    "events",
+    "logging",
+    "metrics",
+    "mode",
+    "pipeline",
+    "record",
+    "sensor_name",
+    "sensors",
+    "soak",
+    "source",
+    "spool",
+    "workers",
+)
+
+# Seconds between throughput reports while replaying unpaced (as fast as possible)
+PROGRESS_INTERVAL = 5.0
+
 
 class SensorMonitor:
     """Monitors sensor data and streams to Zelos."""
@@ -19,67 +93,811 @@ class SensorMonitor:
         2: "ERROR",
     }
 
-    def __init__(self, config: dict[str, Any]) -> None:
+    def __init__(self, config: Mapping[str, Any], source_name: str | None = None) -> None:
         """Initialize the sensor monitor.
 
         :param config: Configuration from config.json
+        :param source_name: Trace source name (defaults to the extension name)
         """
-        self.config = config
+        # Immutable snapshot, replaced as a whole on every change (see apply_config)
+        self.config = ConfigSnapshot(config)
+        self._config_lock = threading.Lock()
         self.running = False
+        self._loop_count = 0
+        self.last = LastValues()
+        # Status of each sample is evaluated from the temperature before it
+        self.status_rules = StatusEvaluator(
+            self.config.get("status_rules", DEFAULT_STATUS_RULES), self.STATUS
+        )
+        self.scheduler = DeadlineScheduler(
+            self._period, policy=self.config.get("overrun_policy", "skip")
+        )
+
+        # Optional hot-loop instrumentation, published as the self_metrics event
+        self.metrics: LoopMetrics | None = None
+        if self.config.get("metrics", True):
+            self.metrics = LoopMetrics()
+        self._metrics_due = 0.0
+
+        # Optional soak mode: sample memory growth, published as the memory event
+        self.memory_watch: MemoryWatch | None = None
+        soak = self.config.get("soak", {})
+        if soak.get("enabled", False):
+            self.memory_watch = MemoryWatch(
+                soak.get("interval", 60.0),
+                top=soak.get("top", 10),
+                frames=soak.get("frames", 1),
+                max_growth_mb=soak.get("max_growth_mb", 0.0),
+                on_sample=self._publish_memory,
+                trace_allocations=soak.get("tracemalloc", False),
+            )
 
-        self.source = zelos_sdk.TraceSourceCacheLast("{{cookiecutter.project_slug}}")
+        # Optional change-only logging, one filter per event
+        self.deadband = _make_deadband(self.config.get("deadband", {}))
+
+        # Optional two-stage pipeline: acquisition thread -> ring buffer -> publisher
+        self.buffer: RingBuffer | None = None
+        spool = self.config.get("spool", {})
+        if self.config.get("pipeline", False) or spool.get("enabled", False):
+            self.buffer = RingBuffer(
+                RECORD_FORMAT,
+                self.config.get("buffer_capacity", 4096),
+                policy=self.config.get("backpressure_policy", "drop_oldest"),
+            )
+
+        # Optional store-and-forward spool: samples that can't be logged wait on disk
+        # and are replayed, with their original timestamps, once logging recovers
+        self.spool: DiskSpool | None = None
+        if spool.get("enabled", False):
+            self.spool = DiskSpool(
+                Path(spool.get("path", "spool"), source_name or "{{cookiecutter.project_slug}}"),
+                RECORD_FORMAT,
+                segment_bytes=int(spool.get("segment_mb", 4) * MB),
+                max_bytes=int(spool.get("max_mb", 256) * MB),
+                max_age=spool.get("max_age", 86400.0),
+            )
+        # Replayed samples get their status from their own evaluator and previous temperature
+        self._replay_status = StatusEvaluator(
+            self.config.get("status_rules", DEFAULT_STATUS_RULES), self.STATUS
+        )
+        self._replay_temperature: float | None = None
+        self._replay_budget = 0.0
+        self._replay_time = time.monotonic()
+        self._sink_ok = True
+
+        # Optional windowed aggregates, published as <event>_agg events
+        self.aggregators: dict[str, WindowAggregator] | None = None
+        aggregation = self.config.get("aggregation", {})
+        self._publish_raw = True
+        if aggregation.get("enabled", False):
+            self.aggregators = {
+                event: WindowAggregator(len(fields), aggregation.get("window", 1.0))
+                for event, fields in AGGREGATE_FIELDS.items()
+            }
+            self._publish_raw = aggregation.get("raw", True)
+
+        # Where samples come from (simulated sensors or a capture file replay),
+        # and optionally a capture file the acquired stream is recorded to
+        self.data_source = create_source(self.config.get("source", {}))
+        self._progress_due = 0.0
+        self.recorder: Recorder | None = None
+        record = self.config.get("record", {})
+        if record.get("enabled", False):
+            self.recorder = Recorder(
+                record.get("path", "recording.arrow"), record.get("batch_rows", 4096)
+            )
+
+        self.source = zelos_sdk.TraceSourceCacheLast(source_name or "{{cookiecutter.project_slug}}")
+        # Timed for main.py --profile-startup
+        start = time.perf_counter()
         self._define_schema()
+        self.schema_seconds = time.perf_counter() - start
+
+        # Optional per-event rates: one heap scheduler paces each event on its own interval
+        self.rates: RateScheduler | None = None
+        if self.config.get("event_intervals"):
+            if self.buffer is not None:
+                raise ValueError("event_intervals is not supported with the pipeline")
+            self.rates = RateScheduler(
+                self._event_intervals(self.config),
+                policy=self.config.get("overrun_policy", "skip"),
+            )
 
     def start(self) -> None:
         """Start monitoring."""
         logger.info(f"Starting {self.config.get('sensor_name', 'sensor')}")
+        self.scheduler.reset()
+        if self.rates is not None:
+            self.rates.reset()
+        if self.derived is not None:
+            self.derived.reset()
+        if self.buffer is not None:
+            self.buffer.reset()
+        if self.metrics is not None:
+            self.metrics.reset()
+            self._metrics_due = time.monotonic() + self.config.get("metrics_interval", 1.0)
+        self._progress_due = time.monotonic() + PROGRESS_INTERVAL
+        if self.memory_watch is not None:
+            self.memory_watch.start()
         self.running = True
 
     def stop(self) -> None:
         """Stop monitoring."""
         logger.info("Stopping monitor")
         self.running = False
+        if self.buffer is not None:
+            self.buffer.close()
 
     def run(self) -> None:
-        """Main monitoring loop."""
-        loop_count = 0
-        while self.running:
-            # Simulate sensor readings
-            temp = 20.0 + random.uniform(-5, 5)
-            pressure = 1013.25 + random.uniform(-10, 10)
-            voltage = 12.0 + random.uniform(-0.5, 0.5)
-            current = 2.5 + random.uniform(-0.3, 0.3)
-
-            # Determine status based on cached temperature
-            status = 0  # OK
-            last_temp = self.source.environmental.temperature.get()
-            if last_temp:
-                if last_temp > 30:
-                    status = 2  # ERROR
-                elif last_temp > 25:
-                    status = 1  # WARNING
-
-            self.source.environmental.log(
+        """Main monitoring loop (runs until stopped or the source is exhausted)."""
+        try:
+            if self.buffer is not None:
+                self._run_pipeline()
+                return
+            if self.rates is not None and self.data_source.paced:
+                self._run_rates()
+                return
+
+            paced = self.data_source.paced
+            while self.running:
+                self.step()
+                if paced:
+                    self.scheduler.wait()
+                    if self.metrics is not None:
+                        self.metrics.record_overshoot(self.scheduler.overshoot)
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Finish the run: log the open aggregation windows and release resources.
+
+        Closes the sample source, the recording and the spool, and stops the memory watch.
+        """
+        if self.aggregators is not None:
+            for event, aggregator in self.aggregators.items():
+                self._aggregate(event, aggregator.flush())
+        self.data_source.close()
+        if self.recorder is not None:
+            self.recorder.close()
+        if self.spool is not None:
+            self.spool.close()
+        if self.memory_watch is not None:
+            self.memory_watch.stop()
+
+    def step(self, due: Collection[str] | None = None) -> None:
+        """Acquire and log one sample (or one batch of samples).
+
+        :param due: Events to log (with per-event rates); None logs every event
+        """
+        metrics = self.metrics
+        if metrics is not None:
+            start = time.perf_counter()
+
+        batch_size = self.config.get("batch_size", 1)
+        if due is None and batch_size > 1:
+            values = self._sample_batch(batch_size)
+        else:
+            values = self._sample(due)
+        if values is None:
+            self._source_exhausted()
+            return
+        self._report(values)
+
+        if metrics is not None:
+            metrics.record_iteration(time.perf_counter() - start)
+            self._publish_metrics()
+
+    def _report(self, values: tuple[float, float, float, float, int]) -> None:
+        """Record the latest values and log a summary of them every 10 loops.
+
+        :param values: Latest (temperature, pressure, voltage, current, status)
+        """
+        self.last.update(values)
+        self._loop_count += 1
+        if not self.data_source.paced:
+            # Replaying as fast as possible: report throughput instead of values
+            now = time.monotonic()
+            if now >= self._progress_due:
+                self._progress_due = now + PROGRESS_INTERVAL
+                logger.info(self._throughput())
+        elif self._loop_count % 10 == 0:
+            temp, pressure, voltage, current, status = values
+            logger.info(
+                f"temp={temp:.1f}°C, pressure={pressure:.1f}hPa, "
+                f"voltage={voltage:.1f}V, current={current:.1f}A, "
+                f"status={self.STATUS[status]}"
+            )
+
+    def _throughput(self) -> str:
+        """Describe the samples read from the source so far and the rate."""
+        stats = self.data_source.stats()
+        return (
+            f"{stats['type']} source: {stats['samples']} samples in {stats['elapsed_s']:.1f}s "
+            f"({stats['samples_per_second']:.0f} samples/s)"
+        )
+
+    def _source_exhausted(self) -> None:
+        """Stop after the last sample of a finite source and report the throughput."""
+        logger.info(f"Source exhausted, {self._throughput()}")
+        self.running = False
+
+    def _period(self) -> float:
+        """Seconds between scheduler ticks (one sample, or one batch)."""
+        interval = self.config.get("interval", 0.1)
+        if self.buffer is not None:
+            return self.data_source.period(interval, 1)
+        return self.data_source.period(interval, self.config.get("batch_size", 1))
+
+    def _event_intervals(self, config: Mapping[str, Any]) -> dict[str, float]:
+        """Get the interval of every event: its ``event_intervals`` entry, else ``interval``.
+
+        :param config: Configuration
+        :return: Seconds between samples, keyed by event
+        :raises ValueError: If ``event_intervals`` names an event that isn't defined
+        """
+        intervals = config.get("event_intervals", {})
+        unknown = sorted(set(intervals) - set(self.rate_events))
+        if unknown:
+            raise ValueError(
+                f"Unknown events in event_intervals: {unknown}, expected {self.rate_events}"
+            )
+        interval = config.get("interval", 0.1)
+        return {event: intervals.get(event, interval) for event in self.rate_events}
+
+    def _sample(
+        self, due: Collection[str] | None = None
+    ) -> tuple[float, float, float, float, int] | None:
+        """Read and log a single sample.
+
+        :param due: Events to log (with per-event rates); None logs every event
+        :return: Logged values as (temperature, pressure, voltage, current, status),
+            or None when the source is exhausted
+        """
+        sample = self.data_source.read()
+        if sample is None:
+            return None
+        time_ns, temp, pressure, voltage, current = sample
+        if self.recorder is not None:
+            self.recorder.append(*sample)
+
+        # Determine status based on the previous temperature
+        last_temp = self.last.temperature
+        status = self.status_rules.update(last_temp) if last_temp is not None else 0
+
+        metrics = self.metrics
+        if metrics is not None:
+            log_start = time.perf_counter()
+
+        deadband = self.deadband
+        aggregators = self.aggregators
+        now = time_ns / 1e9
+
+        environmental_due = due is None or "environmental" in due
+        power_due = due is None or "power" in due
+
+        if aggregators is not None:
+            if environmental_due:
+                self._aggregate(
+                    "environmental", aggregators["environmental"].add(now, temp, pressure)
+                )
+            if power_due:
+                self._aggregate("power", aggregators["power"].add(now, voltage, current))
+
+        # With a deadband, only log events whose values moved (or went quiet too long)
+        publish_raw = self._publish_raw
+        if (
+            publish_raw
+            and environmental_due
+            and (
+                deadband is None
+                or deadband["environmental"].should_log(now, temp, pressure, status)
+            )
+        ):
+            self.source.environmental.log_at(
+                time_ns,
                 temperature=temp,
                 pressure=pressure,
                 status=status,
             )
 
-            self.source.power.log(
+        if (
+            publish_raw
+            and power_due
+            and (deadband is None or deadband["power"].should_log(now, voltage, current))
+        ):
+            self.source.power.log_at(
+                time_ns,
                 voltage=voltage,
                 current=current,
             )
 
-            # Log every 10 loops
-            loop_count += 1
-            if loop_count % 10 == 0:
-                logger.info(
-                    f"temp={temp:.1f}°C, pressure={pressure:.1f}hPa, "
-                    f"voltage={voltage:.1f}V, current={current:.1f}A, "
-                    f"status={self.STATUS[status]}"
+        derived = self.derived
+        if derived is not None:
+            self.source.log_at(
+                time_ns,
+                "derived",
+                derived.evaluate(time_ns, temp, pressure, voltage, current, status),
+            )
+
+        if metrics is not None:
+            metrics.record_log(time.perf_counter() - log_start)
+
+        return temp, pressure, voltage, current, status
+
+    def _sample_batch(self, n: int) -> tuple[float, float, float, float, int] | None:
+        """Read and log up to ``n`` samples with one bulk call per event.
+
+        :param n: Number of samples in the batch
+        :return: Last values as (temperature, pressure, voltage, current, status),
+            or None when the source is exhausted
+        """
+        batch = self.data_source.read_batch(n, self.config.get("interval", 0.1))
+        if batch is None:
+            return None
+        return self._log_batch(*batch)
+
+    def _log_batch(
+        self,
+        time_ns: pa.TimestampArray,
+        temp: pa.FloatArray,
+        pressure: pa.FloatArray,
+        voltage: pa.FloatArray,
+        current: pa.FloatArray,
+    ) -> tuple[float, float, float, float, int]:
+        """Evaluate status and log a batch of samples with one bulk call per event.
+
+        The batch uses the same fields and data types as the per-sample path,
+        so the trace schema is unchanged. With a deadband, rows that did not
+        move enough are filtered out before logging.
+
+        :param time_ns: Sample timestamps
+        :param temp: Temperatures (Float32)
+        :param pressure: Pressures (Float32)
+        :param voltage: Voltages (Float32)
+        :param current: Currents (Float32)
+        :return: Last values as (temperature, pressure, voltage, current, status)
+        """
+        if self.recorder is not None:
+            self.recorder.write(time_ns, temp, pressure, voltage, current)
+
+        # Status of each sample is based on the temperature before it
+        previous = pa.concat_arrays(
+            [pa.array([self.last.temperature], pa.float32()), temp.slice(0, len(temp) - 1)]
+        )
+        status = self._evaluate_status(previous)
+
+        metrics = self.metrics
+        if metrics is not None:
+            log_start = time.perf_counter()
+
+        environmental = pa.record_batch(
+            [time_ns, temp, pressure, status],
+            names=["time_ns", "temperature", "pressure", "status"],
+        )
+        power = pa.record_batch(
+            [time_ns, voltage, current], names=["time_ns", "voltage", "current"]
+        )
+
+        if self.deadband is not None or self.aggregators is not None:
+            times = [t / 1e9 for t in time_ns.cast(pa.int64()).to_pylist()]
+
+        if self.aggregators is not None:
+            environmental_agg = self.aggregators["environmental"]
+            power_agg = self.aggregators["power"]
+            for now, t, p, v, c in zip(
+                times,
+                temp.to_pylist(),
+                pressure.to_pylist(),
+                voltage.to_pylist(),
+                current.to_pylist(),
+                strict=True,
+            ):
+                self._aggregate("environmental", environmental_agg.add(now, t, p))
+                self._aggregate("power", power_agg.add(now, v, c))
+
+        if self.deadband is not None:
+            environmental = environmental.filter(
+                self.deadband["environmental"].mask(
+                    times, temp.to_pylist(), pressure.to_pylist(), status.to_pylist()
+                )
+            )
+            power = power.filter(
+                self.deadband["power"].mask(times, voltage.to_pylist(), current.to_pylist())
+            )
+
+        if self._publish_raw and environmental.num_rows:
+            self.source.log_batch("environmental", environmental)
+        if self._publish_raw and power.num_rows:
+            self.source.log_batch("power", power)
+        if self.derived is not None:
+            self._log_derived(time_ns, (temp, pressure, voltage, current, status))
+
+        if metrics is not None:
+            metrics.record_log(time.perf_counter() - log_start)
+
+        return (
+            temp[-1].as_py(),
+            pressure[-1].as_py(),
+            voltage[-1].as_py(),
+            current[-1].as_py(),
+            status[-1].as_py(),
+        )
+
+    def _log_derived(self, time_ns: pa.TimestampArray, columns: tuple[pa.Array, ...]) -> None:
+        """Evaluate the derived channels over a batch and log them as the derived event.
+
+        :param time_ns: Sample timestamps
+        :param columns: One column per entry of :data:`INPUTS`
+        """
+        outputs = self.derived.evaluate_batch(time_ns, columns)
+        self.source.log_batch(
+            "derived", pa.record_batch([time_ns, *outputs.values()], names=["time_ns", *outputs])
+        )
+
+    def _evaluate_status(
+        self, previous: pa.FloatArray, rules: StatusEvaluator | None = None
+    ) -> pa.UInt8Array:
+        """Evaluate the status rules over a column of previous temperatures.
+
+        Without hysteresis every row is independent and the rules are applied
+        as vectorized comparisons; otherwise rows are evaluated in order.
+
+        :param previous: Temperature before each sample (null for the first sample ever)
+        :param rules: Evaluator to use (defaults to the live ``status_rules``)
+        :return: Status of each sample
+        """
+        rules = rules or self.status_rules
+        if rules.stateless:
+            status = pa.repeat(pa.scalar(0, pa.uint8()), len(previous))
+            # Least severe first, so the most severe matching rule wins
+            for level, above, _ in reversed(rules.rules):
+                status = pc.if_else(
+                    pc.greater(previous, above), pa.scalar(level, pa.uint8()), status
+                )
+            return pc.fill_null(status, 0)
+
+        update = rules.update
+        return pa.array(
+            [update(value) if value is not None else 0 for value in previous.to_pylist()],
+            pa.uint8(),
+        )
+
+    def _aggregate(self, event: str, summary: WindowSummary | None) -> None:
+        """Log a closed aggregation window as the ``<event>_agg`` event.
+
+        :param event: Source event name
+        :param summary: Window summary from the aggregator, or None if still open
+        """
+        if summary is None:
+            return
+        start, count, stats = summary
+        fields: dict[str, float] = {"count": count}
+        for (name, _unit), (low, high, mean) in zip(AGGREGATE_FIELDS[event], stats, strict=True):
+            fields[f"{name}_min"] = low
+            fields[f"{name}_max"] = high
+            fields[f"{name}_mean"] = mean
+        self.source.get_event(f"{event}_agg").log_at(int(start * 1e9), **fields)
+
+    def _run_rates(self) -> None:
+        """Run with per-event rates: read once per wake-up and log only the events due."""
+        rates = self.rates
+        metrics = self.metrics
+        while self.running:
+            due = rates.wait()
+            if metrics is not None:
+                metrics.record_overshoot(rates.overshoot)
+            self.step(due)
+
+    def _run_pipeline(self) -> None:
+        """Run acquisition on a background thread and publish from this one.
+
+        The acquisition thread only reads sensors and packs raw readings into
+        the ring buffer, so a slow ``log()`` call or GC pause in the publisher
+        never delays the next acquisition.
+        """
+        acquisition = threading.Thread(target=self._acquire, name="acquisition", daemon=True)
+        acquisition.start()
+        max_records = self.config.get("publish_batch", 256)
+        publish = self._publish if self.spool is None else self._forward
+        try:
+            while self.running:
+                publish(self.buffer.drain(max_records, timeout=0.1))
+                if self.metrics is not None:
+                    self._publish_metrics()
+        finally:
+            self.buffer.close()
+            acquisition.join()
+            publish(self.buffer.drain(self.buffer.capacity, timeout=0))
+
+    def _acquire(self) -> None:
+        """Acquisition stage: pack timestamped readings into the ring buffer.
+
+        With a spool, readings go to disk instead while the ring buffer is
+        full (the publisher is stalled), so acquisition never blocks or drops.
+        """
+        metrics = self.metrics
+        paced = self.data_source.paced
+        buffer = self.buffer
+        spool = self.spool
+        capacity = buffer.capacity
+        while self.running:
+            if metrics is not None:
+                start = time.perf_counter()
+            sample = self.data_source.read()
+            if sample is None:
+                self._source_exhausted()
+                return
+            # Only this thread adds records, so a buffer below capacity can't fill before put
+            if spool is not None and buffer.depth >= capacity:
+                spool.put(*sample)
+            else:
+                buffer.put(*sample)
+            if metrics is not None:
+                metrics.record_iteration(time.perf_counter() - start)
+            if paced:
+                self.scheduler.wait()
+                if metrics is not None:
+                    metrics.record_overshoot(self.scheduler.overshoot)
+
+    def _publish(self, records: list[tuple[int, float, float, float, float]]) -> None:
+        """Publish stage: log drained ring buffer records as one batch per event.
+
+        :param records: Records as (time_ns, temperature, pressure, voltage, current)
+        """
+        if not records:
+            return
+        time_ns, temp, pressure, voltage, current = zip(*records, strict=True)
+        self._report(
+            self._log_batch(
+                pa.array(time_ns, pa.timestamp("ns", tz="UTC")),
+                pa.array(temp, pa.float32()),
+                pa.array(pressure, pa.float32()),
+                pa.array(voltage, pa.float32()),
+                pa.array(current, pa.float32()),
+            )
+        )
+
+    def _forward(self, records: list[tuple[int, float, float, float, float]]) -> None:
+        """Publish stage with a spool: spool records that fail to log, then replay the backlog.
+
+        Delivery is at least once: a batch that fails part way is spooled whole.
+
+        :param records: Records as (time_ns, temperature, pressure, voltage, current)
+        """
+        spool = self.spool
+        if records:
+            try:
+                self._publish(records)
+            except Exception as e:
+                if self._sink_ok:
+                    logger.warning(f"Logging failed, spooling samples to disk: {e!r}")
+                    self._sink_ok = False
+                for record in records:
+                    spool.put(*record)
+                return
+            if not self._sink_ok:
+                logger.info(f"Logging recovered, replaying {spool.depth} spooled samples")
+                self._sink_ok = True
+        self._replay()
+
+    def _replay(self) -> None:
+        """Log the oldest spooled records, limited to ``spool.replay_rate`` per second.
+
+        Replay only runs while logging works and the ring buffer is less than
+        half full, so live samples always go first.
+        """
+        max_records = self.config.get("publish_batch", 256)
+        now = time.monotonic()
+        rate = self.config.get("spool", {}).get("replay_rate", 1000.0)
+        self._replay_budget = min(
+            self._replay_budget + rate * (now - self._replay_time), max_records
+        )
+        self._replay_time = now
+        count = int(self._replay_budget)
+        if not count or not self._sink_ok or self.buffer.depth > self.buffer.capacity // 2:
+            return
+        records, end = self.spool.peek(count)
+        if not records:
+            return
+        try:
+            self._log_replay(records)
+        except Exception as e:
+            logger.warning(f"Replay failed, keeping samples spooled: {e!r}")
+            self._sink_ok = False
+            return
+        self.spool.commit(end)
+        self._replay_budget -= len(records)
+
+    def _log_replay(self, records: list[tuple[int, float, float, float, float]]) -> None:
+        """Log spooled records as raw events with their original timestamps.
+
+        Replayed samples bypass the live state: deadband, aggregation,
+        derived channels, recording and the last values only follow live
+        samples.
+
+        :param records: Records as (time_ns, temperature, pressure, voltage, current)
+        """
+        time_ns, temp, pressure, voltage, current = zip(*records, strict=True)
+        previous = pa.array([self._replay_temperature, *temp[:-1]], pa.float32())
+        self._replay_temperature = temp[-1]
+        temp = pa.array(temp, pa.float32())
+        self._log_events(
+            pa.array(time_ns, pa.timestamp("ns", tz="UTC")),
+            temp,
+            pa.array(pressure, pa.float32()),
+            pa.array(voltage, pa.float32()),
+            pa.array(current, pa.float32()),
+            self._evaluate_status(previous, self._replay_status),
+        )
+
+    def _log_events(
+        self,
+        time_ns: pa.TimestampArray,
+        temp: pa.FloatArray,
+        pressure: pa.FloatArray,
+        voltage: pa.FloatArray,
+        current: pa.FloatArray,
+        status: pa.UInt8Array,
+    ) -> None:
+        """Log a batch of samples as the raw events, unfiltered.
+
+        :param time_ns: Sample timestamps
+        :param temp: Temperatures (Float32)
+        :param pressure: Pressures (Float32)
+        :param voltage: Voltages (Float32)
+        :param current: Currents (Float32)
+        :param status: Status of each sample
+        """
+        self.source.log_batch(
+            "environmental",
+            pa.record_batch(
+                [time_ns, temp, pressure, status],
+                names=["time_ns", "temperature", "pressure", "status"],
+            ),
+        )
+        self.source.log_batch(
+            "power",
+            pa.record_batch([time_ns, voltage, current], names=["time_ns", "voltage", "current"]),
+        )
+
+    def _spool_status(self) -> dict[str, Any]:
+        """Get spool depth and replay progress.
+
+        :return: DiskSpool stats plus state (``spooling`` while logging fails or
+            stalls, ``replaying`` while a backlog remains, else ``live``), replay_rate
+            and replay_eta_s (seconds to replay the backlog at replay_rate)
+        """
+        stats = self.spool.stats()
+        rate = self.config.get("spool", {}).get("replay_rate", 1000.0)
+        if not self._sink_ok or self.buffer.depth >= self.buffer.capacity:
+            state = "spooling"
+        elif stats["depth"]:
+            state = "replaying"
+        else:
+            state = "live"
+        return {
+            **stats,
+            "state": state,
+            "replay_rate": rate,
+            "replay_eta_s": stats["depth"] / rate if rate else None,
+        }
+
+    def _publish_metrics(self) -> None:
+        """Log the self_metrics event once per metrics interval."""
+        now = time.monotonic()
+        if now < self._metrics_due:
+            return
+        self._metrics_due = now + self.config.get("metrics_interval", 1.0)
+
+        snapshot = self.metrics.snapshot(reset=True)
+        self.source.self_metrics.log(
+            iteration_rate=snapshot["iteration_rate"],
+            iteration_mean_us=snapshot["iteration_mean_us"],
+            iteration_p99_us=snapshot["iteration_p99_us"],
+            iteration_max_us=snapshot["iteration_max_us"],
+            log_mean_us=snapshot["log_mean_us"],
+            sleep_overshoot_mean_us=snapshot["sleep_overshoot_mean_us"],
+            sleep_overshoot_max_us=snapshot["sleep_overshoot_max_us"],
+            missed_deadlines=self._missed_deadlines(),
+            queue_depth=self.buffer.depth if self.buffer is not None else 0,
+            rss_mb=snapshot["rss_mb"],
+            cpu_percent=snapshot["cpu_percent"],
+        )
+
+    def _missed_deadlines(self) -> int:
+        """Count the ticks missed by the scheduler in use."""
+        return self.rates.missed if self.rates is not None else self.scheduler.missed
+
+    def _publish_memory(self, sample: dict[str, Any]) -> None:
+        """Log a memory watch sample as the memory event (called on the watch thread).
+
+        :param sample: Sample from :meth:`MemoryWatch.sample`
+        """
+        top = sample["top"]
+        self.source.memory.log(
+            traced_mb=sample["traced_mb"],
+            traced_growth_mb=sample["traced_growth_mb"],
+            rss_mb=sample["rss_mb"],
+            rss_growth_mb=sample["rss_growth_mb"],
+            top_growth_kb=top[0]["size_kb"] if top else 0.0,
+        )
+
+    def apply_config(self, config: Mapping[str, Any]) -> dict[str, Any]:
+        """Switch to a new configuration without restarting.
+
+        Settings read per tick (interval, event intervals, batch size, status
+        rules, deadband, aggregation window and raw publishing, overrun policy,
+        metrics interval) take effect on the next tick, keeping the trace
+        source, the last values and the loop phase. Settings in
+        ``RESTART_SETTINGS``, and turning aggregation or per-event rates on or
+        off, keep their running values and are reported instead.
+
+        :param config: New configuration (validated, with schema defaults applied)
+        :return: Dictionary with keys:
+            - applied (list[str]): Changed settings now in effect
+            - restart_required (list[str]): Changed settings that need a restart
+        :raises ValueError: If a status rule, the overrun policy or an event interval is invalid
+        """
+        with self._config_lock:
+            old = self.config
+            new = dict(ConfigSnapshot(config))
+            changed = sorted(key for key in old.keys() | new.keys() if old.get(key) != new.get(key))
+            restart = [key for key in changed if key in RESTART_SETTINGS]
+            for key in restart:
+                if key in old:
+                    new[key] = old[key]
+                else:
+                    del new[key]
+            aggregation = new.get("aggregation", {})
+            if aggregation.get("enabled", False) != (self.aggregators is not None):
+                restart.append("aggregation.enabled")
+                new["aggregation"] = {**aggregation, "enabled": self.aggregators is not None}
+            if bool(new.get("event_intervals")) != (self.rates is not None):
+                restart.append("event_intervals")
+                new["event_intervals"] = old.get("event_intervals", {})
+            snapshot = ConfigSnapshot(new)
+
+            # Build everything that can fail before changing anything
+            status_rules = self.status_rules
+            replay_status = self._replay_status
+            if "status_rules" in changed:
+                status_rules = StatusEvaluator(
+                    snapshot.get("status_rules", DEFAULT_STATUS_RULES), self.STATUS
+                )
+                status_rules.level = self.status_rules.level
+                replay_status = StatusEvaluator(
+                    snapshot.get("status_rules", DEFAULT_STATUS_RULES), self.STATUS
                 )
+                replay_status.level = self._replay_status.level
+            policy = snapshot.get("overrun_policy", "skip")
+            if policy not in OVERRUN_POLICIES:
+                raise ValueError(f"Unknown overrun policy {policy!r}, expected {OVERRUN_POLICIES}")
+            if self.rates is not None:
+                intervals = self._event_intervals(snapshot)
+
+            self.status_rules = status_rules
+            self._replay_status = replay_status
+            self.scheduler.policy = policy
+            if self.rates is not None:
+                self.rates.policy = policy
+                if "interval" in changed or "event_intervals" in changed:
+                    for event, seconds in intervals.items():
+                        self.rates.set_interval(event, seconds)
+            if "deadband" in changed:
+                self.deadband = _make_deadband(snapshot.get("deadband", {}), self.deadband)
+            if "aggregation" in changed and self.aggregators is not None:
+                aggregation = snapshot.get("aggregation", {})
+                for aggregator in self.aggregators.values():
+                    aggregator.window = aggregation.get("window", 1.0)
+                self._publish_raw = aggregation.get("raw", True)
+            self.config = snapshot
 
-            time.sleep(self.config.get("interval", 0.1))
+        applied = [key for key in changed if key not in restart]
+        if applied:
+            logger.info(f"Config changes applied: {', '.join(applied)}")
+        if restart:
+            logger.warning(f"Config changes need a restart to take effect: {', '.join(restart)}")
+        return {"applied": applied, "restart_required": restart}
 
     @zelos_sdk.action("Set Interval", "Change sample rate")
     @zelos_sdk.action.number(
@@ -95,14 +913,91 @@ class SensorMonitor:
     def set_interval(self, seconds: float) -> dict[str, Any]:
         """Update the sample interval.
 
+        The running loop picks up the new interval on its next tick without
+        resetting its phase. With per-event rates, it applies to the events
+        without their own entry in ``event_intervals``.
+
         :param seconds: New interval in seconds (0.001 to 1.0)
         :return: Confirmation dictionary with keys:
             - message (str): Success message
             - interval (float): The new interval value
         """
-        self.config["interval"] = seconds
+        with self._config_lock:
+            self.config = self.config.replace(interval=seconds)
+            if self.rates is not None:
+                for event, interval in self._event_intervals(self.config).items():
+                    self.rates.set_interval(event, interval)
         return {"message": f"Interval set to {seconds}s", "interval": seconds}
 
+    @zelos_sdk.action("Set Event Interval", "Change the sample rate of one event")
+    @zelos_sdk.action.text(
+        "event",
+        title="Event",
+        description="Event name, e.g. power or environmental",
+    )
+    @zelos_sdk.action.number(
+        "seconds",
+        minimum=0.001,
+        maximum=3600.0,
+        default=1.0,
+        title="Interval (seconds)",
+        description="Seconds between samples of this event",
+    )
+    def set_event_interval(self, event: str, seconds: float) -> dict[str, Any]:
+        """Update the sample interval of one event.
+
+        The event continues from its last deadline at the new interval; other
+        events keep their rates and phases.
+
+        :param event: Event name
+        :param seconds: New interval in seconds
+        :return: Confirmation dictionary with keys:
+            - message (str): Success message
+            - event_intervals (dict[str, float]): Interval of every event
+        :raises ValueError: If per-event rates are disabled, or the event or interval is invalid
+        """
+        if self.rates is None:
+            raise ValueError("Per-event rates are disabled (set event_intervals in config)")
+        if event not in self.rate_events:
+            raise ValueError(f"Unknown event {event!r}, expected one of {self.rate_events}")
+        with self._config_lock:
+            self.rates.set_interval(event, seconds)
+            self.config = self.config.replace(
+                event_intervals={**self.config.get("event_intervals", {}), event: seconds}
+            )
+            intervals = self._event_intervals(self.config)
+        return {"message": f"{event} interval set to {seconds}s", "event_intervals": intervals}
+
+    @zelos_sdk.action("Set Aggregation Window", "Change the aggregate event window")
+    @zelos_sdk.action.number(
+        "seconds",
+        minimum=0.01,
+        maximum=3600.0,
+        default=1.0,
+        title="Window (seconds)",
+        description="Length of the tumbling window for min/max/mean aggregates",
+    )
+    def set_aggregation_window(self, seconds: float) -> dict[str, Any]:
+        """Update the aggregation window.
+
+        The current window closes at its old length; the next one uses the new length.
+
+        :param seconds: New window length in seconds
+        :return: Confirmation dictionary with keys:
+            - message (str): Success message
+            - window (float): The new window length
+        :raises ValueError: If aggregation is disabled
+        """
+        if self.aggregators is None:
+            raise ValueError("Aggregation is disabled (set aggregation.enabled in config)")
+        for aggregator in self.aggregators.values():
+            aggregator.window = seconds
+        with self._config_lock:
+            self.config = self.config.replace(
+                aggregation={**self.config.get("aggregation", {}), "window": seconds}
+            )
+        return {"message": f"Aggregation window set to {seconds}s", "window": seconds}
+
     @zelos_sdk.action("Get Status", "Get current sensor status")
     def get_status(self) -> dict[str, Any]:
         """Get current sensor status.
@@ -112,15 +1007,47 @@ class SensorMonitor:
         return {
             "running": self.running,
             "interval": self.config.get("interval", 0.1),
-            "temperature": self.source.environmental.temperature.get(),
-            "pressure": self.source.environmental.pressure.get(),
-            "voltage": self.source.power.voltage.get(),
-            "current": self.source.power.current.get(),
-            "status": self.STATUS[self.source.environmental.status.get()],
+            "batch_size": self.config.get("batch_size", 1),
+            "missed_deadlines": self._missed_deadlines(),
+            "event_intervals": self._event_intervals(self.config)
+            if self.rates is not None
+            else None,
+            "source": self.data_source.stats(),
+            "recording": self.recorder.stats() if self.recorder is not None else None,
+            "buffer": self.buffer.stats() if self.buffer is not None else None,
+            "spool": self._spool_status() if self.spool is not None else None,
+            "memory": self.memory_watch.stats() if self.memory_watch is not None else None,
+            "deadband": {event: f.stats() for event, f in self.deadband.items()}
+            if self.deadband is not None
+            else None,
+            "temperature": self.last.temperature,
+            "pressure": self.last.pressure,
+            "voltage": self.last.voltage,
+            "current": self.last.current,
+            "status": self.STATUS[self.last.status],
+        }
+
+    @zelos_sdk.action("Get Metrics", "Get hot-loop performance metrics")
+    def get_metrics(self) -> dict[str, Any]:
+        """Get performance metrics for the current metrics window.
+
+        :return: Metrics dictionary (times in microseconds), or
+            ``{"enabled": False}`` when instrumentation is turned off
+        """
+        if self.metrics is None:
+            return {"enabled": False}
+        return {
+            "enabled": True,
+            **self.metrics.snapshot(),
+            "missed_deadlines": self._missed_deadlines(),
+            "queue_depth": self.buffer.depth if self.buffer is not None else 0,
         }
 
     def _define_schema(self) -> None:
         """Define trace schema."""
+        # Events logged per sample, each of which can have its own rate
+        self.rate_events = ("environmental", "power")
+
         self.source.add_event(
             "environmental",
             [
@@ -138,5 +1065,105 @@ class SensorMonitor:
             ],
         )
 
+        if self.aggregators is not None:
+            for event, fields in AGGREGATE_FIELDS.items():
+                aggregate_fields = [
+                    zelos_sdk.TraceEventFieldMetadata("count", zelos_sdk.DataType.UInt32)
+                ]
+                for name, unit in fields:
+                    aggregate_fields += [
+                        zelos_sdk.TraceEventFieldMetadata(
+                            f"{name}_{stat}", zelos_sdk.DataType.Float32, unit
+                        )
+                        for stat in ("min", "max", "mean")
+                    ]
+                self.source.add_event(f"{event}_agg", aggregate_fields)
+
+        self._define_monitoring_events()
+
         # Value table for status field
         self.source.add_value_table("environmental", "status", self.STATUS)
+
+    def _field_inputs(self) -> dict[str, str]:
+        """Get the input behind each field, for derived channel expressions.
+
+        :return: Input name keyed by ``event.field``
+        """
+        return EVENT_FIELDS
+
+    def _define_monitoring_events(self) -> None:
+        """Define the derived, self_metrics and memory events, when enabled.
+
+        :raises ValueError: If a derived channel is invalid
+        """
+        field = zelos_sdk.TraceEventFieldMetadata
+        float32 = zelos_sdk.DataType.Float32
+
+        # Optional derived channels, compiled once and logged as the derived event
+        self.derived: DerivedChannels | None = None
+        if self.config.get("derived"):
+            self.derived = DerivedChannels(self.config["derived"], self._field_inputs(), INPUTS)
+            self.source.add_event(
+                "derived",
+                [
+                    field(name, zelos_sdk.DataType.Float64, unit)
+                    for name, unit in self.derived.fields
+                ],
+            )
+        if self.memory_watch is not None:
+            self.source.add_event(
+                "memory",
+                [
+                    field("traced_mb", float32, "MB"),
+                    field("traced_growth_mb", float32, "MB"),
+                    field("rss_mb", float32, "MB"),
+                    field("rss_growth_mb", float32, "MB"),
+                    field("top_growth_kb", float32, "kB"),
+                ],
+            )
+        if self.metrics is None:
+            return
+        self.source.add_event(
+            "self_metrics",
+            [
+                field("iteration_rate", float32, "Hz"),
+                field("iteration_mean_us", float32, "µs"),
+                field("iteration_p99_us", float32, "µs"),
+                field("iteration_max_us", float32, "µs"),
+                field("log_mean_us", float32, "µs"),
+                field("sleep_overshoot_mean_us", float32, "µs"),
+                field("sleep_overshoot_max_us", float32, "µs"),
+                field("missed_deadlines", zelos_sdk.DataType.UInt64),
+                field("queue_depth", zelos_sdk.DataType.UInt32),
+                field("rss_mb", float32, "MB"),
+                field("cpu_percent", float32, "%"),
+            ],
+        )
+
+
+def _make_deadband(
+    config: Mapping[str, Any], current: dict[str, DeadbandFilter] | None = None
+) -> dict[str, DeadbandFilter] | None:
+    """Create the per-event deadband filters from the ``deadband`` config object.
+
+    :param config: The ``deadband`` config object
+    :param current: Filters in use; they are updated in place (keeping the
+        last logged values) rather than replaced
+    :return: Filters keyed by event, or None if the deadband is disabled
+    """
+    if not config.get("enabled", False):
+        return None
+    thresholds = config.get("thresholds", {})
+    filters = {
+        event: DeadbandFilter(
+            [thresholds.get(f"{event}.{field}", 0.0) for field in fields],
+            config.get("max_silence", 1.0),
+        )
+        for event, fields in DEADBAND_FIELDS.items()
+    }
+    if current is None:
+        return filters
+    for event, deadband in filters.items():
+        current[event].thresholds = deadband.thresholds
+        current[event].max_silence = deadband.max_silence
+    return current
@@ -0,0 +1,340 @@
+"""Sensor monitor whose trace events are declared in config instead of code."""
+
+import time
+from collections.abc import Callable, Collection, Mapping, Sequence
+from typing import Any
+
+import pyarrow as pa
+import zelos_sdk
+
+from {{cookiecutter.project_slug}}.extension import INPUTS, SensorMonitor
+
+# Arrow type of each field type a sample value can be logged as
+ARROW_TYPES = {
+    "Boolean": pa.bool_(),
+    "Float32": pa.float32(),
+    "Float64": pa.float64(),
+    "Int8": pa.int8(),
+    "Int16": pa.int16(),
+    "Int32": pa.int32(),
+    "Int64": pa.int64(),
+    "UInt8": pa.uint8(),
+    "UInt16": pa.uint16(),
+    "UInt32": pa.uint32(),
+    "UInt64": pa.uint64(),
+}
+
+# The schema SensorMonitor defines in code, as an ``events`` config
+DEFAULT_EVENTS = (
+    {
+        "name": "environmental",
+        "fields": [
+            {"name": "temperature", "type": "Float32", "unit": "°C"},
+            {"name": "pressure", "type": "Float32", "unit": "hPa"},
+            {
+                "name": "status",
+                "type": "UInt8",
+                "values": {"0": "OK", "1": "WARNING", "2": "ERROR"},
+            },
+        ],
+    },
+    {
+        "name": "power",
+        "fields": [
+            {"name": "voltage", "type": "Float32", "unit": "V"},
+            {"name": "current", "type": "Float32", "unit": "A"},
+        ],
+    },
+)
+
+# A configured field: (name, input, type, unit, value table)
+FieldSpec = tuple[str, str, str, str | None, dict[int, str]]
+# A configured event: (name, fields)
+EventSpec = tuple[str, tuple[FieldSpec, ...]]
+
+
+class SchemaMonitor(SensorMonitor):
+    """SensorMonitor that logs the events, fields, types, units and value tables in ``events``.
+
+    Each field logs one input: a sample field from the source or the
+    evaluated status. The logging path is generated once at startup as a
+    single function with one ``log_at`` call and one dict literal per event,
+    so a new sensor needs no code and logs as fast as a hand-written path:
+    no per-sample loops over the schema, attribute lookups or kwargs
+    packing. Batches are logged with one precomputed column selection per
+    event. Deadband filtering and aggregation use the fixed events of
+    SensorMonitor and aren't supported here. The inputs themselves are fixed:
+    config can rename, retype and regroup the :data:`INPUTS`, not add new ones.
+    """
+
+    def __init__(self, config: Mapping[str, Any], source_name: str | None = None) -> None:
+        """Initialize the monitor.
+
+        :param config: Configuration from config.json (``events`` defaults to
+            the SensorMonitor schema)
+        :param source_name: Trace source name (defaults to the extension name)
+        :raises ValueError: If the events are invalid, or deadband or aggregation is enabled
+        """
+        _check_supported(config)
+        self.events = parse_events(config.get("events") or DEFAULT_EVENTS)
+        super().__init__(config, source_name)
+
+    def apply_config(self, config: Mapping[str, Any]) -> dict[str, Any]:
+        """Switch to a new configuration without restarting (see SensorMonitor.apply_config).
+
+        :param config: New configuration (validated, with schema defaults applied)
+        :return: Dictionary with the applied and restart_required settings
+        :raises ValueError: If the config is invalid or enables deadband or aggregation
+        """
+        _check_supported(config)
+        return super().apply_config(config)
+
+    def _define_schema(self) -> None:
+        """Define the configured events and compile their logging paths."""
+        field = zelos_sdk.TraceEventFieldMetadata
+        for event, fields in self.events:
+            self.source.add_event(
+                event,
+                [
+                    field(name, getattr(zelos_sdk.DataType, data_type), unit)
+                    for name, _, data_type, unit, _ in fields
+                ],
+            )
+            for name, _, _, _, values in fields:
+                if values:
+                    self.source.add_value_table(event, name, values)
+
+        self._define_monitoring_events()
+
+        self.rate_events = tuple(event for event, _ in self.events)
+        self._log_sample = compile_sample_logger(self.events, self.source.log_at)
+        # One logger per event, for per-event rates
+        self._event_loggers = {
+            event: compile_sample_logger([(event, fields)], self.source.log_at)
+            for event, fields in self.events
+        }
+        self._batch_events = [
+            (
+                event,
+                [INPUTS.index(input_name) + 1 for _, input_name, _, _, _ in fields],
+                ["time_ns", *(name for name, _, _, _, _ in fields)],
+                [ARROW_TYPES[data_type] for _, _, data_type, _, _ in fields],
+            )
+            for event, fields in self.events
+        ]
+
+    def _field_inputs(self) -> dict[str, str]:
+        """Get the input behind each configured field, for derived channel expressions.
+
+        :return: Input name keyed by ``event.field``
+        """
+        return {
+            f"{event}.{name}": input_name
+            for event, fields in self.events
+            for name, input_name, _, _, _ in fields
+        }
+
+    def _sample(
+        self, due: Collection[str] | None = None
+    ) -> tuple[float, float, float, float, int] | None:
+        """Read and log a single sample through the compiled logging path.
+
+        :param due: Events to log (with per-event rates); None logs every event
+        :return: Logged values as (temperature, pressure, voltage, current, status),
+            or None when the source is exhausted
+        """
+        sample = self.data_source.read()
+        if sample is None:
+            return None
+        time_ns, temp, pressure, voltage, current = sample
+        if self.recorder is not None:
+            self.recorder.append(*sample)
+
+        # Determine status based on the previous temperature
+        last_temp = self.last.temperature
+        status = self.status_rules.update(last_temp) if last_temp is not None else 0
+
+        metrics = self.metrics
+        if metrics is not None:
+            log_start = time.perf_counter()
+        if due is None:
+            self._log_sample(time_ns, temp, pressure, voltage, current, status)
+        else:
+            loggers = self._event_loggers
+            for event in due:
+                loggers[event](time_ns, temp, pressure, voltage, current, status)
+        derived = self.derived
+        if derived is not None:
+            self.source.log_at(
+                time_ns,
+                "derived",
+                derived.evaluate(time_ns, temp, pressure, voltage, current, status),
+            )
+        if metrics is not None:
+            metrics.record_log(time.perf_counter() - log_start)
+
+        return temp, pressure, voltage, current, status
+
+    def _log_batch(
+        self,
+        time_ns: pa.TimestampArray,
+        temp: pa.FloatArray,
+        pressure: pa.FloatArray,
+        voltage: pa.FloatArray,
+        current: pa.FloatArray,
+    ) -> tuple[float, float, float, float, int]:
+        """Evaluate status and log a batch of samples with one bulk call per configured event.
+
+        :param time_ns: Sample timestamps
+        :param temp: Temperatures (Float32)
+        :param pressure: Pressures (Float32)
+        :param voltage: Voltages (Float32)
+        :param current: Currents (Float32)
+        :return: Last values as (temperature, pressure, voltage, current, status)
+        """
+        if self.recorder is not None:
+            self.recorder.write(time_ns, temp, pressure, voltage, current)
+
+        # Status of each sample is based on the temperature before it
+        previous = pa.concat_arrays(
+            [pa.array([self.last.temperature], pa.float32()), temp.slice(0, len(temp) - 1)]
+        )
+        status = self._evaluate_status(previous)
+
+        metrics = self.metrics
+        if metrics is not None:
+            log_start = time.perf_counter()
+        self._log_events(time_ns, temp, pressure, voltage, current, status)
+        if self.derived is not None:
+            self._log_derived(time_ns, (temp, pressure, voltage, current, status))
+        if metrics is not None:
+            metrics.record_log(time.perf_counter() - log_start)
+
+        return (
+            temp[-1].as_py(),
+            pressure[-1].as_py(),
+            voltage[-1].as_py(),
+            current[-1].as_py(),
+            status[-1].as_py(),
+        )
+
+    def _log_events(
+        self,
+        time_ns: pa.TimestampArray,
+        temp: pa.FloatArray,
+        pressure: pa.FloatArray,
+        voltage: pa.FloatArray,
+        current: pa.FloatArray,
+        status: pa.UInt8Array,
+    ) -> None:
+        """Log a batch of samples with one precomputed column selection per configured event.
+
+        :param time_ns: Sample timestamps
+        :param temp: Temperatures (Float32)
+        :param pressure: Pressures (Float32)
+        :param voltage: Voltages (Float32)
+        :param current: Currents (Float32)
+        :param status: Status of each sample
+        """
+        columns = (time_ns, temp, pressure, voltage, current, status)
+        log_batch = self.source.log_batch
+        for event, indices, names, types in self._batch_events:
+            arrays = [time_ns]
+            for index, data_type in zip(indices, types, strict=True):
+                column = columns[index]
+                arrays.append(
+                    column if column.type == data_type else column.cast(data_type, safe=False)
+                )
+            log_batch(event, pa.record_batch(arrays, names=names))
+
+
+def parse_events(events: Sequence[Mapping[str, Any]]) -> tuple[EventSpec, ...]:
+    """Validate an ``events`` config.
+
+    :param events: Events, each with a ``name`` and ``fields``; each field has
+        a ``name``, ``type`` (default Float32), optional ``unit``, ``input``
+        (default: the field name) and ``values`` (value table of an integer field)
+    :return: Parsed events
+    :raises ValueError: If an event or field is invalid
+    """
+    parsed = []
+    for event in events:
+        name = event.get("name", "")
+        reserved = ("derived", "memory", "self_metrics")
+        if not name or name in reserved or name in (e for e, _ in parsed):
+            raise ValueError(f"Invalid or duplicate event name: {name!r}")
+        fields = []
+        for field in event.get("fields", ()):
+            field_name = field.get("name", "")
+            input_name = field.get("input", field_name)
+            data_type = field.get("type", "Float32")
+            values = field.get("values", {})
+            if not field_name or field_name == "time_ns" or field_name in (f[0] for f in fields):
+                raise ValueError(f"Invalid or duplicate field name in {name}: {field_name!r}")
+            if input_name not in INPUTS:
+                raise ValueError(
+                    f"Unknown input {input_name!r} for {name}.{field_name}, "
+                    f"expected one of {INPUTS}"
+                )
+            if data_type not in ARROW_TYPES:
+                raise ValueError(
+                    f"Unsupported type {data_type!r} for {name}.{field_name}, "
+                    f"expected one of {tuple(ARROW_TYPES)}"
+                )
+            if values and not pa.types.is_integer(ARROW_TYPES[data_type]):
+                raise ValueError(f"Value table on non-integer field {name}.{field_name}")
+            fields.append(
+                (
+                    field_name,
+                    input_name,
+                    data_type,
+                    field.get("unit"),
+                    {int(value): label for value, label in values.items()},
+                )
+            )
+        if not fields:
+            raise ValueError(f"Event {name} has no fields")
+        parsed.append((name, tuple(fields)))
+    if not parsed:
+        raise ValueError("No events configured")
+    return tuple(parsed)
+
+
+def compile_sample_logger(
+    events: Sequence[EventSpec], log_at: Callable[[int, str, dict[str, Any]], None]
+) -> Callable[..., None]:
+    """Generate the function that logs one sample to every event.
+
+    For the default events the generated function is::
+
+        def log_sample(time_ns, temperature, pressure, voltage, current, status):
+            log_at(time_ns, 'environmental', {'temperature': temperature, ...})
+            log_at(time_ns, 'power', {'voltage': voltage, 'current': current})
+
+    Names are embedded with ``repr``, so config values can't inject code.
+
+    :param events: Parsed events
+    :param log_at: The trace source's ``log_at(time_ns, event, data)``
+    :return: ``log_sample(time_ns, *inputs)``, taking one argument per entry of :data:`INPUTS`
+    """
+    lines = [f"def log_sample(time_ns, {', '.join(INPUTS)}):"]
+    for event, fields in events:
+        items = ", ".join(
+            f"{name!r}: " + (f"bool({input_name})" if data_type == "Boolean" else input_name)
+            for name, input_name, data_type, _, _ in fields
+        )
+        lines.append(f"    log_at(time_ns, {event!r}, " + "{" + items + "})")
+    namespace: dict[str, Any] = {"log_at": log_at}
+    exec(compile("\n".join(lines), "<events>", "exec"), namespace)
+    return namespace["log_sample"]
+
+
+def _check_supported(config: Mapping[str, Any]) -> None:
+    """Reject features that need the fixed SensorMonitor events.
+
+    :param config: Configuration
+    :raises ValueError: If deadband or aggregation is enabled
+    """
+    for feature in ("deadband", "aggregation"):
+        if config.get(feature, {}).get("enabled", False):
+            raise ValueError(f"{feature} is not supported with configured events")
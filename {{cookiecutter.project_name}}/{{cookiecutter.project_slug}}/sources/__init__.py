@@ -0,0 +1,106 @@
+"""Sample sources for SensorMonitor, and the registry that creates them from config.
+
+Besides the built-in types, any installed package can provide a source by
+registering a :class:`SensorSource` subclass under the
+``{{cookiecutter.project_slug}}.sources`` entry point group, e.g. in its
+pyproject.toml::
+
+    [project.entry-points."{{cookiecutter.project_slug}}.sources"]
+    serial = "my_package.serial_source:SerialSource"
+"""
+
+from collections.abc import Mapping
+from importlib.metadata import entry_points
+from typing import Any
+
+from {{cookiecutter.project_slug}}.sources.base import (
+    DEFAULT_TIMEOUT,
+    FIELDS,
+    AsyncSensorSource,
+    Batch,
+    Sample,
+    SensorSource,
+)
+from {{cookiecutter.project_slug}}.sources.network import DeviceSimulator, TcpSource, UdpSource
+from {{cookiecutter.project_slug}}.sources.polled import PolledSource
+from {{cookiecutter.project_slug}}.sources.replay import CAPTURE_SCHEMA, Recorder, ReplaySource
+from {{cookiecutter.project_slug}}.sources.simulated import SimulatedSource
+
+ENTRY_POINT_GROUP = "{{cookiecutter.project_slug}}.sources"
+
+BUILTIN_SOURCES: dict[str, type[SensorSource]] = {
+    "simulated": SimulatedSource,
+    "replay": ReplaySource,
+    "tcp": TcpSource,
+    "udp": UdpSource,
+}
+
+__all__: list[str] = [
+    "BUILTIN_SOURCES",
+    "CAPTURE_SCHEMA",
+    "DEFAULT_TIMEOUT",
+    "ENTRY_POINT_GROUP",
+    "FIELDS",
+    "AsyncSensorSource",
+    "Batch",
+    "DeviceSimulator",
+    "PolledSource",
+    "Recorder",
+    "ReplaySource",
+    "Sample",
+    "SensorSource",
+    "SimulatedSource",
+    "TcpSource",
+    "UdpSource",
+    "available_sources",
+    "create_source",
+]
+
+
+def available_sources() -> list[str]:
+    """List the source types that can be configured.
+
+    :return: Built-in and entry point source type names, sorted
+    """
+    return sorted({*BUILTIN_SOURCES, *(ep.name for ep in entry_points(group=ENTRY_POINT_GROUP))})
+
+
+def create_source(config: Mapping[str, Any]) -> SensorSource:
+    """Create the sample source described by the ``source`` config object.
+
+    ``type: merged`` combines the sources listed in ``sources``, each
+    providing some of the fields. Blocking, async and partial sources are
+    wrapped in a :class:`PolledSource`, so reads never stall the monitor for
+    longer than the source timeout.
+
+    :param config: The ``source`` config object
+    :return: A sample source providing every field
+    :raises ValueError: If a type is unknown or the sources don't provide every field
+    """
+    if config.get("type") == "merged":
+        return PolledSource([_build(entry) for entry in config.get("sources", [])])
+    source = _build(config)
+    if source.blocking or source.fields != FIELDS:
+        return PolledSource([source])
+    return source
+
+
+def _build(config: Mapping[str, Any]) -> SensorSource:
+    """Create one source by type, from the built-ins or the entry point group.
+
+    :param config: Source config
+    :return: The source
+    :raises ValueError: If the type is unknown or not a SensorSource
+    """
+    source_type = config.get("type", "simulated")
+    cls: Any = BUILTIN_SOURCES.get(source_type)
+    if cls is None:
+        matches = entry_points(group=ENTRY_POINT_GROUP, name=source_type)
+        if not matches:
+            raise ValueError(
+                f"Unknown source type {source_type!r}, expected one of {available_sources()}"
+            )
+        cls = next(iter(matches)).load()
+    if not (isinstance(cls, type) and issubclass(cls, SensorSource)):
+        raise ValueError(f"Source type {source_type!r} is not a SensorSource: {cls!r}")
+    return cls.from_config(config)
@@ -0,0 +1,133 @@
+"""Sample source interfaces."""
+
+import time
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+import pyarrow as pa
+
+# Value fields of a full sample, in order
+FIELDS = ("temperature", "pressure", "voltage", "current")
+
+# One sample: (time_ns, temperature, pressure, voltage, current)
+Sample = tuple[int, float, float, float, float]
+# A block of samples as Arrow arrays, in the same order as Sample
+Batch = tuple[pa.TimestampArray, pa.FloatArray, pa.FloatArray, pa.FloatArray, pa.FloatArray]
+
+# Seconds a read may take before the sample is served from previous values
+DEFAULT_TIMEOUT = 1.0
+
+
+class SensorSource:
+    """Where a SensorMonitor gets its samples from.
+
+    A source provides some or all of :data:`FIELDS`; ``read`` returns the
+    timestamp followed by one value per entry of ``fields``. A ``paced`` source
+    is read once per scheduler tick; an unpaced one is read back-to-back as
+    fast as the monitor can log. ``read`` and ``read_batch`` return None once
+    the source is exhausted.
+
+    A ``blocking`` source waits on I/O in ``read`` (serial, I2C, sockets); it
+    is polled on a thread pool so a slow device only delays its own fields,
+    by at most ``timeout`` seconds per tick.
+
+    Subclasses registered under the ``<package>.sources`` entry point group are
+    created by :meth:`from_config` from their ``source`` config object.
+    """
+
+    type = "source"
+    paced = True
+    blocking = False
+
+    def __init__(self, fields: Sequence[str] = FIELDS, timeout: float = DEFAULT_TIMEOUT) -> None:
+        """Initialize the source.
+
+        :param fields: Fields provided by the source, a subset of :data:`FIELDS`
+        :param timeout: Seconds a read may take before it is treated as timed out
+        :raises ValueError: If a field is unknown
+        """
+        unknown = [field for field in fields if field not in FIELDS]
+        if unknown:
+            raise ValueError(f"Unknown source field(s): {', '.join(unknown)}")
+        self.fields = tuple(fields)
+        self.timeout = timeout
+        self.samples = 0
+        self._started: float | None = None
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any]) -> "SensorSource":
+        """Create the source from its ``source`` config object.
+
+        :param config: Source config (``type``, ``fields``, ``timeout`` and source options)
+        :return: The source
+        """
+        return cls(
+            fields=config.get("fields") or FIELDS, timeout=config.get("timeout", DEFAULT_TIMEOUT)
+        )
+
+    def read(self) -> Sample | None:
+        """Read the next sample.
+
+        :return: The sample, or None when the source is exhausted
+        """
+        raise NotImplementedError
+
+    def read_batch(self, n: int, interval: float) -> Batch | None:
+        """Read up to ``n`` samples as Arrow arrays.
+
+        :param n: Maximum number of samples
+        :param interval: Configured sample interval in seconds
+        :return: The samples, or None when the source is exhausted
+        """
+        raise NotImplementedError
+
+    def period(self, interval: float, n: int) -> float:
+        """Seconds from the last read to the next one.
+
+        :param interval: Configured sample interval in seconds
+        :param n: Samples per read
+        :return: Scheduler period in seconds
+        """
+        return interval * n
+
+    def close(self) -> None:
+        """Release any resources held by the source."""
+
+    def stats(self) -> dict[str, Any]:
+        """Get throughput counters.
+
+        :return: Dictionary with source type, samples read, elapsed time and rate
+        """
+        elapsed = time.monotonic() - self._started if self._started is not None else 0.0
+        return {
+            "type": self.type,
+            "samples": self.samples,
+            "elapsed_s": elapsed,
+            "samples_per_second": self.samples / elapsed if elapsed > 0 else 0.0,
+        }
+
+    def _count(self, n: int) -> None:
+        """Add ``n`` samples to the throughput counters."""
+        if self._started is None:
+            self._started = time.monotonic()
+        self.samples += n
+
+
+class AsyncSensorSource(SensorSource):
+    """A source whose reads are coroutines (e.g. asyncio sockets).
+
+    Reads run on a background event loop owned by the polling source and are
+    cancelled after ``timeout`` seconds.
+    """
+
+    blocking = True
+
+    async def read_async(self) -> tuple[Any, ...] | None:
+        """Read the next sample.
+
+        :return: ``(time_ns, *values)`` with one value per field, or None when exhausted
+        """
+        raise NotImplementedError
+
+    async def aclose(self) -> None:
+        """Release any resources held by the source (runs on the polling event loop)."""
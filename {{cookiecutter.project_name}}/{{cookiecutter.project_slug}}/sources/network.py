@@ -0,0 +1,350 @@
+"""Network device sources and a local device simulator to exercise them without hardware.
+
+Devices speak a line protocol: the client sends ``READ`` and the device
+answers with one line of ``name=value`` pairs, e.g.
+``temperature=21.5,pressure=1012.9``. Over UDP, each request and reply is
+one datagram.
+"""
+
+import asyncio
+import contextlib
+import random
+import socket
+import socketserver
+import threading
+import time
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from {{cookiecutter.project_slug}}.sources.base import (
+    DEFAULT_TIMEOUT,
+    FIELDS,
+    AsyncSensorSource,
+    SensorSource,
+)
+from {{cookiecutter.project_slug}}.sources.simulated import NOMINAL
+
+PROTOCOLS = ("tcp", "udp")
+
+REQUEST = b"READ\n"
+
+
+def format_reply(values: Mapping[str, float]) -> bytes:
+    """Encode a device reply.
+
+    :param values: Readings keyed by field name
+    :return: One ``name=value`` line
+    """
+    return (",".join(f"{name}={value:.7g}" for name, value in values.items()) + "\n").encode()
+
+
+def parse_reply(reply: bytes, fields: Sequence[str]) -> tuple[float, ...]:
+    """Decode a device reply.
+
+    :param reply: One ``name=value`` line
+    :param fields: Fields to extract, in order
+    :return: One value per field
+    :raises ValueError: If the reply is malformed or lacks a field
+    """
+    values = dict(item.split("=", 1) for item in reply.decode("ascii").strip().split(","))
+    try:
+        return tuple(float(values[field]) for field in fields)
+    except KeyError as e:
+        raise ValueError(f"Device reply is missing field {e.args[0]}: {reply!r}") from None
+
+
+class DeviceSimulator:
+    """A local TCP or UDP device answering ``READ`` requests with simulated readings.
+
+    Every reply is sent ``delay`` seconds after the request, to simulate slow
+    devices. Port 0 picks a free port; :attr:`port` holds the bound one.
+    """
+
+    def __init__(
+        self,
+        protocol: str = "tcp",
+        host: str = "127.0.0.1",
+        port: int = 0,
+        fields: Sequence[str] = FIELDS,
+        delay: float = 0.0,
+    ) -> None:
+        """Initialize the simulator (not yet listening).
+
+        :param protocol: ``tcp`` or ``udp``
+        :param host: Address to listen on
+        :param port: Port to listen on (0 = any free port)
+        :param fields: Fields in every reply
+        :param delay: Seconds before each reply
+        :raises ValueError: If the protocol is unknown
+        """
+        if protocol not in PROTOCOLS:
+            raise ValueError(f"Unknown protocol {protocol!r}, expected {PROTOCOLS}")
+        self.protocol = protocol
+        self.host = host
+        self.port = port
+        self.fields = tuple(fields)
+        self.delay = delay
+        self.requests = 0
+        self._ranges = {field: NOMINAL[field] for field in self.fields}
+        self._server: socketserver.BaseServer | None = None
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Start listening on a background thread."""
+        server_class = _TcpServer if self.protocol == "tcp" else _UdpServer
+        self._server = server_class((self.host, self.port), self)
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            kwargs={"poll_interval": 0.05},
+            name=f"{self.protocol}-device",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop listening."""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        self._server = None
+
+    def reply(self) -> bytes:
+        """Produce the reply to one request (after the configured delay).
+
+        :return: Encoded reply
+        """
+        self.requests += 1
+        if self.delay > 0:
+            time.sleep(self.delay)
+        return format_reply(
+            {
+                field: center + random.uniform(-spread, spread)
+                for field, (center, spread) in self._ranges.items()
+            }
+        )
+
+
+class _TcpHandler(socketserver.StreamRequestHandler):
+    """Answers every ``READ`` line of one TCP connection."""
+
+    def handle(self) -> None:
+        """Serve requests until the client disconnects."""
+        for line in self.rfile:
+            if line.strip() == REQUEST.strip():
+                self.wfile.write(self.server.simulator.reply())
+
+
+class _UdpHandler(socketserver.BaseRequestHandler):
+    """Answers one ``READ`` datagram."""
+
+    def handle(self) -> None:
+        """Send the reply datagram."""
+        data, sock = self.request
+        if data.strip() == REQUEST.strip():
+            sock.sendto(self.server.simulator.reply(), self.client_address)
+
+
+class _TcpServer(socketserver.ThreadingTCPServer):
+    """Threaded TCP server that doesn't wait for open connections on close."""
+
+    daemon_threads = True
+    block_on_close = False
+    allow_reuse_address = True
+
+    def __init__(self, address: tuple[str, int], simulator: DeviceSimulator) -> None:
+        super().__init__(address, _TcpHandler)
+        self.simulator = simulator
+
+
+class _UdpServer(socketserver.ThreadingUDPServer):
+    """Threaded UDP server, one thread per request so slow replies don't queue."""
+
+    daemon_threads = True
+    block_on_close = False
+
+    def __init__(self, address: tuple[str, int], simulator: DeviceSimulator) -> None:
+        super().__init__(address, _UdpHandler)
+        self.simulator = simulator
+
+
+class TcpSource(AsyncSensorSource):
+    """Reads a TCP device over one persistent asyncio connection.
+
+    A failed or timed-out request drops the connection, so a late reply can't
+    be taken for the answer to the next request; the next read reconnects.
+    """
+
+    type = "tcp"
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        fields: Sequence[str] = FIELDS,
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> None:
+        """Initialize the source (connects on the first read).
+
+        :param host: Device address
+        :param port: Device port
+        :param fields: Fields read from the device
+        :param timeout: Seconds a read may take
+        """
+        super().__init__(fields, timeout)
+        self.host = host
+        self.port = port
+        self.simulator: DeviceSimulator | None = None
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any]) -> "TcpSource":
+        """Create the source from its ``source`` config object.
+
+        :param config: Source config with ``host``, ``port`` and optionally
+            ``simulate`` (start a local :class:`DeviceSimulator`) and ``delay``
+        :return: The source
+        """
+        return _network_source(cls, "tcp", config)
+
+    async def read_async(self) -> tuple[Any, ...]:
+        """Request and read one reply.
+
+        :return: ``(time_ns, *values)``
+        :raises ConnectionError: If the device closed the connection
+        """
+        try:
+            if self._writer is None:
+                self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+            self._writer.write(REQUEST)
+            await self._writer.drain()
+            line = await self._reader.readline()
+        except BaseException:
+            self._disconnect()
+            raise
+        if not line:
+            self._disconnect()
+            raise ConnectionError(f"{self.host}:{self.port} closed the connection")
+        self._count(1)
+        return (time.time_ns(), *parse_reply(line, self.fields))
+
+    async def aclose(self) -> None:
+        """Close the connection."""
+        writer = self._writer
+        self._disconnect()
+        if writer is not None:
+            with contextlib.suppress(OSError):
+                await writer.wait_closed()
+
+    def close(self) -> None:
+        """Stop the local simulator, if any."""
+        if self.simulator is not None:
+            self.simulator.stop()
+
+    def stats(self) -> dict[str, Any]:
+        """Get throughput counters and the device address.
+
+        :return: Dictionary with the base counters plus host and port
+        """
+        return {**super().stats(), "host": self.host, "port": self.port}
+
+    def _disconnect(self) -> None:
+        """Drop the connection without waiting for it to close."""
+        if self._writer is not None:
+            self._writer.close()
+        self._reader = self._writer = None
+
+
+class UdpSource(SensorSource):
+    """Reads a UDP device with blocking request/reply datagrams (polled on a thread)."""
+
+    type = "udp"
+    blocking = True
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        fields: Sequence[str] = FIELDS,
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> None:
+        """Initialize the source.
+
+        :param host: Device address
+        :param port: Device port
+        :param fields: Fields read from the device
+        :param timeout: Seconds to wait for a reply
+        """
+        super().__init__(fields, timeout)
+        self.host = host
+        self.port = port
+        self.simulator: DeviceSimulator | None = None
+        self._socket: socket.socket | None = None
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any]) -> "UdpSource":
+        """Create the source from its ``source`` config object.
+
+        :param config: Source config with ``host``, ``port`` and optionally
+            ``simulate`` (start a local :class:`DeviceSimulator`) and ``delay``
+        :return: The source
+        """
+        return _network_source(cls, "udp", config)
+
+    def read(self) -> tuple[Any, ...]:
+        """Request and read one reply.
+
+        :return: ``(time_ns, *values)``
+        :raises TimeoutError: If no reply arrives within the timeout
+        """
+        sock = self._socket
+        if sock is None:
+            sock = self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            sock.connect((self.host, self.port))
+        # Discard late replies to earlier requests that timed out
+        sock.setblocking(False)
+        try:
+            while True:
+                sock.recv(65535)
+        except OSError:
+            pass
+        sock.settimeout(self.timeout)
+        sock.send(REQUEST)
+        reply = sock.recv(65535)
+        self._count(1)
+        return (time.time_ns(), *parse_reply(reply, self.fields))
+
+    def close(self) -> None:
+        """Close the socket and stop the local simulator, if any."""
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+        if self.simulator is not None:
+            self.simulator.stop()
+
+    def stats(self) -> dict[str, Any]:
+        """Get throughput counters and the device address.
+
+        :return: Dictionary with the base counters plus host and port
+        """
+        return {**super().stats(), "host": self.host, "port": self.port}
+
+
+def _network_source(
+    cls: type[TcpSource] | type[UdpSource], protocol: str, config: Mapping[str, Any]
+) -> TcpSource | UdpSource:
+    """Create a network source, starting a local device simulator if configured."""
+    host = config.get("host", "127.0.0.1")
+    port = config.get("port", 0)
+    fields = config.get("fields") or FIELDS
+    simulator = None
+    if config.get("simulate", False):
+        simulator = DeviceSimulator(protocol, host, port, fields, config.get("delay", 0.0))
+        simulator.start()
+        port = simulator.port
+    source = cls(host, port, fields=fields, timeout=config.get("timeout", DEFAULT_TIMEOUT))
+    source.simulator = simulator
+    return source
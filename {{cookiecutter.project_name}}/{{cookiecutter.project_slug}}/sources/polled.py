@@ -0,0 +1,230 @@
+"""Concurrent polling of blocking and async sources, merged into one sample stream."""
+
+import asyncio
+import logging
+import math
+import threading
+import time
+from collections.abc import Sequence
+from concurrent import futures
+from typing import Any
+
+import pyarrow as pa
+
+from {{cookiecutter.project_slug}}.sources.base import (
+    FIELDS,
+    AsyncSensorSource,
+    Batch,
+    Sample,
+    SensorSource,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class PolledSource(SensorSource):
+    """Merges several sources into full samples, polling them concurrently.
+
+    Every source provides some of :data:`FIELDS` and together they must
+    provide each field exactly once. On each read, blocking sources are polled
+    on a thread pool and async sources on a background event loop, all at the
+    same time; the read waits for each source at most its own ``timeout``.
+    A source that hasn't answered in time keeps its previous values (NaN
+    until its first answer) and its read stays in flight: it isn't polled
+    again until it completes, so a hung device delays the loop once per hung
+    read rather than on every tick. Non-blocking sources are read inline.
+    """
+
+    type = "polled"
+
+    def __init__(self, sources: Sequence[SensorSource]) -> None:
+        """Initialize the polling source.
+
+        :param sources: Sources to merge
+        :raises ValueError: If the sources don't provide every field exactly once
+        """
+        super().__init__()
+        provided = [field for source in sources for field in source.fields]
+        duplicates = sorted({field for field in provided if provided.count(field) > 1})
+        if duplicates:
+            raise ValueError(f"Field provided by more than one source: {', '.join(duplicates)}")
+        missing = [field for field in FIELDS if field not in provided]
+        if missing:
+            raise ValueError(f"No source provides field(s): {', '.join(missing)}")
+
+        self.sources = list(sources)
+        self.paced = all(source.paced for source in self.sources)
+        # Position of each source's values in the merged sample
+        self._slots = [[FIELDS.index(field) for field in source.fields] for source in sources]
+        self._values = [math.nan] * len(FIELDS)
+        self._pending: list[futures.Future | None] = [None] * len(self.sources)
+        self._deadlines = [0.0] * len(self.sources)
+        self._failing = [False] * len(self.sources)
+        self._exhausted = False
+        self.reads = [0] * len(self.sources)
+        self.stale = [0] * len(self.sources)
+        self.timeouts = [0] * len(self.sources)
+        self.errors = [0] * len(self.sources)
+
+        threaded = [
+            source
+            for source in self.sources
+            if source.blocking and not isinstance(source, AsyncSensorSource)
+        ]
+        self._executor: futures.ThreadPoolExecutor | None = None
+        if threaded:
+            self._executor = futures.ThreadPoolExecutor(
+                max_workers=len(threaded), thread_name_prefix="source-poll"
+            )
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread: threading.Thread | None = None
+        if any(isinstance(source, AsyncSensorSource) for source in self.sources):
+            self._loop = asyncio.new_event_loop()
+            self._loop_thread = threading.Thread(
+                target=self._loop.run_forever, name="source-loop", daemon=True
+            )
+            self._loop_thread.start()
+
+    def read(self) -> Sample | None:
+        """Poll every source and merge the latest values.
+
+        :return: Sample timestamped at the start of the poll, or None once any
+            source is exhausted
+        """
+        time_ns = time.time_ns()
+        now = time.monotonic()
+        pending = self._pending
+        for i, source in enumerate(self.sources):
+            if pending[i] is not None:
+                continue
+            if isinstance(source, AsyncSensorSource):
+                pending[i] = asyncio.run_coroutine_threadsafe(
+                    asyncio.wait_for(source.read_async(), source.timeout), self._loop
+                )
+            elif source.blocking:
+                pending[i] = self._executor.submit(source.read)
+            else:
+                pending[i] = future = futures.Future()
+                try:
+                    future.set_result(source.read())
+                except Exception as e:
+                    future.set_exception(e)
+            self._deadlines[i] = now + source.timeout
+
+        for i, future in enumerate(pending):
+            remaining = self._deadlines[i] - time.monotonic()
+            if not future.done() and remaining > 0:
+                futures.wait([future], timeout=remaining)
+            if future.done():
+                pending[i] = None
+                self._collect(i, future)
+            else:
+                self.stale[i] += 1
+
+        if self._exhausted:
+            return None
+        self._count(1)
+        return (time_ns, *self._values)
+
+    def read_batch(self, n: int, interval: float) -> Batch | None:
+        """Poll ``n`` times and return the merged samples as Arrow arrays.
+
+        :param n: Number of samples
+        :param interval: Ignored; each sample is polled when the previous one completes
+        :return: The samples, or None once any source is exhausted
+        """
+        rows = []
+        for _ in range(n):
+            sample = self.read()
+            if sample is None:
+                break
+            rows.append(sample)
+        if not rows:
+            return None
+        time_ns, *columns = zip(*rows, strict=True)
+        return (
+            pa.array(time_ns, pa.timestamp("ns", tz="UTC")),
+            *(pa.array(column, pa.float32()) for column in columns),
+        )
+
+    def period(self, interval: float, n: int) -> float:
+        """Scheduler period of the only source, or the configured interval for several.
+
+        :param interval: Configured sample interval in seconds
+        :param n: Samples per read
+        :return: Scheduler period in seconds
+        """
+        if len(self.sources) == 1:
+            return self.sources[0].period(interval, n)
+        return interval * n
+
+    def close(self) -> None:
+        """Stop polling and close every source."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        if self._loop is not None:
+            for source in self.sources:
+                if isinstance(source, AsyncSensorSource):
+                    try:
+                        asyncio.run_coroutine_threadsafe(source.aclose(), self._loop).result(1.0)
+                    except Exception as e:
+                        logger.warning(f"Closing {source.type} source failed: {e!r}")
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._loop_thread.join()
+            self._loop.close()
+            self._loop = None
+        for source in self.sources:
+            source.close()
+
+    def stats(self) -> dict[str, Any]:
+        """Get throughput counters and per-source poll counters.
+
+        :return: Dictionary with the base counters plus, per source, its own
+            stats and fresh reads, stale samples, timeouts and errors
+        """
+        return {
+            **super().stats(),
+            "sources": [
+                {
+                    **source.stats(),
+                    "fields": list(source.fields),
+                    "reads": self.reads[i],
+                    "stale": self.stale[i],
+                    "timeouts": self.timeouts[i],
+                    "errors": self.errors[i],
+                }
+                for i, source in enumerate(self.sources)
+            ],
+        }
+
+    def _collect(self, index: int, future: futures.Future) -> None:
+        """Store the values of a completed read.
+
+        :param index: Source index
+        :param future: Completed read
+        """
+        source = self.sources[index]
+        try:
+            result = future.result()
+        # asyncio.wait_for raises asyncio.TimeoutError, a separate class before Python 3.11
+        except (TimeoutError, asyncio.TimeoutError):  # noqa: UP041
+            self.timeouts[index] += 1
+            self.stale[index] += 1
+            return
+        except Exception as e:
+            self.errors[index] += 1
+            self.stale[index] += 1
+            # Warn when a source starts failing, not on every failed poll
+            if not self._failing[index]:
+                self._failing[index] = True
+                logger.warning(f"{source.type} source read failed: {e!r}")
+            return
+        if result is None:
+            self._exhausted = True
+            return
+        if self._failing[index]:
+            self._failing[index] = False
+            logger.info(f"{source.type} source recovered")
+        for slot, value in zip(self._slots[index], result[1:], strict=True):
+            self._values[slot] = value
+        self.reads[index] += 1
@@ -0,0 +1,304 @@
+"""Capture file replay and recording."""
+
+from array import array
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any
+
+import pyarrow as pa
+import pyarrow.compute as pc
+from pyarrow import csv
+
+from {{cookiecutter.project_slug}}.sources.base import FIELDS, Batch, Sample, SensorSource
+
+# Columns of a capture file, as written by Recorder
+CAPTURE_SCHEMA = pa.schema(
+    [("time_ns", pa.timestamp("ns", tz="UTC"))] + [(field, pa.float32()) for field in FIELDS]
+)
+
+# Rows converted to Python values at a time for per-sample replay
+REPLAY_WINDOW = 4096
+
+
+class ReplaySource(SensorSource):
+    """Replays a capture file with its original timestamps.
+
+    The file is memory-mapped and read into Arrow columns; Arrow IPC captures
+    (as written by :class:`Recorder`) are read without copying. The gap
+    between reads follows the recorded timestamps divided by ``speed``, so
+    ``speed=1`` replays in real time, ``speed=10`` ten times faster and
+    ``speed=0`` as fast as the monitor can log. With ``loop``, the file
+    restarts when exhausted, shifted so timestamps keep increasing.
+    """
+
+    type = "replay"
+
+    def __init__(self, path: str | Path, speed: float = 1.0, loop: bool = False) -> None:
+        """Load the capture file.
+
+        :param path: CSV or Arrow IPC capture file
+        :param speed: Replay speed factor (0 = as fast as possible)
+        :param loop: Restart from the beginning when the file is exhausted
+        :raises ValueError: If the file is empty or missing a column
+        """
+        super().__init__()
+        self.path = Path(path)
+        self.speed = speed
+        self.loop = loop
+        self.paced = speed > 0
+        self.loops = 0
+        table = load_capture(self.path)
+        if not table.num_rows:
+            raise ValueError(f"{self.path}: capture file has no samples")
+        self.length = table.num_rows
+        self._time = table.column("time_ns")
+        self._columns = [table.column(field) for field in FIELDS]
+        self.position = 0
+        self._offset = 0
+        self._period = 0.0
+        self._window: list[Sample] = []
+        self._window_position = 0
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any]) -> "ReplaySource":
+        """Create the source from its ``source`` config object.
+
+        :param config: Source config with ``path``, ``speed`` and ``loop``
+        :return: The source
+        :raises ValueError: If no capture file path is set
+        """
+        if not config.get("path"):
+            raise ValueError("Replay source requires a capture file path (source.path)")
+        return cls(config["path"], speed=config.get("speed", 1.0), loop=config.get("loop", False))
+
+    def read(self) -> Sample | None:
+        """Read the next recorded sample.
+
+        :return: The sample, or None at the end of the file
+        """
+        if self._window_position >= len(self._window):
+            if not self._rewind_if_done():
+                return None
+            n = min(REPLAY_WINDOW, self.length - self.position)
+            offset = self._offset
+            self._window = list(
+                zip(
+                    [t + offset for t in self._time.slice(self.position, n).to_pylist()],
+                    *(column.slice(self.position, n).to_pylist() for column in self._columns),
+                    strict=True,
+                )
+            )
+            self._window_position = 0
+        sample = self._window[self._window_position]
+        self._window_position += 1
+        self._advance(1)
+        return sample
+
+    def read_batch(self, n: int, interval: float) -> Batch | None:
+        """Read the next ``n`` recorded samples (fewer at the end of the file).
+
+        :param n: Maximum number of samples
+        :param interval: Ignored; the recorded timestamps set the pace
+        :return: The samples, or None at the end of the file
+        """
+        if not self._rewind_if_done():
+            return None
+        n = min(n, self.length - self.position)
+        time_ns = self._time.slice(self.position, n).combine_chunks()
+        if self._offset:
+            time_ns = pc.add(time_ns, self._offset)
+        batch = (
+            time_ns.cast(CAPTURE_SCHEMA.field("time_ns").type),
+            *(column.slice(self.position, n).combine_chunks() for column in self._columns),
+        )
+        # Per-sample reads buffer ahead; batch reads start from the current position
+        self._window = []
+        self._advance(n)
+        return batch
+
+    def period(self, interval: float, n: int) -> float:
+        """Recorded time covered by the last read, divided by the speed.
+
+        :param interval: Ignored
+        :param n: Ignored
+        :return: Scheduler period in seconds (0 when unpaced)
+        """
+        return self._period
+
+    def stats(self) -> dict[str, Any]:
+        """Get throughput counters and replay progress.
+
+        :return: Dictionary with the base counters plus path, speed, position and loops
+        """
+        return {
+            **super().stats(),
+            "path": str(self.path),
+            "speed": self.speed,
+            "position": self.position,
+            "length": self.length,
+            "loops": self.loops,
+        }
+
+    def _rewind_if_done(self) -> bool:
+        """Restart at the end of the file when looping.
+
+        :return: False if the file is exhausted and not looping
+        """
+        if self.position < self.length:
+            return True
+        if not self.loop:
+            return False
+        first, last = self._time[0].as_py(), self._time[-1].as_py()
+        self._offset += last - first + self._last_gap()
+        self.position = 0
+        self.loops += 1
+        return True
+
+    def _advance(self, n: int) -> None:
+        """Move past ``n`` samples and compute the period until the next read."""
+        start = self.position
+        self.position += n
+        self._count(n)
+        if not self.paced:
+            return
+        if self.position < self.length:
+            gap = self._time[self.position].as_py() - self._time[start].as_py()
+        elif self.loop:
+            gap = self._time[-1].as_py() - self._time[start].as_py() + self._last_gap()
+        else:
+            gap = 0
+        self._period = gap / 1e9 / self.speed
+
+    def _last_gap(self) -> int:
+        """Nanoseconds between the last two samples (the gap used when looping)."""
+        if self.length < 2:
+            return 0
+        return self._time[-1].as_py() - self._time[-2].as_py()
+
+
+class Recorder:
+    """Writes acquired samples to a compact columnar capture file.
+
+    The file is an Arrow IPC stream with the :data:`CAPTURE_SCHEMA` columns
+    (Float32 values, like the trace schema), written one record batch per
+    ``batch_rows`` samples, so a recording cut short by a crash is readable up
+    to its last complete batch. :class:`ReplaySource` replays it.
+    """
+
+    def __init__(self, path: str | Path, batch_rows: int = 4096) -> None:
+        """Open the capture file for writing.
+
+        :param path: Output file (parent directories are created)
+        :param batch_rows: Samples buffered per record batch
+        """
+        self.path = Path(path)
+        self.batch_rows = batch_rows
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._sink = pa.OSFile(str(self.path), "wb")
+        self._writer = pa.ipc.new_stream(self._sink, CAPTURE_SCHEMA)
+        self.rows = 0
+        self.batches = 0
+        self._reset()
+
+    def append(self, time_ns: int, *values: float) -> None:
+        """Buffer one sample, writing a record batch when the buffer is full.
+
+        :param time_ns: Sample timestamp
+        :param values: Temperature, pressure, voltage and current
+        """
+        self._time.append(time_ns)
+        for column, value in zip(self._values, values, strict=True):
+            column.append(value)
+        if len(self._time) >= self.batch_rows:
+            self.flush()
+
+    def write(self, time_ns: pa.TimestampArray, *columns: pa.FloatArray) -> None:
+        """Write a block of samples as one record batch.
+
+        :param time_ns: Sample timestamps
+        :param columns: Temperatures, pressures, voltages and currents (Float32)
+        """
+        self.flush()
+        self._write(pa.record_batch([time_ns, *columns], schema=CAPTURE_SCHEMA))
+
+    def flush(self) -> None:
+        """Write buffered samples as a record batch."""
+        n = len(self._time)
+        if not n:
+            return
+        arrays = [
+            pa.Array.from_buffers(pa.int64(), n, [None, pa.py_buffer(self._time)]).view(
+                CAPTURE_SCHEMA.field("time_ns").type
+            )
+        ]
+        arrays += [
+            pa.Array.from_buffers(pa.float32(), n, [None, pa.py_buffer(column)])
+            for column in self._values
+        ]
+        self._write(pa.record_batch(arrays, schema=CAPTURE_SCHEMA))
+        self._reset()
+
+    def close(self) -> None:
+        """Write buffered samples and close the file."""
+        if self._sink.closed:
+            return
+        self.flush()
+        self._writer.close()
+        self._sink.close()
+
+    def stats(self) -> dict[str, Any]:
+        """Get recording counters.
+
+        :return: Dictionary with path, rows and record batches written
+        """
+        return {"path": str(self.path), "rows": self.rows, "batches": self.batches}
+
+    def _write(self, batch: pa.RecordBatch) -> None:
+        """Write a record batch and update the counters."""
+        self._writer.write_batch(batch)
+        self.rows += batch.num_rows
+        self.batches += 1
+
+    def _reset(self) -> None:
+        """Start a new, empty buffer (the old one may still back a written batch)."""
+        self._time = array("q")
+        self._values = [array("f") for _ in FIELDS]
+
+
+def load_capture(path: Path) -> pa.Table:
+    """Memory-map a capture file and read it as a table of :data:`CAPTURE_SCHEMA` columns.
+
+    CSV files need a header row with the four value columns and either
+    ``time_ns`` (integer nanoseconds since the epoch) or ``time`` (seconds).
+    Any other file is read as Arrow IPC (file or stream format).
+
+    :param path: Capture file
+    :return: Table with ``time_ns`` as Int64 and the values as Float32
+    :raises ValueError: If a required column is missing
+    """
+    source = pa.memory_map(str(path))
+    if path.suffix.lower() == ".csv":
+        table = csv.read_csv(source)
+    else:
+        try:
+            table = pa.ipc.open_file(source).read_all()
+        except pa.ArrowInvalid:
+            source.seek(0)
+            table = pa.ipc.open_stream(source).read_all()
+
+    names = set(table.column_names)
+    if "time_ns" in names:
+        time_ns = table.column("time_ns").cast(pa.int64())
+    elif "time" in names:
+        time_ns = pc.round(pc.multiply(table.column("time").cast(pa.float64()), 1e9)).cast(
+            pa.int64()
+        )
+    else:
+        raise ValueError(f"{path}: capture file needs a time_ns or time column")
+    missing = [field for field in FIELDS if field not in names]
+    if missing:
+        raise ValueError(f"{path}: capture file is missing column(s): {', '.join(missing)}")
+    return pa.table(
+        [time_ns, *(table.column(field).cast(pa.float32()) for field in FIELDS)],
+        names=["time_ns", *FIELDS],
+    )
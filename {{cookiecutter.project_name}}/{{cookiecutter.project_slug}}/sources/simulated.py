@@ -0,0 +1,88 @@
+"""Simulated sensor readings."""
+
+import random
+import time
+from collections.abc import Sequence
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from {{cookiecutter.project_slug}}.sources.base import (
+    DEFAULT_TIMEOUT,
+    FIELDS,
+    Batch,
+    Sample,
+    SensorSource,
+)
+
+# Simulated (center, spread) of every field
+NOMINAL = {
+    "temperature": (20.0, 5.0),
+    "pressure": (1013.25, 10.0),
+    "voltage": (12.0, 0.5),
+    "current": (2.5, 0.3),
+}
+
+
+class SimulatedSource(SensorSource):
+    """Random readings around nominal values, timestamped when read."""
+
+    type = "simulated"
+
+    def __init__(self, fields: Sequence[str] = FIELDS, timeout: float = DEFAULT_TIMEOUT) -> None:
+        """Initialize the source.
+
+        :param fields: Fields to simulate
+        :param timeout: Unused (reads never block)
+        """
+        super().__init__(fields, timeout)
+        self._ranges = [NOMINAL[field] for field in self.fields]
+        self._all_fields = self.fields == FIELDS
+
+    def read(self) -> Sample:
+        """Simulate sensor readings.
+
+        :return: Sample timestamped now
+        """
+        self._count(1)
+        if not self._all_fields:
+            return (
+                time.time_ns(),
+                *(center + random.uniform(-spread, spread) for center, spread in self._ranges),
+            )
+        return (
+            time.time_ns(),
+            20.0 + random.uniform(-5, 5),
+            1013.25 + random.uniform(-10, 10),
+            12.0 + random.uniform(-0.5, 0.5),
+            2.5 + random.uniform(-0.3, 0.3),
+        )
+
+    def read_batch(self, n: int, interval: float) -> Batch:
+        """Simulate ``n`` readings timestamped one interval apart, ending now.
+
+        :param n: Number of samples
+        :param interval: Sample interval in seconds
+        :return: Samples as Arrow arrays
+        """
+        self._count(n)
+        interval_ns = int(interval * 1e9)
+        start_ns = time.time_ns() - (n - 1) * interval_ns
+        return (
+            pa.array(
+                range(start_ns, start_ns + n * interval_ns, interval_ns),
+                type=pa.timestamp("ns", tz="UTC"),
+            ),
+            *(_uniform(n, center, spread) for center, spread in self._ranges),
+        )
+
+
+def _uniform(n: int, center: float, spread: float) -> pa.FloatArray:
+    """Generate ``n`` uniform samples in ``center ± spread`` as a Float32 array.
+
+    :param n: Number of samples
+    :param center: Center of the distribution
+    :param spread: Half-width of the distribution
+    :return: Float32 Arrow array
+    """
+    return pc.add(pc.multiply(pc.random(n), 2 * spread), center - spread).cast(pa.float32())
@@ -0,0 +1,411 @@
+"""Multi-process supervisor sharding sensors across worker processes."""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import signal
+import threading
+import time
+from collections.abc import Mapping, Sequence
+from multiprocessing.connection import Connection
+from pathlib import Path
+from types import FrameType
+from typing import Any
+
+try:
+    import tomllib  # Python 3.11+
+except ImportError:
+    import tomli as tomllib  # type: ignore
+
+import zelos_sdk
+from zelos_sdk.hooks.logging import TraceLoggingHandler
+
+from {{cookiecutter.project_slug}}.async_monitor import AsyncSensorMonitor, check_supported
+from {{cookiecutter.project_slug}}.utils.config import ConfigSnapshot
+from {{cookiecutter.project_slug}}.utils.log_pipeline import LogPipeline
+
+logger = logging.getLogger(__name__)
+
+# Actions a worker accepts from the supervisor
+WORKER_COMMANDS = (
+    "apply_config",
+    "set_interval",
+    "set_event_interval",
+    "get_status",
+    "get_metrics",
+)
+
+# Seconds the supervisor keeps for itself out of the shutdown grace period
+STOP_MARGIN = 1.0
+
+
+def read_grace_seconds(manifest: Path, default: float = 10.0) -> float:
+    """Read ``[stop].grace_seconds`` from the extension manifest.
+
+    :param manifest: Path to extension.toml
+    :param default: Value used when the manifest or setting is missing
+    :return: Shutdown grace period in seconds
+    """
+    try:
+        with manifest.open("rb") as f:
+            return float(tomllib.load(f).get("stop", {}).get("grace_seconds", default))
+    except (OSError, tomllib.TOMLDecodeError):
+        return default
+
+
+class ProcessSupervisor:
+    """Shards sensors across worker processes to use more than one core.
+
+    Each worker is a separate process (started with ``spawn``) running an
+    :class:`AsyncSensorMonitor` for its share of the ``sensors`` config list,
+    with its own SDK connection and trace sources. The supervisor forwards
+    actions to the workers over pipes and merges their results. On
+    :meth:`stop` it sends SIGTERM to every worker and kills any that have not
+    exited within the shutdown grace period.
+    """
+
+    def __init__(self, config: Mapping[str, Any], grace_seconds: float = 10.0) -> None:
+        """Initialize the supervisor and assign sensors to workers.
+
+        :param config: Configuration from config.json
+        :param grace_seconds: Shutdown grace period from extension.toml
+        :raises ValueError: If two sensors share the same name, or a sensor
+            enables the pipeline or the spool
+        """
+        self.config = ConfigSnapshot(config)
+        self.running = False
+        self.grace_seconds = grace_seconds
+        self.processes: list[multiprocessing.process.BaseProcess] = []
+        self._connections: list[Connection] = []
+        self._locks: list[threading.Lock] = []
+        self._stop_deadline: float | None = None
+
+        sensors = self.config.get("sensors") or [{}]
+        names = _sensor_names(self.config, sensors)
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        if duplicates:
+            raise ValueError(f"Duplicate sensor name: {', '.join(duplicates)}")
+        # Fail here rather than in a worker process
+        check_supported(self.config)
+        for sensor in sensors:
+            check_supported({**self.config, **sensor})
+
+        # Default: one worker per core, but never more workers than sensors
+        workers = self.config.get("workers", 0) or os.cpu_count() or 1
+        workers = max(1, min(workers, len(sensors)))
+        self.shards = [sensors[i::workers] for i in range(workers)]
+        # Worker index of every sensor, for routing per-sensor actions
+        self.assignment = {
+            name: i
+            for i, shard in enumerate(self.shards)
+            for name in _sensor_names(self.config, shard)
+        }
+
+    def start(self) -> None:
+        """Start one worker process per shard."""
+        context = multiprocessing.get_context("spawn")
+        logger.info(f"Starting {len(self.shards)} worker(s) for {len(self.assignment)} sensor(s)")
+        for index, shard in enumerate(self.shards):
+            parent, child = context.Pipe()
+            process = context.Process(
+                target=_worker_main,
+                args=(index, {**self.config, "sensors": shard}, child),
+                name=f"sensor-worker-{index}",
+            )
+            process.start()
+            child.close()
+            self.processes.append(process)
+            self._connections.append(parent)
+            self._locks.append(threading.Lock())
+        self.running = True
+
+    def stop(self) -> None:
+        """Ask every worker to stop (SIGTERM); :meth:`run` enforces the deadline.
+
+        Safe to call from a signal handler.
+        """
+        self.running = False
+        if self._stop_deadline is None:
+            self._stop_deadline = time.monotonic() + max(0.0, self.grace_seconds - STOP_MARGIN)
+        for process in self.processes:
+            if process.is_alive():
+                process.terminate()
+
+    def run(self) -> None:
+        """Wait for the workers to exit, killing stragglers after the grace period."""
+        while any(process.is_alive() for process in self.processes):
+            for process in self.processes:
+                process.join(timeout=0.1)
+            deadline = self._stop_deadline
+            if deadline is not None and time.monotonic() >= deadline:
+                for process in self.processes:
+                    if process.is_alive():
+                        logger.warning(f"Killing {process.name} after the shutdown grace period")
+                        process.kill()
+                        process.join()
+
+        for process in self.processes:
+            if process.exitcode:
+                logger.error(f"{process.name} exited with code {process.exitcode}")
+        for connection in self._connections:
+            connection.close()
+        self.running = False
+
+    def _call(self, index: int, command: str, timeout: float = 5.0, **kwargs: Any) -> Any:
+        """Run an action on one worker and return its result.
+
+        :param index: Worker index
+        :param command: Action method name (one of WORKER_COMMANDS)
+        :param timeout: Seconds to wait for the reply
+        :param kwargs: Action arguments
+        :return: Action result
+        :raises RuntimeError: If the worker is gone, times out or the action fails
+        """
+        if not self.processes[index].is_alive():
+            raise RuntimeError(f"{self.processes[index].name} is not running")
+        connection = self._connections[index]
+        with self._locks[index]:
+            # Discard a late reply to an earlier call that timed out
+            while connection.poll():
+                connection.recv()
+            connection.send((command, kwargs))
+            if not connection.poll(timeout):
+                raise RuntimeError(f"{self.processes[index].name} did not answer {command}")
+            ok, result = connection.recv()
+        if not ok:
+            raise RuntimeError(f"{self.processes[index].name}: {result}")
+        return result
+
+    def _call_all(self, command: str, **kwargs: Any) -> list[Any]:
+        """Run an action on every worker.
+
+        :param command: Action method name (one of WORKER_COMMANDS)
+        :param kwargs: Action arguments
+        :return: Per-worker results (a ``{"error": ...}`` dict for failed workers)
+        """
+        results = []
+        for index in range(len(self.processes)):
+            try:
+                results.append(self._call(index, command, **kwargs))
+            except RuntimeError as e:
+                results.append({"error": str(e)})
+        return results
+
+    def apply_config(self, config: Mapping[str, Any]) -> dict[str, Any]:
+        """Forward a new configuration to every worker without restarting them.
+
+        Each worker gets the new configuration with its own share of the
+        sensors. Adding, removing, renaming or reordering sensors, or changing
+        the number of workers, needs a restart; the running values are kept, so
+        they are reported again on every reload until then.
+
+        :param config: New configuration (validated, with schema defaults applied)
+        :return: Dictionary with keys:
+            - applied (list[str]): Changed settings now in effect on any worker
+            - restart_required (list[str]): Changed settings that need a restart
+        :raises RuntimeError: If a worker is gone, times out or rejects the configuration
+        """
+        sensors = config.get("sensors") or [{}]
+        running = self.config.get("sensors") or [{}]
+        restart: set[str] = set()
+        if _sensor_names(config, sensors) != _sensor_names(self.config, running):
+            restart.add("sensors")
+            sensors = running
+        if config.get("workers", 0) != self.config.get("workers", 0):
+            restart.add("workers")
+            config = {**config, "workers": self.config.get("workers", 0)}
+        applied: set[str] = set()
+        for index in range(len(self.shards)):
+            shard = list(sensors[index :: len(self.shards)])
+            result = self._call(index, "apply_config", config={**config, "sensors": shard})
+            applied.update(result["applied"])
+            restart.update(result["restart_required"])
+        self.config = ConfigSnapshot({**config, "sensors": sensors})
+        return {"applied": sorted(applied), "restart_required": sorted(restart)}
+
+    @zelos_sdk.action("Set Interval", "Change sample rate")
+    @zelos_sdk.action.number(
+        "seconds",
+        minimum=0.001,
+        maximum=1.0,
+        multiple_of=0.001,
+        default=0.1,
+        title="Interval (seconds)",
+        description="Sample interval from 1kHz to 1Hz",
+        widget="range",
+    )
+    @zelos_sdk.action.text(
+        "sensor",
+        required=False,
+        title="Sensor",
+        description="Sensor name (leave empty for all sensors)",
+    )
+    def set_interval(self, seconds: float, sensor: str = "") -> dict[str, Any]:
+        """Update the sample interval of one or all sensors.
+
+        :param seconds: New interval in seconds (0.001 to 1.0)
+        :param sensor: Sensor name, or empty for all sensors
+        :return: Confirmation dictionary with keys:
+            - message (str): Success message
+            - interval (float): The new interval value
+            - sensors (list[str]): Names of the updated sensors
+        :raises ValueError: If the sensor name is unknown
+        """
+        if sensor:
+            if sensor not in self.assignment:
+                raise ValueError(f"Unknown sensor: {sensor}")
+            index = self.assignment[sensor]
+            results = [self._call(index, "set_interval", seconds=seconds, sensor=sensor)]
+        else:
+            results = self._call_all("set_interval", seconds=seconds)
+        names = [name for result in results for name in result.get("sensors", [])]
+        return {"message": f"Interval set to {seconds}s", "interval": seconds, "sensors": names}
+
+    @zelos_sdk.action("Set Event Interval", "Change the sample rate of one event")
+    @zelos_sdk.action.text(
+        "event",
+        title="Event",
+        description="Event name, e.g. power or environmental",
+    )
+    @zelos_sdk.action.number(
+        "seconds",
+        minimum=0.001,
+        maximum=3600.0,
+        default=1.0,
+        title="Interval (seconds)",
+        description="Seconds between samples of this event",
+    )
+    @zelos_sdk.action.text(
+        "sensor",
+        required=False,
+        title="Sensor",
+        description="Sensor name (leave empty for all sensors)",
+    )
+    def set_event_interval(self, event: str, seconds: float, sensor: str = "") -> dict[str, Any]:
+        """Update the sample interval of one event on one or all sensors.
+
+        :param event: Event name
+        :param seconds: New interval in seconds
+        :param sensor: Sensor name, or empty for all sensors
+        :return: Confirmation dictionary with keys:
+            - message (str): Success message
+            - interval (float): The new interval value
+            - sensors (list[str]): Names of the updated sensors
+        :raises ValueError: If the sensor name is unknown
+        :raises RuntimeError: If the named sensor's worker rejects the change (per-event
+            rates disabled or unknown event); other workers report errors in their results
+        """
+        kwargs = {"event": event, "seconds": seconds}
+        if sensor:
+            if sensor not in self.assignment:
+                raise ValueError(f"Unknown sensor: {sensor}")
+            index = self.assignment[sensor]
+            results = [self._call(index, "set_event_interval", **kwargs, sensor=sensor)]
+        else:
+            results = self._call_all("set_event_interval", **kwargs)
+        names = [name for result in results for name in result.get("sensors", [])]
+        return {
+            "message": f"{event} interval set to {seconds}s",
+            "interval": seconds,
+            "sensors": names,
+        }
+
+    @zelos_sdk.action("Get Status", "Get current sensor status")
+    def get_status(self) -> dict[str, Any]:
+        """Get current status of every worker and sensor.
+
+        :return: Status dictionary with per-worker process state and per-sensor values
+        """
+        sensors: dict[str, Any] = {}
+        workers = []
+        for process, result in zip(self.processes, self._call_all("get_status"), strict=True):
+            sensors.update(result.get("sensors", {}))
+            workers.append(
+                {
+                    "name": process.name,
+                    "pid": process.pid,
+                    "alive": process.is_alive(),
+                    "exitcode": process.exitcode,
+                    "error": result.get("error"),
+                }
+            )
+        return {"running": self.running, "workers": workers, "sensors": sensors}
+
+    @zelos_sdk.action("Get Metrics", "Get hot-loop performance metrics")
+    def get_metrics(self) -> dict[str, Any]:
+        """Get performance metrics of every sensor.
+
+        :return: Metrics dictionary with per-sensor values
+        """
+        metrics: dict[str, Any] = {}
+        for process, result in zip(self.processes, self._call_all("get_metrics"), strict=True):
+            if "error" in result:
+                metrics[process.name] = result
+            else:
+                metrics.update(result)
+        return metrics
+
+
+def _sensor_names(config: Mapping[str, Any], shard: Sequence[Mapping[str, Any]]) -> list[str]:
+    """Names of the sensors in a shard (entries inherit the top-level sensor_name)."""
+    return [sensor.get("sensor_name", config.get("sensor_name", "sensor")) for sensor in shard]
+
+
+def _worker_main(index: int, config: dict[str, Any], connection: Connection) -> None:
+    """Entry point of a worker process.
+
+    :param index: Worker index
+    :param config: Configuration with this worker's share of the sensors
+    :param connection: Pipe to the supervisor
+    """
+    logging.basicConfig(level=logging.INFO)
+    name = f"{{cookiecutter.project_slug}}_worker{index}"
+    zelos_sdk.init(name=name)
+    pipeline = LogPipeline.from_config(
+        TraceLoggingHandler(f"{name}_logger"), config.get("logging", {})
+    )
+    pipeline.start()
+
+    monitor = AsyncSensorMonitor(config)
+    stopping = threading.Event()
+
+    def shutdown_handler(signum: int, frame: FrameType | None) -> None:
+        stopping.set()
+        monitor.stop()
+
+    signal.signal(signal.SIGTERM, shutdown_handler)
+    signal.signal(signal.SIGINT, shutdown_handler)
+
+    monitor.start()
+    # A signal that arrived while starting would have been undone by start()
+    if stopping.is_set():
+        monitor.stop()
+    threading.Thread(
+        target=_serve_commands, args=(monitor, connection), name="commands", daemon=True
+    ).start()
+    asyncio.run(monitor.run())
+    pipeline.stop()
+
+
+def _serve_commands(monitor: AsyncSensorMonitor, connection: Connection) -> None:
+    """Answer supervisor actions until the pipe closes.
+
+    :param monitor: The worker's monitor
+    :param connection: Pipe to the supervisor
+    """
+    while True:
+        try:
+            command, kwargs = connection.recv()
+        except (EOFError, OSError):
+            return
+        try:
+            if command not in WORKER_COMMANDS:
+                raise ValueError(f"Unknown command: {command}")
+            reply = (True, getattr(monitor, command)(**kwargs))
+        except Exception as e:
+            reply = (False, repr(e))
+        try:
+            connection.send(reply)
+        except (BrokenPipeError, OSError):
+            return
@@ -1,3 +1,89 @@
-"""Utility modules."""
+"""Utility modules.
 
-__all__: list[str] = []
+The exports are imported on first access, so importing one utility (as
+``main.py`` does at startup) doesn't load the others or pyarrow.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from {{cookiecutter.project_slug}}.utils.aggregate import WindowAggregator
+    from {{cookiecutter.project_slug}}.utils.config import ConfigSnapshot, ConfigWatcher
+    from {{cookiecutter.project_slug}}.utils.deadband import DeadbandFilter
+    from {{cookiecutter.project_slug}}.utils.derived import DerivedChannels
+    from {{cookiecutter.project_slug}}.utils.log_pipeline import LogPipeline, RateLimitFilter
+    from {{cookiecutter.project_slug}}.utils.memory import MemoryWatch, tune_gc
+    from {{cookiecutter.project_slug}}.utils.metrics import LoopMetrics
+    from {{cookiecutter.project_slug}}.utils.ring_buffer import BACKPRESSURE_POLICIES, RingBuffer
+    from {{cookiecutter.project_slug}}.utils.scheduler import (
+        OVERRUN_POLICIES,
+        DeadlineScheduler,
+        RateScheduler,
+    )
+    from {{cookiecutter.project_slug}}.utils.spool import DiskSpool
+    from {{cookiecutter.project_slug}}.utils.status import (
+        DEFAULT_STATUS_RULES,
+        LastValues,
+        StatusEvaluator,
+    )
+
+# Module defining each export
+_EXPORTS = {
+    "BACKPRESSURE_POLICIES": "ring_buffer",
+    "DEFAULT_STATUS_RULES": "status",
+    "OVERRUN_POLICIES": "scheduler",
+    "ConfigSnapshot": "config",
+    "ConfigWatcher": "config",
+    "DeadbandFilter": "deadband",
+    "DeadlineScheduler": "scheduler",
+    "DerivedChannels": "derived",
+    "DiskSpool": "spool",
+    "LastValues": "status",
+    "LogPipeline": "log_pipeline",
+    "LoopMetrics": "metrics",
+    "MemoryWatch": "memory",
+    "RateLimitFilter": "log_pipeline",
+    "RateScheduler": "scheduler",
+    "RingBuffer": "ring_buffer",
+    "StatusEvaluator": "status",
+    "WindowAggregator": "aggregate",
+    "tune_gc": "memory",
+}
+
+__all__: list[str] = [
+    "BACKPRESSURE_POLICIES",
+    "DEFAULT_STATUS_RULES",
+    "OVERRUN_POLICIES",
+    "ConfigSnapshot",
+    "ConfigWatcher",
+    "DeadbandFilter",
+    "DeadlineScheduler",
+    "DerivedChannels",
+    "DiskSpool",
+    "LastValues",
+    "LogPipeline",
+    "LoopMetrics",
+    "MemoryWatch",
+    "RateLimitFilter",
+    "RateScheduler",
+    "RingBuffer",
+    "StatusEvaluator",
+    "WindowAggregator",
+    "tune_gc",
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Import an export from its module on first access.
+
+    :param name: Export name
+    :return: The exported object
+    :raises AttributeError: If ``name`` isn't an export
+    """
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
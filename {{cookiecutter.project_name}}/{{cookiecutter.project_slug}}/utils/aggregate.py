@@ -0,0 +1,78 @@
+"""Incremental tumbling-window aggregation (min/max/mean/count)."""
+
+import math
+
+# Summary of one closed window: (window_start, count, [(min, max, mean), ...] per field)
+WindowSummary = tuple[float, int, list[tuple[float, float, float]]]
+
+
+class WindowAggregator:
+    """Running min/max/mean/count of several fields over tumbling time windows.
+
+    Windows are aligned to multiples of ``window`` seconds, so aggregates from
+    different sensors and restarts line up. Each sample costs O(1); a summary is
+    returned when the first sample of the next window arrives. Changing
+    ``window`` takes effect from the next window; the open one keeps its end.
+    """
+
+    __slots__ = ("window", "_fields", "_start", "_end", "_count", "_min", "_max", "_sum")
+
+    def __init__(self, fields: int, window: float) -> None:
+        """Initialize the aggregator.
+
+        :param fields: Number of fields per sample
+        :param window: Window length in seconds
+        """
+        self.window = window
+        self._fields = fields
+        self._start = -math.inf
+        self._end = -math.inf
+        self._count = 0
+        self._min = [math.inf] * fields
+        self._max = [-math.inf] * fields
+        self._sum = [0.0] * fields
+
+    def add(self, now: float, *values: float) -> WindowSummary | None:
+        """Add a sample.
+
+        :param now: Sample time in seconds
+        :param values: Field values
+        :return: Summary of the previous window if this sample closed it, else None
+        """
+        summary = None
+        if now >= self._end:
+            summary = self.flush()
+            self._start = now - now % self.window
+            self._end = self._start + self.window
+
+        self._count += 1
+        mins, maxs, sums = self._min, self._max, self._sum
+        for i, value in enumerate(values):
+            if value < mins[i]:
+                mins[i] = value
+            if value > maxs[i]:
+                maxs[i] = value
+            sums[i] += value
+        return summary
+
+    def flush(self) -> WindowSummary | None:
+        """Close the current window.
+
+        :return: Summary of the window, or None if it was empty
+        """
+        if self._count == 0:
+            return None
+        count = self._count
+        summary = (
+            self._start,
+            count,
+            [
+                (low, high, total / count)
+                for low, high, total in zip(self._min, self._max, self._sum, strict=True)
+            ],
+        )
+        self._count = 0
+        self._min = [math.inf] * self._fields
+        self._max = [-math.inf] * self._fields
+        self._sum = [0.0] * self._fields
+        return summary
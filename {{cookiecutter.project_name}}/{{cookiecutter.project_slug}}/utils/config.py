@@ -0,0 +1,170 @@
+"""Immutable configuration snapshots and a config file watcher for hot reload."""
+
+import logging
+import os
+import threading
+from collections.abc import Callable, Mapping
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class ConfigSnapshot(dict):
+    """An immutable configuration snapshot.
+
+    Nested objects are snapshots too and arrays become tuples, so nothing
+    reachable from a snapshot can change. Readers hold no lock: a new
+    configuration is published by swapping the whole snapshot (a single
+    attribute assignment), so a reader sees either the old or the new one,
+    never a mix. Being a ``dict``, lookups stay as fast as before.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, data: Mapping[str, Any] = ()) -> None:
+        """Freeze a configuration.
+
+        :param data: Configuration to copy
+        """
+        super().__init__((key, _freeze(value)) for key, value in dict(data).items())
+
+    def replace(self, **changes: Any) -> "ConfigSnapshot":
+        """Create a copy with some top-level settings replaced.
+
+        :param changes: Settings to replace
+        :return: New snapshot
+        """
+        return ConfigSnapshot({**self, **changes})
+
+    def thaw(self) -> dict[str, Any]:
+        """Copy the snapshot into plain, mutable dicts and lists.
+
+        :return: Mutable copy
+        """
+        return _thaw(self)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Pickle as a plain mapping (item assignment is disabled)."""
+        return (ConfigSnapshot, (dict(self),))
+
+    def _immutable(self, *args: Any, **kwargs: Any) -> None:
+        """Reject any mutation."""
+        raise TypeError("ConfigSnapshot is immutable; use replace() to derive a new snapshot")
+
+    __setitem__ = __delitem__ = _immutable  # type: ignore[assignment]
+    clear = pop = popitem = setdefault = update = __ior__ = _immutable  # type: ignore[assignment]
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts to snapshots and lists to tuples."""
+    if isinstance(value, ConfigSnapshot):
+        return value
+    if isinstance(value, Mapping):
+        return ConfigSnapshot(value)
+    if isinstance(value, list | tuple):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Recursively convert snapshots to dicts and tuples to lists."""
+    if isinstance(value, Mapping):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+
+def config_path() -> Path:
+    """Path of the config file ``load_config()`` reads (``ZELOS_CONFIG_PATH`` or config.json).
+
+    :return: Config file path
+    """
+    return Path(os.environ.get("ZELOS_CONFIG_PATH") or "config.json")
+
+
+class ConfigWatcher:
+    """Reloads the configuration when the config file changes.
+
+    A background thread polls the file's modification time and size. On a
+    change it calls ``load`` (which reads, applies schema defaults and
+    validates, like ``zelos_sdk.extensions.load_config``) and passes the
+    result to ``on_change``. A file that fails to load or validate is
+    reported and ignored, so a half-saved or broken edit never replaces a
+    working configuration; the next save is picked up as usual.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        load: Callable[[], Mapping[str, Any]],
+        on_change: Callable[[Mapping[str, Any]], Any],
+        poll_interval: float = 1.0,
+    ) -> None:
+        """Initialize the watcher.
+
+        :param path: Config file to watch
+        :param load: Loads and validates the configuration
+        :param on_change: Called with each new valid configuration
+        :param poll_interval: Seconds between file checks
+        """
+        self.path = path
+        self.load = load
+        self.on_change = on_change
+        self.poll_interval = poll_interval
+        self.reloads = 0
+        self.errors = 0
+        self._signature = self._stat()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Start watching on a background thread."""
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._watch, name="config-watch", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop watching."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def check(self) -> bool:
+        """Reload the configuration if the file changed since the last check.
+
+        :return: True if a new configuration was applied
+        """
+        signature = self._stat()
+        if signature == self._signature:
+            return False
+        self._signature = signature
+        try:
+            config = self.load()
+        except Exception as e:
+            self.errors += 1
+            logger.error(f"Config reload failed, keeping the current config: {e}")
+            return False
+        try:
+            self.on_change(config)
+        except Exception as e:
+            self.errors += 1
+            logger.error(f"Applying the reloaded config failed, keeping the current config: {e}")
+            return False
+        self.reloads += 1
+        return True
+
+    def _stat(self) -> tuple[int, int] | None:
+        """Modification time and size of the file (None if it doesn't exist)."""
+        try:
+            stat = self.path.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _watch(self) -> None:
+        """Watcher thread: check the file until stopped."""
+        while not self._stop.wait(self.poll_interval):
+            self.check()
@@ -0,0 +1,75 @@
+"""Change-only (deadband) logging filter."""
+
+from collections.abc import Sequence
+from typing import Any
+
+
+class DeadbandFilter:
+    """Decides whether an event sample moved enough to be worth logging.
+
+    A sample passes when any field differs from the last *logged* value by more
+    than its threshold, or when ``max_silence`` seconds have passed since the
+    last logged sample (a heartbeat, so consumers can tell "unchanged" from
+    "stopped"). All fields of the event are logged together, so rows stay
+    complete. A threshold of 0 logs on any change.
+    """
+
+    __slots__ = ("thresholds", "max_silence", "_last", "_last_time", "logged", "suppressed")
+
+    def __init__(self, thresholds: Sequence[float], max_silence: float) -> None:
+        """Initialize the filter.
+
+        :param thresholds: Per-field thresholds, in the order values are passed
+        :param max_silence: Maximum seconds between logged samples
+        """
+        self.thresholds = tuple(thresholds)
+        self.max_silence = max_silence
+        self._last: list[float] | None = None
+        self._last_time = 0.0
+        self.logged = 0
+        self.suppressed = 0
+
+    def should_log(self, now: float, *values: float) -> bool:
+        """Check a sample against the deadband and record it if it passes.
+
+        :param now: Sample time in seconds
+        :param values: Field values, in threshold order
+        :return: True if the sample should be logged
+        """
+        last = self._last
+        if last is None or now - self._last_time >= self.max_silence:
+            return self._accept(now, values)
+        for value, previous, threshold in zip(values, last, self.thresholds, strict=True):
+            if abs(value - previous) > threshold:
+                return self._accept(now, values)
+        self.suppressed += 1
+        return False
+
+    def mask(self, times: Sequence[float], *columns: Sequence[float]) -> list[bool]:
+        """Apply the filter to a batch of samples, in order.
+
+        :param times: Sample times in seconds
+        :param columns: Field value columns, in threshold order
+        :return: One flag per sample, True where the sample should be logged
+        """
+        should_log = self.should_log
+        return [should_log(now, *row) for now, *row in zip(times, *columns, strict=True)]
+
+    def _accept(self, now: float, values: tuple[float, ...]) -> bool:
+        """Remember a logged sample."""
+        self._last = list(values)
+        self._last_time = now
+        self.logged += 1
+        return True
+
+    def stats(self) -> dict[str, Any]:
+        """Get logged/suppressed counters.
+
+        :return: Dictionary with logged, suppressed and suppression_ratio
+        """
+        total = self.logged + self.suppressed
+        return {
+            "logged": self.logged,
+            "suppressed": self.suppressed,
+            "suppression_ratio": self.suppressed / total if total else 0.0,
+        }
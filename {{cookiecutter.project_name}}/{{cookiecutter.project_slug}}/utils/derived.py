@@ -0,0 +1,578 @@
+"""Derived channels: expressions over logged fields, compiled once into an evaluation plan."""
+
+import ast
+import math
+from collections import deque
+from collections.abc import Callable, Mapping, Sequence
+from typing import Any
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+NAN = float("nan")
+
+
+def _div(a: float, b: float) -> float:
+    """Divide like Arrow does for floats: x/0 is ±inf, 0/0 is nan."""
+    try:
+        return a / b
+    except ZeroDivisionError:
+        return math.copysign(math.inf, a) if a else NAN
+
+
+def _pow(a: float, b: float) -> float:
+    """Raise to a power like Arrow does for floats: nan instead of complex, inf on overflow."""
+    if a < 0 and not float(b).is_integer():
+        return NAN
+    try:
+        return a**b
+    except (OverflowError, ZeroDivisionError):
+        return math.inf
+
+
+def _sqrt(x: float) -> float:
+    """Square root, nan for negative values."""
+    return math.sqrt(x) if x >= 0 else NAN
+
+
+def _min(a: float, b: float) -> float:
+    """Smaller of two values, nan if either is nan."""
+    return NAN if a != a or b != b else min(a, b)
+
+
+def _max(a: float, b: float) -> float:
+    """Larger of two values, nan if either is nan."""
+    return NAN if a != a or b != b else max(a, b)
+
+
+def _nan_propagating(kernel: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap an element-wise Arrow kernel that skips nan so that nan propagates instead."""
+
+    def wrapped(a: Any, b: Any) -> Any:
+        return pc.if_else(pc.or_(pc.is_nan(a), pc.is_nan(b)), NAN, kernel(a, b))
+
+    return wrapped
+
+
+# Binary operators: scalar code template and vectorized kernel
+BINARY_OPERATORS: dict[type[ast.operator], tuple[str, Callable[..., Any]]] = {
+    ast.Add: ("{} + {}", pc.add),
+    ast.Sub: ("{} - {}", pc.subtract),
+    ast.Mult: ("{} * {}", pc.multiply),
+    ast.Div: ("_div({}, {})", pc.divide),
+    ast.Pow: ("_pow({}, {})", pc.power),
+}
+
+# Stateless functions: number of arguments, scalar function name and vectorized kernel
+FUNCTIONS: dict[str, tuple[int, str, Callable[..., Any]]] = {
+    "abs": (1, "abs", pc.abs),
+    "sqrt": (1, "_sqrt", pc.sqrt),
+    "min": (2, "_min", _nan_propagating(pc.min_element_wise)),
+    "max": (2, "_max", _nan_propagating(pc.max_element_wise)),
+}
+
+
+class Ewma:
+    """Exponentially weighted moving average: ``y += alpha * (x - y)``."""
+
+    def __init__(self, alpha: float) -> None:
+        """Initialize the average.
+
+        :param alpha: Weight of the newest sample, in (0, 1]
+        :raises ValueError: If alpha is out of range
+        """
+        if not 0 < alpha <= 1:
+            raise ValueError(f"ewma alpha must be in (0, 1], got {alpha}")
+        self.alpha = alpha
+        self.value: float | None = None
+
+    def reset(self) -> None:
+        """Forget the average."""
+        self.value = None
+
+    def update(self, time_ns: int, x: float) -> float:
+        """Add one sample.
+
+        :param time_ns: Sample timestamp (unused)
+        :param x: Sample value
+        :return: Average after this sample (restarting from a nan)
+        """
+        value = self.value
+        if value is None or value != value:
+            value = x
+        else:
+            value += self.alpha * (x - value)
+        self.value = value
+        return value
+
+    def update_batch(self, time_ns: pa.Int64Array, x: pa.DoubleArray) -> pa.DoubleArray:
+        """Add a batch of samples; the recurrence is sequential, so this loops in order.
+
+        :param time_ns: Sample timestamps (unused)
+        :param x: Sample values
+        :return: Average after each sample
+        """
+        update = self.update
+        return pa.array([update(0, value) for value in x.to_pylist()], pa.float64())
+
+
+class RollingMean:
+    """Mean of the last ``window`` samples, from a running sum.
+
+    Non-finite samples are counted instead of summed, so a nan or inf
+    affects exactly the windows that contain it: the mean is nan while the
+    window holds a nan (or both infinities), else ±inf while it holds an inf.
+    """
+
+    def __init__(self, window: int) -> None:
+        """Initialize the window.
+
+        :param window: Number of samples averaged
+        :raises ValueError: If the window is smaller than 1
+        """
+        if window < 1 or window != int(window):
+            raise ValueError(f"rolling_mean window must be a positive integer, got {window}")
+        self.window = int(window)
+        self._values: deque[float] = deque(maxlen=self.window)
+        self.reset()
+
+    def reset(self) -> None:
+        """Empty the window."""
+        self._values.clear()
+        self._sum = 0.0
+        self._updates = 0
+        # Non-finite samples in the window: nan, +inf, -inf
+        self._counts = [0, 0, 0]
+
+    def update(self, time_ns: int, x: float) -> float:
+        """Add one sample.
+
+        The running sum of finite samples is recomputed exactly once per
+        ``window`` samples, so rounding errors don't accumulate.
+
+        :param time_ns: Sample timestamp (unused)
+        :param x: Sample value
+        :return: Mean of the window (of fewer samples until it fills)
+        """
+        values = self._values
+        if len(values) == self.window:
+            self._remove(values[0])
+        values.append(x)
+        self._add(x)
+        self._updates += 1
+        if self._updates >= self.window:
+            self._sum = math.fsum(value for value in values if math.isfinite(value))
+            self._updates = 0
+        return _window_mean(self._sum / len(values), *self._counts)
+
+    def update_batch(self, time_ns: pa.Int64Array, x: pa.DoubleArray) -> pa.DoubleArray:
+        """Add a batch of samples, vectorized as differences of cumulative sums.
+
+        Finite values and the count of each kind of non-finite value are
+        summed separately, so a nan never poisons windows that don't hold it.
+
+        :param time_ns: Sample timestamps (unused)
+        :param x: Sample values
+        :return: Mean of the window ending at each sample
+        """
+        n = len(x)
+        window = self.window
+        history = len(self._values)
+        data = pa.concat_arrays([pa.array(list(self._values), pa.float64()), x])
+        finite = pc.if_else(pc.is_finite(data), data, 0.0)
+        nans = self._window_sums(pc.is_nan(data).cast(pa.float64()), history, n)
+        positive = self._window_sums(pc.equal(data, math.inf).cast(pa.float64()), history, n)
+        negative = self._window_sums(pc.equal(data, -math.inf).cast(pa.float64()), history, n)
+
+        # Windows are shorter than ``window`` until it fills
+        short = min(max(0, window - 1 - history), n)
+        sizes = pa.concat_arrays(
+            [
+                pa.array(range(history + 1, history + 1 + short), pa.float64()),
+                pa.array([float(window)] * (n - short), pa.float64()),
+            ]
+        )
+        means = pc.divide(self._window_sums(finite, history, n), sizes)
+        means = pc.if_else(pc.greater(negative, 0), -math.inf, means)
+        means = pc.if_else(pc.greater(positive, 0), math.inf, means)
+        undefined = pc.or_(
+            pc.greater(nans, 0), pc.and_(pc.greater(positive, 0), pc.greater(negative, 0))
+        )
+        means = pc.if_else(undefined, NAN, means)
+
+        self._values.extend(x.slice(max(0, n - window)).to_pylist())
+        values = list(self._values)
+        self._sum = math.fsum(value for value in values if math.isfinite(value))
+        self._counts = [
+            sum(value != value for value in values),
+            values.count(math.inf),
+            values.count(-math.inf),
+        ]
+        self._updates = 0
+        return means
+
+    def _window_sums(self, column: pa.DoubleArray, history: int, n: int) -> pa.DoubleArray:
+        """Sum a column over the window ending at each of the last ``n`` rows.
+
+        :param column: Window history followed by the batch
+        :param history: Number of history rows before the batch
+        :param n: Number of batch rows
+        :return: Window sum at each batch row
+        """
+        sums = pa.concat_arrays([pa.array([0.0]), pc.cumulative_sum(column)])
+        # Window sum at batch row j: sums[history + j + 1] - sums[history + j + 1 - window]
+        start = history + 1 - self.window
+        short = min(max(0, -start), n)
+        lower = pa.concat_arrays(
+            [pa.array([0.0] * short, pa.float64()), sums.slice(max(0, start + short), n - short)]
+        )
+        return pc.subtract(sums.slice(history + 1, n), lower)
+
+    def _add(self, x: float) -> None:
+        """Count a sample entering the window."""
+        if math.isfinite(x):
+            self._sum += x
+        else:
+            self._counts[_non_finite_kind(x)] += 1
+
+    def _remove(self, x: float) -> None:
+        """Count a sample leaving the window."""
+        if math.isfinite(x):
+            self._sum -= x
+        else:
+            self._counts[_non_finite_kind(x)] -= 1
+
+
+def _non_finite_kind(x: float) -> int:
+    """Index of a non-finite value in the rolling counts: 0 nan, 1 +inf, 2 -inf."""
+    if x != x:
+        return 0
+    return 1 if x > 0 else 2
+
+
+def _window_mean(mean: float, nans: int, positive: int, negative: int) -> float:
+    """Mean of a window from the mean of its finite samples and its non-finite counts."""
+    if nans or (positive and negative):
+        return NAN
+    if positive:
+        return math.inf
+    if negative:
+        return -math.inf
+    return mean
+
+
+class Derivative:
+    """Rate of change per second between consecutive samples."""
+
+    def __init__(self) -> None:
+        """Initialize with no previous sample."""
+        self.last: float | None = None
+        self.last_ns = 0
+
+    def reset(self) -> None:
+        """Forget the previous sample."""
+        self.last = None
+
+    def update(self, time_ns: int, x: float) -> float:
+        """Add one sample.
+
+        :param time_ns: Sample timestamp
+        :param x: Sample value
+        :return: Change per second since the previous sample (nan for the first)
+        """
+        last = self.last
+        result = NAN if last is None else _div(x - last, (time_ns - self.last_ns) / 1e9)
+        self.last = x
+        self.last_ns = time_ns
+        return result
+
+    def update_batch(self, time_ns: pa.Int64Array, x: pa.DoubleArray) -> pa.DoubleArray:
+        """Add a batch of samples, vectorized against the batch shifted by one.
+
+        :param time_ns: Sample timestamps
+        :param x: Sample values
+        :return: Change per second since the previous sample (nan for the first ever)
+        """
+        n = len(x)
+        previous = pa.concat_arrays([pa.array([self.last], pa.float64()), x.slice(0, n - 1)])
+        previous_ns = pa.concat_arrays(
+            [pa.array([self.last_ns], pa.int64()), time_ns.slice(0, n - 1)]
+        )
+        seconds = pc.divide(pc.subtract(time_ns, previous_ns).cast(pa.float64()), 1e9)
+        result = pc.fill_null(pc.divide(pc.subtract(x, previous), seconds), NAN)
+        self.last = x[-1].as_py()
+        self.last_ns = time_ns[-1].as_py()
+        return result
+
+
+# Stateful operators: constructor and the number of constant arguments after the input
+STATEFUL: dict[str, tuple[Callable[..., Any], int]] = {
+    "ewma": (Ewma, 1),
+    "rolling_mean": (RollingMean, 1),
+    "derivative": (Derivative, 0),
+}
+
+
+class DerivedChannels:
+    """Channels computed from logged fields by expressions declared in config.
+
+    Each expression may use fields as ``event.field``, other channels by
+    name, numbers, ``+ - * / **``, the functions ``abs``, ``sqrt``, ``min``
+    and ``max``, and the stateful operators ``ewma(x, alpha)``,
+    ``rolling_mean(x, window)`` and ``derivative(x)`` (change per second).
+
+    All channels are compiled once into one plan: a flat list of steps in
+    dependency order, in which every field is read once and channels used by
+    others are computed once. The plan runs two ways: :meth:`evaluate`, a
+    function generated from it for single samples (plain float arithmetic,
+    no per-sample interpretation), and :meth:`evaluate_batch`, which runs
+    each step as one Arrow kernel over a batch. Stateful operators keep O(1)
+    state per sample and carry it across calls, so both paths give the same
+    results whatever the batch sizes.
+    """
+
+    def __init__(
+        self,
+        channels: Sequence[Mapping[str, Any]],
+        fields: Mapping[str, str],
+        inputs: Sequence[str],
+    ) -> None:
+        """Compile the channels.
+
+        :param channels: Channels, each with a ``name``, ``expr`` and optional ``unit``
+        :param fields: Input behind each field that expressions may use, keyed
+            by ``event.field``
+        :param inputs: Input names, in the order :meth:`evaluate` takes them
+        :raises ValueError: If a channel is invalid, or the channels depend on each other
+            in a cycle
+        """
+        self.inputs = tuple(inputs)
+        self._fields = fields
+        self._steps: list[tuple[Any, ...]] = []
+        self._varying: list[bool] = []
+        self._slots: dict[Any, int] = {}
+        self.operators: list[Any] = []
+
+        parsed: dict[str, ast.expr] = {}
+        self.fields: list[tuple[str, str | None]] = []
+        for channel in channels:
+            name = channel.get("name", "")
+            if not name.isidentifier() or name == "time_ns" or name in parsed:
+                raise ValueError(f"Invalid or duplicate derived channel name: {name!r}")
+            try:
+                parsed[name] = ast.parse(channel.get("expr", ""), mode="eval").body
+            except SyntaxError as e:
+                raise ValueError(f"Invalid expression for derived channel {name}: {e.msg}") from e
+            self.fields.append((name, channel.get("unit")))
+        if not parsed:
+            raise ValueError("No derived channels configured")
+
+        self._outputs: dict[str, int] = {}
+        for name in _dependency_order(parsed):
+            slot = self._compile(parsed[name], name)
+            if not self._varying[slot]:
+                raise ValueError(f"Derived channel {name} doesn't depend on any field")
+            self._outputs[name] = slot
+        self.evaluate = self._generate()
+
+    def reset(self) -> None:
+        """Reset the state of every stateful operator."""
+        for operator in self.operators:
+            operator.reset()
+
+    def evaluate_batch(
+        self, time_ns: pa.TimestampArray, columns: Sequence[pa.Array]
+    ) -> dict[str, pa.DoubleArray]:
+        """Evaluate every channel over a batch of samples.
+
+        :param time_ns: Sample timestamps
+        :param columns: One column per input, in :attr:`inputs` order
+        :return: Column of each channel, in config order
+        """
+        times = time_ns.cast(pa.int64())
+        values: list[Any] = []
+        for step in self._steps:
+            kind = step[0]
+            if kind == "input":
+                value = columns[step[1]].cast(pa.float64())
+            elif kind == "const":
+                value = pa.scalar(step[1], pa.float64())
+            elif kind == "stateful":
+                value = self.operators[step[1]].update_batch(times, values[step[2]])
+            else:
+                value = step[2](*(values[arg] for arg in step[3]))
+            values.append(value)
+        return {name: values[self._outputs[name]] for name, _ in self.fields}
+
+    def _compile(self, node: ast.expr, channel: str) -> int:
+        """Add the steps computing an expression to the plan.
+
+        :param node: Expression node
+        :param channel: Channel being compiled (for error messages)
+        :return: Slot holding the expression's value
+        :raises ValueError: If the expression uses unsupported syntax or unknown names
+        """
+        if isinstance(node, ast.Constant):
+            if isinstance(node.value, bool) or not isinstance(node.value, int | float):
+                raise ValueError(f"Unsupported constant {node.value!r} in {channel}")
+            return self._step(("const", float(node.value)), False)
+        if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name):
+            field = f"{node.value.id}.{node.attr}"
+            if field not in self._fields:
+                raise ValueError(
+                    f"Unknown field {field} in {channel}, expected one of {sorted(self._fields)}"
+                )
+            return self._step(("input", self.inputs.index(self._fields[field])), True)
+        if isinstance(node, ast.Name) and node.id in self._outputs:
+            # Channels are compiled in dependency order, so the ones used exist already
+            return self._outputs[node.id]
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub | ast.UAdd):
+            operand = self._compile(node.operand, channel)
+            if isinstance(node.op, ast.UAdd):
+                return operand
+            return self._step(("call", "-{}", pc.negate, (operand,)), self._varying[operand])
+        if isinstance(node, ast.BinOp) and type(node.op) in BINARY_OPERATORS:
+            template, kernel = BINARY_OPERATORS[type(node.op)]
+            args = (self._compile(node.left, channel), self._compile(node.right, channel))
+            return self._step(
+                ("call", f"({template})", kernel, args), any(self._varying[a] for a in args)
+            )
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and not node.keywords:
+            return self._compile_call(node.func.id, node.args, channel)
+        raise ValueError(f"Unsupported expression {ast.unparse(node)!r} in {channel}")
+
+    def _compile_call(self, function: str, args: list[ast.expr], channel: str) -> int:
+        """Add the steps of a function or stateful operator call to the plan.
+
+        :param function: Function name
+        :param args: Argument nodes
+        :param channel: Channel being compiled (for error messages)
+        :return: Slot holding the call's value
+        :raises ValueError: If the function is unknown or its arguments are invalid
+        """
+        if function in FUNCTIONS:
+            count, name, kernel = FUNCTIONS[function]
+            if len(args) != count:
+                raise ValueError(f"{function}() takes {count} argument(s) in {channel}")
+            slots = tuple(self._compile(arg, channel) for arg in args)
+            template = f"{name}({', '.join(['{}'] * count)})"
+            return self._step(
+                ("call", template, kernel, slots), any(self._varying[s] for s in slots)
+            )
+        if function in STATEFUL:
+            factory, constants = STATEFUL[function]
+            if len(args) != 1 + constants or not all(
+                isinstance(arg, ast.Constant) and isinstance(arg.value, int | float)
+                for arg in args[1:]
+            ):
+                raise ValueError(
+                    f"{function}() takes an expression and {constants} number(s) in {channel}"
+                )
+            operand = self._compile(args[0], channel)
+            if not self._varying[operand]:
+                raise ValueError(f"{function}() of a constant in {channel}")
+            self.operators.append(factory(*(arg.value for arg in args[1:])))
+            # Every call is its own operator with its own state, so it is never shared
+            self._steps.append(("stateful", len(self.operators) - 1, operand))
+            self._varying.append(True)
+            return len(self._steps) - 1
+        raise ValueError(
+            f"Unknown function {function}() in {channel}, "
+            f"expected one of {sorted([*FUNCTIONS, *STATEFUL])}"
+        )
+
+    def _step(self, step: tuple[Any, ...], varying: bool) -> int:
+        """Add a stateless step, reusing an identical earlier one.
+
+        :param step: Step to add
+        :param varying: Whether the step's value depends on a field
+        :return: Slot holding the step's value
+        """
+        key = step[:2] + step[3:] if step[0] == "call" else step
+        if key not in self._slots:
+            self._steps.append(step)
+            self._varying.append(varying)
+            self._slots[key] = len(self._steps) - 1
+        return self._slots[key]
+
+    def _generate(self) -> Callable[..., dict[str, float]]:
+        """Generate the function that evaluates one sample.
+
+        For ``power_w = power.voltage * power.current`` it is::
+
+            def evaluate(time_ns, x0, x1, x2, x3, x4):
+                v0 = x2
+                v1 = x3
+                v2 = (v0 * v1)
+                return {'power_w': v2}
+
+        Names are embedded with ``repr`` and constants are passed in the
+        namespace, so config values can't inject code.
+
+        :return: ``evaluate(time_ns, *inputs)``, returning the value of each channel
+        """
+        namespace: dict[str, Any] = {
+            "_div": _div,
+            "_pow": _pow,
+            "_sqrt": _sqrt,
+            "_min": _min,
+            "_max": _max,
+        }
+        params = ", ".join(f"x{i}" for i in range(len(self.inputs)))
+        lines = [f"def evaluate(time_ns, {params}):"]
+        for slot, step in enumerate(self._steps):
+            kind = step[0]
+            if kind == "input":
+                value = f"x{step[1]}"
+            elif kind == "const":
+                namespace[f"k{slot}"] = step[1]
+                value = f"k{slot}"
+            elif kind == "stateful":
+                namespace[f"u{slot}"] = self.operators[step[1]].update
+                value = f"u{slot}(time_ns, v{step[2]})"
+            else:
+                value = step[1].format(*(f"v{arg}" for arg in step[3]))
+            lines.append(f"    v{slot} = {value}")
+        items = ", ".join(f"{name!r}: v{self._outputs[name]}" for name, _ in self.fields)
+        lines.append("    return {" + items + "}")
+        exec(compile("\n".join(lines), "<derived>", "exec"), namespace)
+        return namespace["evaluate"]
+
+
+def _dependency_order(parsed: Mapping[str, ast.expr]) -> list[str]:
+    """Order channels so each comes after the channels it uses.
+
+    :param parsed: Expression of each channel, in config order
+    :return: Channel names in evaluation order (config order where free)
+    :raises ValueError: If a channel uses an unknown name, or channels depend on each other
+        in a cycle
+    """
+    uses: dict[str, set[str]] = {}
+    for name, expr in parsed.items():
+        # Names that aren't a function called or the event of a field are channels
+        other = set()
+        for node in ast.walk(expr):
+            if isinstance(node, ast.Call):
+                other.add(id(node.func))
+            elif isinstance(node, ast.Attribute):
+                other.add(id(node.value))
+        used = {
+            node.id
+            for node in ast.walk(expr)
+            if isinstance(node, ast.Name) and id(node) not in other
+        }
+        unknown = sorted(used - set(parsed))
+        if unknown:
+            raise ValueError(f"Unknown names {unknown} in derived channel {name}")
+        uses[name] = used
+
+    order: list[str] = []
+    done: set[str] = set()
+    while len(order) < len(parsed):
+        ready = [name for name in parsed if name not in done and uses[name] <= done]
+        if not ready:
+            cycle = sorted(set(parsed) - done)
+            raise ValueError(f"Derived channels depend on each other in a cycle: {cycle}")
+        order.extend(ready)
+        done.update(ready)
+    return order
@@ -0,0 +1,268 @@
+"""Non-blocking, batched and rate-limited path from ``logging`` to the trace log event."""
+
+import logging
+import queue
+import threading
+import time
+from collections.abc import Mapping
+from logging.handlers import QueueHandler
+from typing import Any
+
+# Python level names to the wire level names of the zelos.log.v1 event
+LEVEL_NAMES = {
+    "CRITICAL": "critical",
+    "ERROR": "error",
+    "WARNING": "warn",
+    "INFO": "info",
+    "DEBUG": "debug",
+}
+
+
+class RateLimitFilter(logging.Filter):
+    """Per-logger token bucket rate limit.
+
+    Every logger gets a bucket of ``burst`` records refilled at ``rate``
+    records per second; records arriving at an empty bucket are dropped and
+    counted. ``overrides`` sets a different rate for a logger and its
+    children (the longest matching name wins). A rate of 0 means unlimited.
+    """
+
+    def __init__(
+        self, rate: float, burst: int, overrides: Mapping[str, float] | None = None
+    ) -> None:
+        """Initialize the filter.
+
+        :param rate: Default records per second per logger
+        :param burst: Records a logger may emit at once before being limited
+        :param overrides: Records per second keyed by logger name
+        """
+        super().__init__()
+        self.rate = rate
+        self.burst = burst
+        self.overrides = dict(overrides or {})
+        self.dropped: dict[str, int] = {}
+        # Logger name -> [rate, tokens, last refill time]
+        self._buckets: dict[str, list[float]] = {}
+        self._lock = threading.Lock()
+
+    def _rate_for(self, name: str) -> float:
+        """Rate of a logger: the override for its longest matching name, or the default."""
+        best = ""
+        for prefix in self.overrides:
+            if (name == prefix or name.startswith(prefix + ".")) and len(prefix) > len(best):
+                best = prefix
+        return self.overrides[best] if best else self.rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Take a token for the record's logger.
+
+        :param record: Log record
+        :return: True if the record is within its logger's rate limit
+        """
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(record.name)
+            if bucket is None:
+                bucket = self._buckets[record.name] = [self._rate_for(record.name), self.burst, now]
+            rate, tokens, last = bucket
+            if rate <= 0:
+                return True
+            tokens = min(self.burst, tokens + (now - last) * rate)
+            if tokens < 1:
+                bucket[1], bucket[2] = tokens, now
+                self.dropped[record.name] = self.dropped.get(record.name, 0) + 1
+                return False
+            bucket[1], bucket[2] = tokens - 1, now
+            return True
+
+
+class DroppingQueueHandler(QueueHandler):
+    """QueueHandler that drops (and counts) records when the queue is full instead of failing."""
+
+    def __init__(self, log_queue: queue.Queue) -> None:
+        """Initialize the handler.
+
+        :param log_queue: Bounded queue shared with the listener
+        """
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Queue a record without blocking.
+
+        :param record: Prepared log record
+        """
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class LogPipeline:
+    """Moves trace logging off the calling thread.
+
+    Callers only format the record and put it on a bounded queue (through a
+    :class:`DroppingQueueHandler` with a :class:`RateLimitFilter`), so logging
+    never blocks the sampling loop. A listener thread drains the queue and
+    sends up to ``batch_size`` records per ``log_many`` call to the trace
+    handler's source. When records were dropped, the listener reports how
+    many once per ``report_interval``.
+    """
+
+    def __init__(
+        self,
+        trace_handler: Any,
+        queue_size: int = 10_000,
+        batch_size: int = 256,
+        rate: float = 100.0,
+        burst: int = 200,
+        overrides: Mapping[str, float] | None = None,
+        report_interval: float = 10.0,
+    ) -> None:
+        """Initialize the pipeline.
+
+        :param trace_handler: ``TraceLoggingHandler`` whose source and event records go to
+        :param queue_size: Maximum records waiting for the listener
+        :param batch_size: Maximum records per bulk trace call
+        :param rate: Default records per second per logger (0 = unlimited)
+        :param burst: Records a logger may emit at once before being limited
+        :param overrides: Records per second keyed by logger name
+        :param report_interval: Seconds between dropped-record reports
+        """
+        self.trace_handler = trace_handler
+        self.batch_size = batch_size
+        self.report_interval = report_interval
+        self.queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self.rate_limit = RateLimitFilter(rate, burst, overrides)
+        self.handler = DroppingQueueHandler(self.queue)
+        self.handler.setLevel(trace_handler.level)
+        self.handler.addFilter(self.rate_limit)
+        self.emitted = 0
+        self.batches = 0
+        self.errors = 0
+        self._event = trace_handler.trace_event.name
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._reported = 0
+
+    @classmethod
+    def from_config(cls, trace_handler: Any, config: Mapping[str, Any]) -> "LogPipeline":
+        """Create a pipeline from the ``logging`` section of config.json.
+
+        :param trace_handler: ``TraceLoggingHandler`` whose source and event records go to
+        :param config: The ``logging`` config object
+        :return: A pipeline (not yet started)
+        """
+        return cls(
+            trace_handler,
+            queue_size=config.get("queue_size", 10_000),
+            batch_size=config.get("batch_size", 256),
+            rate=config.get("rate_limit", 100.0),
+            burst=config.get("burst", 200),
+            overrides=config.get("rate_limits", {}),
+        )
+
+    def start(self, logger: logging.Logger | None = None) -> None:
+        """Attach the queue handler and start the listener thread.
+
+        :param logger: Logger to attach to (default: root logger)
+        """
+        (logger or logging.getLogger()).addHandler(self.handler)
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._listen, name="log-pipeline", daemon=True)
+        self._thread.start()
+
+    def stop(self, logger: logging.Logger | None = None, timeout: float = 2.0) -> None:
+        """Detach the queue handler and flush what is queued.
+
+        :param logger: Logger the handler was attached to (default: root logger)
+        :param timeout: Seconds to wait for the listener to flush
+        """
+        (logger or logging.getLogger()).removeHandler(self.handler)
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def stats(self) -> dict[str, Any]:
+        """Get pipeline counters.
+
+        :return: Dictionary with queue depth, emitted/batch/error counts and drop counters
+        """
+        return {
+            "queued": self.queue.qsize(),
+            "emitted": self.emitted,
+            "batches": self.batches,
+            "errors": self.errors,
+            "dropped_queue_full": self.handler.dropped,
+            "dropped_rate_limited": dict(self.rate_limit.dropped),
+        }
+
+    def _dropped(self) -> int:
+        """Total records dropped so far."""
+        return self.handler.dropped + sum(self.rate_limit.dropped.values())
+
+    def _listen(self) -> None:
+        """Listener thread: drain the queue in batches until stopped and empty."""
+        get = self.queue.get
+        get_nowait = self.queue.get_nowait
+        next_report = time.monotonic() + self.report_interval
+        while not (self._stop.is_set() and self.queue.empty()):
+            try:
+                batch = [get(timeout=0.1)]
+            except queue.Empty:
+                batch = []
+            while batch and len(batch) < self.batch_size:
+                try:
+                    batch.append(get_nowait())
+                except queue.Empty:
+                    break
+            if batch:
+                self._emit(batch)
+
+            if time.monotonic() >= next_report:
+                next_report = time.monotonic() + self.report_interval
+                self._report_drops()
+
+    def _emit(self, records: list[logging.LogRecord]) -> None:
+        """Send records to the trace source in one bulk call.
+
+        :param records: Prepared log records
+        """
+        event = self._event
+        try:
+            self.trace_handler.trace_source.log_many(
+                [
+                    (
+                        int(record.created * 1e9),
+                        event,
+                        {
+                            "level": LEVEL_NAMES.get(record.levelname, record.levelname.lower()),
+                            "message": record.getMessage(),
+                            "name": record.name,
+                            "file": record.filename,
+                            "line": record.lineno,
+                        },
+                    )
+                    for record in records
+                ]
+            )
+        except Exception:
+            self.errors += 1
+            return
+        self.emitted += len(records)
+        self.batches += 1
+
+    def _report_drops(self) -> None:
+        """Send a warning to the trace log when records were dropped since the last report."""
+        dropped = self._dropped()
+        if dropped == self._reported:
+            return
+        message = (
+            f"Log pipeline dropped {dropped - self._reported} record(s) "
+            f"(total: {self.handler.dropped} queue full, "
+            f"{sum(self.rate_limit.dropped.values())} rate limited)"
+        )
+        self._reported = dropped
+        record = logging.LogRecord(__name__, logging.WARNING, __file__, 0, message, None, None)
+        self._emit([record])
@@ -0,0 +1,199 @@
+"""Long-run memory watching (tracemalloc and RSS) and garbage collector tuning."""
+
+import gc
+import logging
+import threading
+import tracemalloc
+from collections.abc import Callable, Mapping
+from typing import Any
+
+from {{cookiecutter.project_slug}}.utils.metrics import rss_bytes
+
+logger = logging.getLogger(__name__)
+
+MB = 1024 * 1024
+
+# Allocations made by tracemalloc itself and the import system aren't the extension's
+IGNORED_TRACES = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+class MemoryWatch:
+    """Samples RSS (and optionally traced memory) on a schedule and reports growth.
+
+    The first sample, one interval after :meth:`start`, is the baseline, so
+    startup allocations and caches warming up don't count as growth. When
+    growth passes ``max_growth_mb``, a warning is logged once and
+    ``exceeded`` is set.
+
+    By default only RSS is sampled, which costs nothing between samples.
+    With ``trace_allocations``, tracemalloc traces every allocation of the
+    process (all threads, not just the monitor), which slows allocation-heavy
+    code severalfold and stores a traceback per live block. Each sample then
+    diffs a snapshot against the baseline by source line, the limit applies
+    to traced growth, and the warning lists the top growing allocators.
+    Snapshots are taken on a background thread but hold the GIL while they
+    copy the traces, so keep the interval long (minutes) in production.
+    """
+
+    def __init__(
+        self,
+        interval: float = 60.0,
+        top: int = 10,
+        frames: int = 1,
+        max_growth_mb: float = 0.0,
+        on_sample: Callable[[dict[str, Any]], None] | None = None,
+        trace_allocations: bool = False,
+    ) -> None:
+        """Initialize the watch.
+
+        :param interval: Seconds between samples
+        :param top: Number of growing allocators to report
+        :param frames: Traceback frames tracemalloc stores per allocation
+        :param max_growth_mb: Growth that counts as a leak (0 to disable): traced
+            growth with ``trace_allocations``, else RSS growth
+        :param on_sample: Called with every sample after the baseline
+        :param trace_allocations: Trace allocations with tracemalloc
+        """
+        self.interval = interval
+        self.top = top
+        self.frames = frames
+        self.trace_allocations = trace_allocations
+        self.max_growth_mb = max_growth_mb
+        self.on_sample = on_sample
+        self.samples = 0
+        self.exceeded = False
+        self.last: dict[str, Any] | None = None
+        self._has_baseline = False
+        self._baseline: tracemalloc.Snapshot | None = None
+        self._baseline_traced = 0
+        self._baseline_rss = 0
+        self._owns_tracing = False
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Start sampling on a background thread (and tracing allocations, if enabled)."""
+        if self._thread is not None:
+            return
+        if self.trace_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._owns_tracing = True
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._watch, name="memory-watch", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling (and tracing, if this watch started it)."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._owns_tracing:
+            tracemalloc.stop()
+            self._owns_tracing = False
+        self._has_baseline = False
+        self._baseline = None
+
+    def sample(self) -> dict[str, Any] | None:
+        """Take a sample now.
+
+        :return: None for the baseline sample, then a dictionary with keys:
+            - samples (int): Samples taken after the baseline
+            - traced_mb, traced_growth_mb (float): Python heap traced by tracemalloc
+              (0 without ``trace_allocations``)
+            - rss_mb, rss_growth_mb (float): Resident set size
+            - top (list[dict]): Growing allocators (location, size_kb, count), empty
+              without ``trace_allocations``
+        """
+        tracing = self.trace_allocations
+        snapshot = tracemalloc.take_snapshot().filter_traces(IGNORED_TRACES) if tracing else None
+        traced = tracemalloc.get_traced_memory()[0] if tracing else 0
+        rss = rss_bytes()
+        if not self._has_baseline:
+            self._has_baseline = True
+            self._baseline = snapshot
+            self._baseline_traced = traced
+            self._baseline_rss = rss
+            return None
+
+        top = []
+        if snapshot is not None:
+            top = [
+                {
+                    "location": f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+                    "size_kb": stat.size_diff / 1024,
+                    "count": stat.count_diff,
+                }
+                for stat in snapshot.compare_to(self._baseline, "lineno")[: self.top]
+                if stat.size_diff > 0
+            ]
+        self.samples += 1
+        result = {
+            "samples": self.samples,
+            "traced_mb": traced / MB,
+            "traced_growth_mb": (traced - self._baseline_traced) / MB,
+            "rss_mb": rss / MB,
+            "rss_growth_mb": (rss - self._baseline_rss) / MB,
+            "top": top,
+        }
+        self.last = result
+
+        # Report the top allocators once, when growth first passes the limit
+        growth = result["traced_growth_mb"] if tracing else result["rss_growth_mb"]
+        if self.max_growth_mb and growth > self.max_growth_mb and not self.exceeded:
+            self.exceeded = True
+            if tracing:
+                allocators = "\n".join(
+                    f"  {entry['size_kb']:+.1f} kB in {entry['count']:+d} blocks: "
+                    f"{entry['location']}"
+                    for entry in top
+                )
+                detail = f"top allocators:\n{allocators}"
+            else:
+                detail = "enable soak.tracemalloc to find the allocators"
+            logger.warning(
+                f"Memory grew {growth:.2f} MB since the baseline "
+                f"(limit {self.max_growth_mb} MB), {detail}"
+            )
+        if self.on_sample is not None:
+            self.on_sample(result)
+        return result
+
+    def stats(self) -> dict[str, Any]:
+        """Get the latest sample.
+
+        :return: Latest sample (empty before the first one) plus ``exceeded``
+        """
+        return {**(self.last or {}), "exceeded": self.exceeded}
+
+    def _watch(self) -> None:
+        """Watch thread: sample until stopped."""
+        while not self._stop.wait(self.interval):
+            try:
+                self.sample()
+            except Exception as e:
+                logger.error(f"Memory sample failed: {e!r}")
+
+
+def tune_gc(config: Mapping[str, Any]) -> None:
+    """Apply the ``gc`` config.
+
+    Raising the generation 0 threshold makes young collections rarer (fewer,
+    slightly longer pauses). Freezing after startup moves every object that
+    exists now (modules, the trace schema, config) to a permanent generation
+    the collector never scans again, so later full collections are shorter.
+
+    :param config: The ``gc`` config object (``thresholds``, ``freeze``)
+    """
+    thresholds = config.get("thresholds")
+    if thresholds:
+        gc.set_threshold(*thresholds)
+    if config.get("freeze", False):
+        gc.collect()
+        gc.freeze()
+        logger.info(f"Froze {gc.get_freeze_count()} startup objects out of garbage collection")
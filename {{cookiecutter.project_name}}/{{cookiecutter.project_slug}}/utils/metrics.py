@@ -0,0 +1,168 @@
+"""Low-overhead instrumentation for the monitor hot loop."""
+
+import os
+import sys
+import threading
+import time
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+from typing import Any
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None  # type: ignore[assignment]
+
+# Iteration time histogram bucket upper bounds in microseconds (last bucket is +inf)
+HISTOGRAM_BOUNDS_US = (10, 20, 50, 100, 200, 500, 1_000, 2_000, 5_000, 10_000, 50_000, 100_000)
+HISTOGRAM_LABELS = [f"<={bound}" for bound in HISTOGRAM_BOUNDS_US] + [f">{HISTOGRAM_BOUNDS_US[-1]}"]
+
+
+def rss_bytes() -> int:
+    """Resident set size of this process in bytes.
+
+    Reads ``/proc/self/statm`` where available (current RSS) and falls back to
+    the peak RSS reported by ``getrusage``.
+
+    :return: RSS in bytes, or 0 if unavailable
+    """
+    statm = Path("/proc/self/statm")
+    if statm.exists():
+        pages = int(statm.read_text().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE")
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+    return 0
+
+
+class LoopMetrics:
+    """Windowed timing statistics for the monitor loop.
+
+    Records iteration time (with a fixed-bucket histogram), time spent in trace
+    ``log()`` calls and scheduler sleep overshoot. Each :meth:`snapshot` with
+    ``reset=True`` closes the current window; totals keep counting.
+
+    Recording and snapshots may run on different threads (the pipeline
+    records on the acquisition thread and publishes from another); a lock,
+    uncontended on the hot path, keeps every window consistent.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty metrics."""
+        self.iterations_total = 0
+        self._histogram = array("Q", bytes(8 * (len(HISTOGRAM_BOUNDS_US) + 1)))
+        self._lock = threading.Lock()
+        self._reset()
+
+    def reset(self) -> None:
+        """Start a new window."""
+        with self._lock:
+            self._reset()
+
+    def _reset(self) -> None:
+        """Start a new window (lock held)."""
+        self.iterations = 0
+        self.iteration_time = 0.0
+        self.iteration_max = 0.0
+        self.logs = 0
+        self.log_time = 0.0
+        self.sleeps = 0
+        self.overshoot_time = 0.0
+        self.overshoot_max = 0.0
+        for i in range(len(self._histogram)):
+            self._histogram[i] = 0
+        self._window_start = time.monotonic()
+        self._cpu_start = time.process_time()
+
+    def record_iteration(self, seconds: float) -> None:
+        """Record the duration of one loop iteration.
+
+        :param seconds: Iteration duration
+        """
+        bucket = bisect_left(HISTOGRAM_BOUNDS_US, seconds * 1e6)
+        with self._lock:
+            self.iterations += 1
+            self.iterations_total += 1
+            self.iteration_time += seconds
+            if seconds > self.iteration_max:
+                self.iteration_max = seconds
+            self._histogram[bucket] += 1
+
+    def record_log(self, seconds: float) -> None:
+        """Record time spent in trace ``log()`` calls.
+
+        :param seconds: Logging duration
+        """
+        with self._lock:
+            self.logs += 1
+            self.log_time += seconds
+
+    def record_overshoot(self, seconds: float) -> None:
+        """Record how late the loop woke up after a scheduler sleep.
+
+        :param seconds: Wake-up time minus deadline
+        """
+        with self._lock:
+            self.sleeps += 1
+            self.overshoot_time += seconds
+            if seconds > self.overshoot_max:
+                self.overshoot_max = seconds
+
+    def percentile_us(self, fraction: float) -> float:
+        """Estimate an iteration time percentile from the histogram.
+
+        :param fraction: Percentile as a fraction (0.0 to 1.0)
+        :return: Upper bound of the bucket holding the percentile (capped at the
+            observed maximum), in microseconds
+        """
+        with self._lock:
+            return self._percentile_us(fraction)
+
+    def _percentile_us(self, fraction: float) -> float:
+        """Estimate an iteration time percentile (lock held)."""
+        if self.iterations == 0:
+            return 0.0
+        target = fraction * self.iterations
+        seen = 0
+        for bucket, count in enumerate(self._histogram):
+            seen += count
+            if seen >= target and count:
+                if bucket < len(HISTOGRAM_BOUNDS_US):
+                    return min(float(HISTOGRAM_BOUNDS_US[bucket]), self.iteration_max * 1e6)
+                break
+        return self.iteration_max * 1e6
+
+    def snapshot(self, reset: bool = False) -> dict[str, Any]:
+        """Summarize the current window.
+
+        :param reset: Start a new window after taking the snapshot
+        :return: Metrics dictionary (times in microseconds)
+        """
+        rss = rss_bytes()
+        with self._lock:
+            elapsed = time.monotonic() - self._window_start
+            cpu = time.process_time() - self._cpu_start
+            snapshot = {
+                "iterations": self.iterations_total,
+                "iteration_rate": self.iterations / elapsed if elapsed > 0 else 0.0,
+                "iteration_mean_us": self.iteration_time / self.iterations * 1e6
+                if self.iterations
+                else 0.0,
+                "iteration_p50_us": self._percentile_us(0.50),
+                "iteration_p99_us": self._percentile_us(0.99),
+                "iteration_max_us": self.iteration_max * 1e6,
+                "log_mean_us": self.log_time / self.logs * 1e6 if self.logs else 0.0,
+                "log_fraction": self.log_time / elapsed if elapsed > 0 else 0.0,
+                "sleep_overshoot_mean_us": self.overshoot_time / self.sleeps * 1e6
+                if self.sleeps
+                else 0.0,
+                "sleep_overshoot_max_us": self.overshoot_max * 1e6,
+                "rss_mb": rss / (1024 * 1024),
+                "cpu_percent": cpu / elapsed * 100 if elapsed > 0 else 0.0,
+                "histogram_us": dict(zip(HISTOGRAM_LABELS, self._histogram, strict=True)),
+            }
+            if reset:
+                self._reset()
+        return snapshot
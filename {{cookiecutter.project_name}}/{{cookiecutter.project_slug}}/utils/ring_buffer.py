@@ -0,0 +1,136 @@
+"""Bounded, preallocated ring buffer of fixed-size records."""
+
+import struct
+import threading
+from typing import Any
+
+BACKPRESSURE_POLICIES = ("drop_oldest", "drop_newest", "block")
+
+
+class RingBuffer:
+    """Single-producer, single-consumer ring of fixed-size ``struct`` records.
+
+    Storage is one preallocated ``bytearray``; records are packed in place, so
+    the producer allocates nothing per record. The consumer drains records in
+    batches, copying them out under the lock and unpacking outside it.
+
+    When the ring is full, the backpressure policy decides what happens:
+
+    - ``drop_oldest``: overwrite the oldest unread record
+    - ``drop_newest``: discard the incoming record
+    - ``block``: wait until the consumer frees space (or the ring is closed)
+    """
+
+    def __init__(self, record_format: str, capacity: int, policy: str = "drop_oldest") -> None:
+        """Initialize the ring buffer.
+
+        :param record_format: ``struct`` format of one record (e.g. ``"<qffff"``)
+        :param capacity: Maximum number of unread records
+        :param policy: Backpressure policy, one of ``BACKPRESSURE_POLICIES``
+        """
+        if policy not in BACKPRESSURE_POLICIES:
+            raise ValueError(
+                f"Unknown backpressure policy {policy!r}, expected {BACKPRESSURE_POLICIES}"
+            )
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.policy = policy
+        self.capacity = capacity
+        self._struct = struct.Struct(record_format)
+        self._buffer = bytearray(self._struct.size * capacity)
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._read = 0
+        self._write = 0
+        self._closed = False
+        self.dropped = 0
+        self.high_water = 0
+
+    @property
+    def depth(self) -> int:
+        """Number of unread records."""
+        return self._write - self._read
+
+    def put(self, *values: Any) -> bool:
+        """Append one record.
+
+        :param values: Record fields matching the record format
+        :return: False if the record was dropped or the ring is closed
+        """
+        with self._lock:
+            if self._write - self._read >= self.capacity:
+                if self.policy == "drop_newest":
+                    self.dropped += 1
+                    return False
+                if self.policy == "drop_oldest":
+                    self._read += 1
+                    self.dropped += 1
+                else:
+                    while self._write - self._read >= self.capacity and not self._closed:
+                        self._not_full.wait()
+            if self._closed:
+                return False
+
+            offset = (self._write % self.capacity) * self._struct.size
+            self._struct.pack_into(self._buffer, offset, *values)
+            self._write += 1
+
+            depth = self._write - self._read
+            if depth > self.high_water:
+                self.high_water = depth
+            self._not_empty.notify()
+        return True
+
+    def drain(self, max_records: int, timeout: float | None = None) -> list[tuple[Any, ...]]:
+        """Remove and return up to ``max_records`` records, oldest first.
+
+        :param max_records: Maximum number of records to return
+        :param timeout: Seconds to wait for data when empty (None waits forever)
+        :return: List of unpacked records (empty on timeout or close)
+        """
+        with self._lock:
+            if self._write == self._read and not self._closed:
+                self._not_empty.wait(timeout)
+            count = min(self._write - self._read, max_records)
+            if count == 0:
+                return []
+
+            size = self._struct.size
+            start = self._read % self.capacity
+            first = min(count, self.capacity - start)
+            data = bytes(self._buffer[start * size : (start + first) * size])
+            if first < count:
+                data += self._buffer[: (count - first) * size]
+            self._read += count
+            self._not_full.notify()
+
+        return list(self._struct.iter_unpack(data))
+
+    def close(self) -> None:
+        """Reject further records and wake any waiting producer or consumer."""
+        with self._lock:
+            self._closed = True
+            self._not_full.notify_all()
+            self._not_empty.notify_all()
+
+    def reset(self) -> None:
+        """Discard all records, reopen the ring and clear the counters."""
+        with self._lock:
+            self._read = self._write = 0
+            self._closed = False
+            self.dropped = 0
+            self.high_water = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Get buffer occupancy and backpressure counters.
+
+        :return: Dictionary with capacity, depth, high_water, dropped and policy
+        """
+        return {
+            "capacity": self.capacity,
+            "depth": self.depth,
+            "high_water": self.high_water,
+            "dropped": self.dropped,
+            "policy": self.policy,
+        }
@@ -0,0 +1,270 @@
+"""Drift-free loop pacing against absolute deadlines."""
+
+import heapq
+import time
+from collections.abc import Callable, Mapping
+
+OVERRUN_POLICIES = ("skip", "catch_up", "burst")
+
+
+class DeadlineScheduler:
+    """Paces a loop on the monotonic clock using absolute deadlines.
+
+    Each deadline is one interval after the previous *deadline* rather than after
+    the previous wake-up, so loop cost and sleep overshoot never accumulate as
+    drift. The interval is re-read on every tick, so a new value takes effect on
+    the next period without resetting the phase.
+
+    When the loop falls behind, the overrun policy decides what happens:
+
+    - ``skip``: drop the missed ticks and resume on the original phase grid
+    - ``catch_up``: run every missed tick back-to-back until back on schedule
+    - ``burst``: run up to ``max_burst`` missed ticks back-to-back, then skip
+    """
+
+    def __init__(
+        self,
+        interval: Callable[[], float],
+        policy: str = "skip",
+        max_burst: int = 10,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """Initialize the scheduler.
+
+        :param interval: Callable returning the current interval in seconds
+        :param policy: Overrun policy, one of ``OVERRUN_POLICIES``
+        :param max_burst: Maximum back-to-back catch-up ticks for ``burst``
+        :param clock: Monotonic clock returning seconds
+        :param sleep: Sleep function taking seconds
+        """
+        if policy not in OVERRUN_POLICIES:
+            raise ValueError(f"Unknown overrun policy {policy!r}, expected {OVERRUN_POLICIES}")
+        self.policy = policy
+        self.max_burst = max_burst
+        self._interval = interval
+        self._clock = clock
+        self._sleep = sleep
+        self.deadline: float | None = None
+        self.ticks = 0
+        self.missed = 0
+        self.overshoot = 0.0
+        self._burst = 0
+
+    def reset(self) -> None:
+        """Forget the current phase; the next tick starts a new schedule."""
+        self.deadline = None
+        self._burst = 0
+
+    def advance(self) -> float:
+        """Move to the next deadline.
+
+        :return: Seconds to sleep until the next deadline (0 when running late)
+        """
+        now = self._clock()
+        interval = self._interval()
+        self.ticks += 1
+
+        if self.deadline is None:
+            self.deadline = now + interval
+            return interval
+
+        self.deadline += interval
+        if now <= self.deadline:
+            self._burst = 0
+            return self.deadline - now
+
+        # A zero-length period (e.g. replayed samples sharing a timestamp) misses nothing
+        if interval <= 0:
+            return 0.0
+
+        # Behind schedule: either run the missed tick now or skip ahead
+        if self.policy == "catch_up" or (self.policy == "burst" and self._burst < self.max_burst):
+            self._burst += 1
+            self.missed += 1
+            return 0.0
+
+        missed = int((now - self.deadline) // interval) + 1
+        self.missed += missed
+        self.deadline += missed * interval
+        self._burst = 0
+        return self.deadline - now
+
+    def wait(self) -> None:
+        """Sleep until the next deadline.
+
+        After waking, ``overshoot`` holds how late the wake-up was (seconds).
+        """
+        delay = self.advance()
+        if delay > 0:
+            self._sleep(delay)
+        self.woke(delay)
+
+    def woke(self, delay: float) -> None:
+        """Set ``overshoot`` after sleeping ``delay`` seconds from :meth:`advance` elsewhere.
+
+        :param delay: Sleep requested by :meth:`advance`
+        """
+        self.overshoot = self._clock() - self.deadline if delay > 0 else 0.0
+
+
+class RateScheduler:
+    """Paces many independently timed keys (e.g. trace events) from one thread.
+
+    Every key has its own interval and absolute deadline grid, kept in a
+    min-heap, so finding the next deadline is O(1) and rescheduling a due key
+    is O(log n): one thread serves hundreds of keys at mixed rates. Keys whose
+    deadlines fall in the same wake-up are returned together. Missed ticks
+    follow the overrun policy per key, as in :class:`DeadlineScheduler`.
+
+    :meth:`set_interval` may be called from any thread: the change is queued
+    and applied by the scheduling thread at its next wake-up, continuing from
+    the key's last deadline.
+    """
+
+    def __init__(
+        self,
+        intervals: Mapping[str, float],
+        policy: str = "skip",
+        max_burst: int = 10,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """Initialize the scheduler.
+
+        :param intervals: Interval in seconds of each key
+        :param policy: Overrun policy, one of ``OVERRUN_POLICIES``
+        :param max_burst: Maximum back-to-back catch-up ticks per key for ``burst``
+        :param clock: Monotonic clock returning seconds
+        :param sleep: Sleep function taking seconds
+        :raises ValueError: If the policy is unknown or an interval isn't positive
+        """
+        if policy not in OVERRUN_POLICIES:
+            raise ValueError(f"Unknown overrun policy {policy!r}, expected {OVERRUN_POLICIES}")
+        for key, interval in intervals.items():
+            _check_interval(key, interval)
+        self.policy = policy
+        self.max_burst = max_burst
+        self.intervals = dict(intervals)
+        self._clock = clock
+        self._sleep = sleep
+        # (deadline, generation, key); entries of an older generation were rescheduled
+        self._heap: list[tuple[float, int, str]] = []
+        self._generation = dict.fromkeys(self.intervals, 0)
+        self._last: dict[str, float] = {}
+        self._burst = dict.fromkeys(self.intervals, 0)
+        self._pending: dict[str, float] = {}
+        self.ticks = 0
+        self.missed = 0
+        self.overshoot = 0.0
+
+    def reset(self) -> None:
+        """Forget the current phases; every key is due on the next tick."""
+        self._heap.clear()
+        self._last.clear()
+        self._burst = dict.fromkeys(self.intervals, 0)
+
+    def set_interval(self, key: str, interval: float) -> None:
+        """Change the interval of a key (safe to call from any thread).
+
+        :param key: Scheduled key
+        :param interval: New interval in seconds
+        :raises KeyError: If the key isn't scheduled
+        :raises ValueError: If the interval isn't positive
+        """
+        if key not in self.intervals:
+            raise KeyError(key)
+        _check_interval(key, interval)
+        self._pending[key] = interval
+
+    def advance(self) -> float:
+        """Apply queued interval changes and find the next deadline.
+
+        :return: Seconds to sleep until the next key is due (0 when one is due or late)
+        """
+        now = self._clock()
+        heap = self._heap
+        while self._pending:
+            key, interval = self._pending.popitem()
+            self.intervals[key] = interval
+            if heap:
+                self._push(key, self._last[key] + interval)
+        if not heap:
+            for key in self.intervals:
+                self._push(key, now)
+            return 0.0
+        while heap[0][1] != self._generation[heap[0][2]]:
+            heapq.heappop(heap)
+        return max(heap[0][0] - now, 0.0)
+
+    def due(self) -> list[str]:
+        """Take every key whose deadline has passed and schedule its next tick.
+
+        :return: Due keys, earliest deadline first
+        """
+        now = self._clock()
+        heap = self._heap
+        taken = []
+        while heap and heap[0][0] <= now:
+            deadline, generation, key = heapq.heappop(heap)
+            if generation == self._generation[key]:
+                taken.append((key, deadline))
+        for key, deadline in taken:
+            self._reschedule(key, deadline, now)
+        self.ticks += 1
+        return [key for key, _ in taken]
+
+    def wait(self) -> list[str]:
+        """Sleep until the next deadline and take the keys due then.
+
+        After waking, ``overshoot`` holds how late the wake-up was (seconds).
+
+        :return: Due keys, earliest deadline first
+        """
+        delay = self.advance()
+        if delay > 0:
+            self._sleep(delay)
+        self.woke(delay)
+        return self.due()
+
+    def woke(self, delay: float) -> None:
+        """Set ``overshoot`` after sleeping ``delay`` seconds from :meth:`advance` elsewhere.
+
+        :param delay: Sleep requested by :meth:`advance`
+        """
+        self.overshoot = max(self._clock() - self._heap[0][0], 0.0) if delay > 0 else 0.0
+
+    def _push(self, key: str, deadline: float) -> None:
+        """Schedule a key, superseding its current heap entry."""
+        generation = self._generation[key] + 1
+        self._generation[key] = generation
+        self._last.setdefault(key, deadline - self.intervals[key])
+        heapq.heappush(self._heap, (deadline, generation, key))
+
+    def _reschedule(self, key: str, deadline: float, now: float) -> None:
+        """Schedule the tick after ``deadline``, applying the overrun policy when late."""
+        interval = self.intervals[key]
+        self._last[key] = deadline
+        deadline += interval
+        if now <= deadline:
+            self._burst[key] = 0
+        elif self.policy == "catch_up" or (
+            self.policy == "burst" and self._burst[key] < self.max_burst
+        ):
+            self._burst[key] += 1
+            self.missed += 1
+        else:
+            missed = int((now - deadline) // interval) + 1
+            self.missed += missed
+            deadline += missed * interval
+            self._burst[key] = 0
+        self._push(key, deadline)
+
+
+def _check_interval(key: str, interval: float) -> None:
+    """Reject intervals that would make a key due forever.
+
+    :raises ValueError: If the interval isn't positive
+    """
+    if interval <= 0:
+        raise ValueError(f"Interval of {key!r} must be positive, got {interval}")
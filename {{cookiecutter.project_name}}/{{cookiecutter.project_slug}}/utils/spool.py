@@ -0,0 +1,278 @@
+"""Store-and-forward spool of fixed-size records in memory-mapped segment files."""
+
+import logging
+import mmap
+import struct
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any
+
+from {{cookiecutter.project_slug}}.utils.memory import MB
+
+logger = logging.getLogger(__name__)
+
+# Segment header: records written, records read, global index of the first record,
+# creation time (ns), record size
+HEADER = struct.Struct("<qqqqq")
+WRITTEN = struct.Struct("<q")
+READ_OFFSET = 8
+
+SEGMENT_SUFFIX = ".spool"
+
+
+class Segment:
+    """One preallocated, memory-mapped segment file."""
+
+    __slots__ = ("base", "created_ns", "map", "path", "read", "written")
+
+    def __init__(
+        self,
+        path: Path,
+        segment_map: mmap.mmap,
+        base: int,
+        created_ns: int,
+        written: int,
+        read: int,
+    ) -> None:
+        self.path = path
+        self.map = segment_map
+        self.base = base
+        self.created_ns = created_ns
+        self.written = written
+        self.read = read
+
+
+class DiskSpool:
+    """Append-only spool of ``struct`` records in memory-mapped segment files.
+
+    Segments are files of ``segment_bytes`` preallocated on disk and mapped
+    into memory; records are packed in place, so appending allocates nothing
+    per record and never waits on the network. Each segment's header holds
+    its write and read counters, so records left by a crash or restart are
+    picked up again when the spool is reopened (records reach the disk with
+    the page cache; nothing is fsynced per record).
+
+    Reading is two-phase: :meth:`peek` returns the oldest records and an end
+    position, :meth:`commit` marks them consumed once they are safely
+    forwarded. Fully read segments are deleted. When the spool would exceed
+    ``max_bytes``, or a segment was closed more than ``max_age`` seconds ago,
+    the oldest segment is dropped and its unread records are counted in
+    ``dropped``.
+
+    One producer and one consumer may use the spool from different threads.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        record_format: str,
+        segment_bytes: int = 4 * MB,
+        max_bytes: int = 256 * MB,
+        max_age: float = 86400.0,
+    ) -> None:
+        """Open (or create) the spool.
+
+        :param directory: Directory holding the segment files
+        :param record_format: ``struct`` format of one record (e.g. ``"<qffff"``)
+        :param segment_bytes: Size of each segment file
+        :param max_bytes: Maximum total size of the segment files
+        :param max_age: Seconds after which closed segments are dropped
+        :raises ValueError: If a segment can't hold a record
+        """
+        self._struct = struct.Struct(record_format)
+        self.directory = Path(directory)
+        self.segment_bytes = segment_bytes
+        self.records_per_segment = (segment_bytes - HEADER.size) // self._struct.size
+        if self.records_per_segment < 1:
+            raise ValueError(f"segment_bytes {segment_bytes} can't hold a record")
+        self.max_segments = max(2, max_bytes // segment_bytes)
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._segments: deque[Segment] = deque()
+        self._sequence = 0
+        self._closed = False
+        self.appended = 0
+        self.committed = 0
+        self.dropped = 0
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._load()
+
+    @property
+    def depth(self) -> int:
+        """Number of unread records."""
+        with self._lock:
+            return self._depth()
+
+    def put(self, *values: Any) -> bool:
+        """Append one record.
+
+        :param values: Record fields matching the record format
+        :return: False if the spool is closed
+        """
+        with self._lock:
+            if self._closed:
+                return False
+            segments = self._segments
+            if not segments or segments[-1].written >= self.records_per_segment:
+                self._roll()
+            segment = segments[-1]
+            self._struct.pack_into(
+                segment.map, HEADER.size + segment.written * self._struct.size, *values
+            )
+            segment.written += 1
+            WRITTEN.pack_into(segment.map, 0, segment.written)
+            self.appended += 1
+        return True
+
+    def peek(self, max_records: int) -> tuple[list[tuple[Any, ...]], int]:
+        """Get up to ``max_records`` of the oldest unread records without consuming them.
+
+        :param max_records: Maximum number of records to return
+        :return: Records, oldest first, and the position to :meth:`commit` once they
+            are forwarded
+        """
+        size = self._struct.size
+        chunks = []
+        with self._lock:
+            self._expire()
+            end = self._segments[0].base + self._segments[0].read if self._segments else 0
+            remaining = max_records
+            for segment in self._segments:
+                count = min(segment.written - segment.read, remaining)
+                if count:
+                    start = HEADER.size + segment.read * size
+                    chunks.append(segment.map[start : start + count * size])
+                    end = segment.base + segment.read + count
+                    remaining -= count
+                if not remaining:
+                    break
+        records = []
+        for chunk in chunks:
+            records.extend(self._struct.iter_unpack(chunk))
+        return records, end
+
+    def commit(self, end: int) -> None:
+        """Mark every record before ``end`` (from :meth:`peek`) as consumed.
+
+        Records dropped by the size or age limits in the meantime are skipped.
+
+        :param end: Position returned by :meth:`peek`
+        """
+        with self._lock:
+            segments = self._segments
+            while segments:
+                segment = segments[0]
+                count = min(end - segment.base, segment.written) - segment.read
+                if count <= 0:
+                    break
+                segment.read += count
+                WRITTEN.pack_into(segment.map, READ_OFFSET, segment.read)
+                self.committed += count
+                if segment.read < segment.written:
+                    break
+                # Keep the segment being written; delete fully read older ones
+                if len(segments) == 1 and segment.written < self.records_per_segment:
+                    break
+                self._remove(segments.popleft())
+
+    def close(self) -> None:
+        """Flush and unmap the segments; unread records stay on disk for the next open."""
+        with self._lock:
+            self._closed = True
+            for segment in self._segments:
+                segment.map.flush()
+                segment.map.close()
+            self._segments.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Get spool occupancy and counters.
+
+        :return: Dictionary with keys:
+            - depth (int): Unread records
+            - segments (int): Segment files
+            - bytes (int): Disk space used by the segment files
+            - oldest_age_s (float): Age of the oldest segment (0 when empty)
+            - appended, replayed, dropped (int): Records spooled, forwarded and lost
+        """
+        with self._lock:
+            segments = len(self._segments)
+            oldest = self._segments[0].created_ns if self._segments else time.time_ns()
+            depth = self._depth()
+        return {
+            "depth": depth,
+            "segments": segments,
+            "bytes": segments * self.segment_bytes,
+            "oldest_age_s": (time.time_ns() - oldest) / 1e9,
+            "appended": self.appended,
+            "replayed": self.committed,
+            "dropped": self.dropped,
+        }
+
+    def _load(self) -> None:
+        """Map the segments left by a previous run, oldest first."""
+        for path in sorted(self.directory.glob(f"*{SEGMENT_SUFFIX}")):
+            self._sequence = max(self._sequence, int(path.stem) + 1)
+            if path.stat().st_size != self.segment_bytes:
+                logger.warning(f"Ignoring spool segment {path} with a different segment size")
+                continue
+            with path.open("r+b") as f:
+                segment_map = mmap.mmap(f.fileno(), self.segment_bytes)
+            written, read, base, created_ns, record_size = HEADER.unpack_from(segment_map)
+            if record_size != self._struct.size:
+                logger.warning(f"Ignoring spool segment {path} with a different record format")
+                segment_map.close()
+                continue
+            segment = Segment(path, segment_map, base, created_ns, written, read)
+            if read >= written:
+                self._remove(segment)
+            else:
+                self._segments.append(segment)
+        if self._segments:
+            logger.info(f"Spool holds {self._depth()} records from a previous run")
+
+    def _depth(self) -> int:
+        """Count the unread records (lock held)."""
+        return sum(segment.written - segment.read for segment in self._segments)
+
+    def _roll(self) -> None:
+        """Start a new segment file, then apply the size and age limits."""
+        if self._segments:
+            last = self._segments[-1]
+            last.map.flush()
+            base = last.base + last.written
+        else:
+            base = 0
+        path = self.directory / f"{self._sequence:010d}{SEGMENT_SUFFIX}"
+        self._sequence += 1
+        with path.open("w+b") as f:
+            f.truncate(self.segment_bytes)
+            segment_map = mmap.mmap(f.fileno(), self.segment_bytes)
+        created_ns = time.time_ns()
+        HEADER.pack_into(segment_map, 0, 0, 0, base, created_ns, self._struct.size)
+        self._segments.append(Segment(path, segment_map, base, created_ns, 0, 0))
+
+        while len(self._segments) > self.max_segments:
+            self._drop(self._segments.popleft(), "size limit")
+        self._expire()
+
+    def _expire(self) -> None:
+        """Drop closed segments older than ``max_age`` (a segment closes when the next opens)."""
+        cutoff = time.time_ns() - int(self.max_age * 1e9)
+        segments = self._segments
+        while len(segments) > 1 and segments[1].created_ns < cutoff:
+            self._drop(segments.popleft(), "age limit")
+
+    def _drop(self, segment: Segment, reason: str) -> None:
+        """Delete a segment that still holds unread records."""
+        lost = segment.written - segment.read
+        self.dropped += lost
+        logger.warning(f"Spool {reason} reached, dropped {lost} records")
+        self._remove(segment)
+
+    def _remove(self, segment: Segment) -> None:
+        """Unmap and delete a segment file."""
+        segment.map.close()
+        segment.path.unlink(missing_ok=True)
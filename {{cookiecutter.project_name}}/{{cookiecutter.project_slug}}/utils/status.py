@@ -0,0 +1,86 @@
+"""Last-value state and data-driven status evaluation."""
+
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+# Default status rules (the original WARNING >25 / ERROR >30 thresholds, no hysteresis)
+DEFAULT_STATUS_RULES = (
+    {"status": "WARNING", "above": 25.0, "hysteresis": 0.0},
+    {"status": "ERROR", "above": 30.0, "hysteresis": 0.0},
+)
+
+
+class LastValues:
+    """Most recent values produced by the monitor.
+
+    Kept by the monitor itself so neither the hot loop nor ``get_status`` has to
+    read values back from the trace source cache.
+    """
+
+    __slots__ = ("temperature", "pressure", "voltage", "current", "status")
+
+    def __init__(self) -> None:
+        """Initialize with no values (status OK)."""
+        self.temperature: float | None = None
+        self.pressure: float | None = None
+        self.voltage: float | None = None
+        self.current: float | None = None
+        self.status = 0
+
+    def update(self, values: tuple[float, float, float, float, int]) -> None:
+        """Store the latest values.
+
+        :param values: Latest (temperature, pressure, voltage, current, status)
+        """
+        self.temperature, self.pressure, self.voltage, self.current, self.status = values
+
+
+class StatusEvaluator:
+    """Maps a value to a status level using threshold rules with hysteresis.
+
+    A rule's level is entered when the value rises above ``above`` and held
+    until the value falls to ``above - hysteresis`` or below, so a value
+    hovering around a threshold doesn't make the status flap. The most severe
+    matching rule wins; a value matching no rule is level 0 (OK).
+    """
+
+    __slots__ = ("rules", "level")
+
+    def __init__(self, rules: Sequence[Mapping[str, Any]], levels: Mapping[int, str]) -> None:
+        """Initialize the evaluator.
+
+        :param rules: Rules with ``status`` (level name), ``above`` and optional ``hysteresis``
+        :param levels: Status level names keyed by level value
+        :raises ValueError: If a rule names an unknown status
+        """
+        names = {name: level for level, name in levels.items()}
+        parsed = []
+        for rule in rules:
+            if rule["status"] not in names:
+                raise ValueError(f"Unknown status in status rule: {rule['status']}")
+            parsed.append(
+                (names[rule["status"]], float(rule["above"]), float(rule.get("hysteresis", 0.0)))
+            )
+        # Most severe first
+        self.rules = tuple(sorted(parsed, reverse=True))
+        self.level = 0
+
+    @property
+    def stateless(self) -> bool:
+        """True if no rule has hysteresis, so each value can be evaluated independently."""
+        return all(hysteresis == 0 for _, _, hysteresis in self.rules)
+
+    def update(self, value: float) -> int:
+        """Evaluate the next value.
+
+        :param value: Value to evaluate
+        :return: Status level
+        """
+        current = self.level
+        level = 0
+        for rule_level, above, hysteresis in self.rules:
+            if value > above or (current >= rule_level and value > above - hysteresis):
+                level = rule_level
+                break
+        self.level = level
+        return level